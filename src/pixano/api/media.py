@@ -6,7 +6,13 @@
 
 """Binary media helpers for API routes."""
 
-from collections.abc import Iterable, Iterator
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import BinaryIO
+
+from fastapi.responses import Response, StreamingResponse
 
 
 FORMAT_TO_MIME: dict[str, str] = {
@@ -31,6 +37,10 @@ FORMAT_TO_MIME: dict[str, str] = {
 
 MULTIPART_BOUNDARY = b"frame_boundary"
 
+DEFAULT_BLOB_CACHE_BYTES = 256 * 1024 * 1024
+
+STREAM_CHUNK_BYTES = 1024 * 1024
+
 
 def media_type_from_format(media_format: str | None) -> str:
     """Map a media format string to a MIME type."""
@@ -54,3 +64,228 @@ def iter_multipart_frames(frames: Iterable[tuple[int, bytes, str]]) -> Iterator[
         yield b"\r\n"
 
     yield b"--" + MULTIPART_BOUNDARY + b"--\r\n"
+
+
+@dataclass(frozen=True)
+class CachedBlob:
+    """Binary payload stored in a :class:`BlobCache`.
+
+    Attributes:
+        data: The binary payload.
+        media_type: The MIME type of the payload.
+    """
+
+    data: bytes
+    media_type: str
+
+
+class BlobCache:
+    """Thread-safe LRU cache of binary payloads bounded by their total size in bytes.
+
+    Payloads larger than `max_item_bytes` are never cached so that a single large file
+    does not evict the whole cache.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_BLOB_CACHE_BYTES, max_item_bytes: int | None = None):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the cached payloads.
+            max_item_bytes: Maximum size of a single cached payload. Defaults to an eighth of `max_bytes`.
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must be a non-negative integer.")
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes if max_item_bytes is not None else max_bytes // 8
+        self._entries: OrderedDict[Hashable, CachedBlob] = OrderedDict()
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        """Total size of the cached payloads."""
+        return self._size_bytes
+
+    def __len__(self) -> int:
+        """Number of cached payloads."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> CachedBlob | None:
+        """Get a payload and mark it as most recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached payload or None if not cached.
+        """
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+            return blob
+
+    def put(self, key: Hashable, blob: CachedBlob) -> None:
+        """Cache a payload, evicting the least recently used ones to stay within `max_bytes`.
+
+        Args:
+            key: The cache key.
+            blob: The payload to cache.
+        """
+        size = len(blob.data)
+        if size > self.max_item_bytes or size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size_bytes -= len(previous.data)
+            self._entries[key] = blob
+            self._size_bytes += size
+            while self._size_bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= len(evicted.data)
+
+    def clear(self) -> None:
+        """Remove all cached payloads."""
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check whether an ``If-None-Match`` header matches an entity tag."""
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def parse_byte_range(range_header: str | None, size: int) -> tuple[int, int] | None:
+    """Parse a single ``Range: bytes=...`` header.
+
+    Args:
+        range_header: The ``Range`` header value.
+        size: The size of the full payload.
+
+    Returns:
+        The inclusive ``(start, end)`` byte range, or None if the header is absent or not a single byte range.
+
+    Raises:
+        ValueError: If the range cannot be satisfied.
+    """
+    if not range_header:
+        return None
+    unit, _, ranges = range_header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in ranges:
+        return None
+    start_str, sep, end_str = ranges.strip().partition("-")
+    if not sep:
+        return None
+    try:
+        if start_str == "":
+            suffix = int(end_str)
+            if suffix <= 0:
+                raise ValueError("Empty suffix range.")
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(start_str)
+            end = int(end_str) if end_str != "" else size - 1
+    except ValueError as err:
+        raise ValueError(f"Invalid range '{range_header}'.") from err
+    if start < 0 or start >= size or end < start:
+        raise ValueError(f"Range '{range_header}' not satisfiable for {size} bytes.")
+    return start, min(end, size - 1)
+
+
+def binary_response(
+    data: bytes,
+    media_type: str,
+    etag: str,
+    range_header: str | None = None,
+    cache_control: str | None = None,
+) -> Response:
+    """Build a response for a binary payload, honoring single byte-range requests.
+
+    Args:
+        data: The full binary payload.
+        media_type: The MIME type of the payload.
+        etag: The entity tag of the payload.
+        range_header: The ``Range`` header of the request.
+        cache_control: Optional ``Cache-Control`` header value.
+
+    Returns:
+        A 200 response with the full payload, a 206 response with the requested range, or a 416 response
+        if the range cannot be satisfied.
+    """
+    headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    try:
+        byte_range = parse_byte_range(range_header, len(data))
+    except ValueError:
+        headers["Content-Range"] = f"bytes */{len(data)}"
+        return Response(status_code=416, headers=headers)
+    if byte_range is None:
+        return Response(content=data, media_type=media_type, headers=headers)
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{len(data)}"
+    return Response(content=data[start : end + 1], status_code=206, media_type=media_type, headers=headers)
+
+
+def stream_response(
+    stream: BinaryIO,
+    size: int,
+    media_type: str,
+    etag: str,
+    range_header: str | None = None,
+    cache_control: str | None = None,
+    chunk_size: int = STREAM_CHUNK_BYTES,
+) -> Response:
+    """Build a response streaming a seekable binary handle in chunks, honoring single byte-range requests.
+
+    Only the requested range is read from the handle, which is closed once the response is sent.
+
+    Args:
+        stream: The seekable binary handle.
+        size: The size of the full payload.
+        media_type: The MIME type of the payload.
+        etag: The entity tag of the payload.
+        range_header: The ``Range`` header of the request.
+        cache_control: Optional ``Cache-Control`` header value.
+        chunk_size: Maximum size of the chunks read from the handle.
+
+    Returns:
+        A 200 response with the full payload, a 206 response with the requested range, or a 416 response
+        if the range cannot be satisfied.
+    """
+    headers = {"ETag": etag, "Accept-Ranges": "bytes"}
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        stream.close()
+        headers["Content-Range"] = f"bytes */{size}"
+        return Response(status_code=416, headers=headers)
+
+    start, end = byte_range if byte_range is not None else (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1)
+    if byte_range is not None:
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+
+    def iter_chunks() -> Iterator[bytes]:
+        try:
+            stream.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                chunk = stream.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            stream.close()
+
+    return StreamingResponse(
+        iter_chunks(), status_code=206 if byte_range is not None else 200, media_type=media_type, headers=headers
+    )
@@ -352,10 +352,15 @@ class DatasetInfoResponse(DatasetInfo):
         return {logical_name: _serialize_table_schema(schema_cls) for logical_name, schema_cls in views.items()}
 
     @classmethod
-    def from_dataset_info(cls, info: DatasetInfo, dataset_dir: Path) -> "DatasetInfoResponse":
-        """Build a response from a DatasetInfo and its directory path."""
-        dataset = Dataset(dataset_dir)
-        num_records = dataset.num_rows
+    def from_dataset_info(
+        cls, info: DatasetInfo, dataset_dir: Path, num_records: int | None = None
+    ) -> "DatasetInfoResponse":
+        """Build a response from a DatasetInfo and its directory path.
+
+        The dataset is only opened to count its records if ``num_records`` is not given.
+        """
+        if num_records is None:
+            num_records = Dataset(dataset_dir).num_rows
         return cls(num_records=num_records, **info.model_dump(exclude={"tables"}))
 
 
@@ -381,7 +386,7 @@ class DatasetResponse(BaseModel):
             thumbnail=dataset.thumbnail,
             tables=tables,
             feature_values=dataset.features_values,
-            info=DatasetInfoResponse.from_dataset_info(dataset.info, dataset.path),
+            info=DatasetInfoResponse.from_dataset_info(dataset.info, dataset.path, dataset.num_rows),
         )
 
 
@@ -5,14 +5,13 @@
 # =====================================
 
 import logging
-from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException
 
 from pixano.api.models import DatasetInfoResponse, DatasetResponse
 from pixano.api.settings import Settings, get_settings
-from pixano.datasets import Dataset, DatasetInfo
+from pixano.datasets import Dataset, LibraryCatalog
 from pixano.schemas.schema_group import SchemaGroup
 
 
@@ -33,18 +32,20 @@ def get_datasets_info(
     Returns:
         List of dataset info.
     """
-    try:
-        infos_and_paths: list[tuple[DatasetInfo, Path]] = DatasetInfo.load_directory(
-            directory=settings.library_dir,
-            return_path=True,
-        )
-    except FileNotFoundError:
+    if not settings.library_dir.exists():
         return []
 
+    catalog = LibraryCatalog(settings.library_dir)
+    entries = catalog.refresh()
+    previews = catalog.previews(entries)
+
     result = []
-    for info, path in infos_and_paths:
+    for entry in entries:
+        path = settings.library_dir / entry.path
         try:
-            result.append(DatasetInfoResponse.from_dataset_info(info, path))
+            info = entry.to_dataset_info()
+            info.preview = previews[entry.path]
+            result.append(DatasetInfoResponse.from_dataset_info(info, path, entry.num_records))
         except Exception:
             logger.warning(f"Failed to load dataset info for {path}, skipping.")
             continue
@@ -67,14 +68,18 @@ def get_dataset_info(
         The dataset info.
     """
     try:
-        info, path = DatasetInfo.load_id(id, settings.library_dir, return_path=True)
+        catalog = LibraryCatalog(settings.library_dir)
+        entry = catalog.find(id)
     except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail=f"Dataset {id} not found in {settings.library_dir.absolute()}.",
         )
 
-    return DatasetInfoResponse.from_dataset_info(info, path)
+    path = settings.library_dir / entry.path
+    info = entry.to_dataset_info()
+    info.preview = catalog.previews([entry])[entry.path]
+    return DatasetInfoResponse.from_dataset_info(info, path, entry.num_records)
 
 
 @router.get("/{id}/stats", response_model=dict[str, dict[str, int]], operation_id="get_dataset_stats")
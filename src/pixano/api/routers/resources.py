@@ -8,7 +8,8 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends
+from pydantic import create_model as create_pydantic_model
 
 from pixano.api.models import PaginatedResponse
 from pixano.api.resources import ResourceSpec
@@ -79,6 +80,47 @@ def create_resource_router(resource: ResourceSpec) -> APIRouter:
             service = BaseService(dataset, resource)
             return service.create(body.model_dump())  # type: ignore[attr-defined]
 
+    if resource.create_model is not None and resource.allow_create:
+        bulk_create_model = resource.create_model
+
+        @router.post(
+            "/bulk",
+            response_model=list[response_model],  # type: ignore[valid-type]
+            status_code=201,
+            operation_id=f"bulk_create_{resource.name}",
+            summary=f"Create {resource.tag.lower()} in bulk",
+            description=f"Create several {resource.tag.lower()} in a single write, validating references together.",
+        )
+        def bulk_create_resource(
+            body: list[bulk_create_model] = Body(...),  # type: ignore[valid-type]
+            dataset: Dataset = Depends(get_dataset_dep),
+        ) -> Any:
+            """Create resources from a list of request bodies."""
+            service = BaseService(dataset, resource)
+            return service.create_many([item.model_dump() for item in body])  # type: ignore[attr-defined]
+
+    if resource.update_model is not None and resource.allow_update:
+        bulk_update_model = create_pydantic_model(
+            f"{resource.update_model.__name__}BulkItem",
+            __base__=resource.update_model,
+            id=(str, ...),
+        )
+
+        @router.put(
+            "/bulk",
+            response_model=list[response_model],  # type: ignore[valid-type]
+            operation_id=f"bulk_replace_{resource.name}",
+            summary=f"Update {resource.tag.lower()} in bulk",
+            description=f"Replace mutable fields on several existing {resource.tag.lower()} in a single write.",
+        )
+        def bulk_update_resource(
+            body: list[bulk_update_model] = Body(...),  # type: ignore[valid-type]
+            dataset: Dataset = Depends(get_dataset_dep),
+        ) -> Any:
+            """Update resources from a list of partial bodies with ids."""
+            service = BaseService(dataset, resource)
+            return service.update_many([item.model_dump(exclude_unset=True) for item in body])  # type: ignore[attr-defined]
+
     if resource.update_model is not None and resource.allow_update:
         update_model = resource.update_model
 
@@ -8,25 +8,48 @@
 
 import hashlib
 import io
-from typing import Annotated, Any
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import StreamingResponse
-
-from pixano.api.media import MULTIPART_BOUNDARY, iter_multipart_frames, media_type_from_format
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Any, Iterator, Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
+
+from pixano.api.media import (
+    MULTIPART_BOUNDARY,
+    BlobCache,
+    CachedBlob,
+    binary_response,
+    etag_matches,
+    iter_multipart_frames,
+    media_type_from_format,
+    stream_response,
+)
 from pixano.api.models import ImageResponse, PaginatedResponse, SFrameResponse, TextResponse
 from pixano.api.routers._deps import PaginationParams, get_dataset_dep
 from pixano.datasets import Dataset
-from pixano.datasets.utils import DatasetPaginationError
+from pixano.datasets.utils import DatasetPaginationError, parse_blob_uri
 from pixano.datasets.utils.errors import DatasetAccessError
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/datasets/{dataset_id}", tags=["Views"])
 
 IMAGE_TABLE = "images"
 TEXT_TABLE = "texts"
 SFRAME_TABLE = "sequence_frames"
 
+# In-process cache of view binaries, keyed by (dataset, table, row, kind, table version)
+_blob_cache = BlobCache()
+
+# Single worker loading the next window of temporal frames into the blob cache
+_prefetch_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pixano-frame-prefetch")
+# Windows queued or being prefetched, so that a window is only prefetched once at a time
+_pending_prefetches: set[tuple] = set()
+_pending_prefetches_lock = threading.Lock()
+
 
 def _combine_where(*clauses: str | None) -> str | None:
     filtered = [clause for clause in clauses if clause]
@@ -60,6 +83,7 @@ def _list_rows(
             where=combined_where,
             limit=pagination.limit,
             skip=pagination.offset,
+            exclude_blobs=True,
         )
     except DatasetPaginationError as err:
         raise HTTPException(status_code=400, detail=f"Invalid query parameters. {err}") from err
@@ -71,7 +95,7 @@ def _list_rows(
 
 def _get_row(dataset: Dataset, table_name: str, row_id: str) -> Any:
     try:
-        row = dataset.get_data(table_name, ids=row_id)
+        row = dataset.get_data(table_name, ids=row_id, exclude_blobs=True)
     except DatasetAccessError as err:
         raise HTTPException(status_code=404, detail=str(err)) from err
     if row is None:
@@ -79,45 +103,105 @@ def _get_row(dataset: Dataset, table_name: str, row_id: str) -> Any:
     return row
 
 
-def _stream_blob(dataset: Dataset, table_name: str, row_id: str) -> StreamingResponse:
+def _cache_scope(dataset: Dataset) -> tuple:
+    """Identify the on-disk dataset behind the blob cache keys.
+
+    Table versions restart when a dataset is rebuilt under the same id, so the dataset path and the
+    inode and change time of its directory are part of the keys.
+    """
+    stat = dataset.path.stat()
+    return (dataset.id, str(dataset.path), stat.st_ino, stat.st_ctime_ns)
+
+
+def _send_view_payload(
+    request: Request,
+    dataset: Dataset,
+    table_name: str,
+    row_id: str,
+    kind: Literal["blob", "preview"],
+    cache_control: str | None = None,
+) -> Response:
+    """Serve a view binary through the blob cache with ETag revalidation and byte ranges.
+
+    The ETag is derived from the dataset directory and the Lance table version, so conditional
+    requests are answered without reading the payload and cache entries are invalidated by any
+    write to the table or any rebuild of the dataset.
+    """
     try:
-        result = dataset.get_view_binary(table_name, row_id)
+        version = dataset.open_table(table_name).version
     except DatasetAccessError as err:
         raise HTTPException(status_code=404, detail=str(err)) from err
 
-    if result is None:
-        raise HTTPException(status_code=404, detail=f"Resource '{row_id}' has no embedded blob.")
-
-    blob_data, fmt = result
-    return StreamingResponse(
-        io.BytesIO(blob_data),
-        media_type=media_type_from_format(fmt),
-        headers={"Content-Length": str(len(blob_data))},
+    cache_key = (*_cache_scope(dataset), table_name, row_id, kind, version)
+    etag = f'"{hashlib.sha1("/".join(map(str, cache_key)).encode()).hexdigest()}"'  # noqa: S324
+    cached = _blob_cache.get(cache_key)
+    if cached is None:
+        # A cache entry at this table version proves the row exists, otherwise a missing row must be a 404
+        # even for a conditional request
+        _get_row(dataset, table_name, row_id)
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        headers = {"ETag": etag}
+        if cache_control is not None:
+            headers["Cache-Control"] = cache_control
+        return Response(status_code=304, headers=headers)
+
+    if cached is None:
+        try:
+            if kind == "blob":
+                opened = dataset.open_view_binary(table_name, row_id)
+                result = None
+            else:
+                opened = None
+                result = dataset.get_view_preview(table_name, row_id)
+        except DatasetAccessError as err:
+            raise HTTPException(status_code=404, detail=str(err)) from err
+
+        if opened is not None:
+            stream, fmt = opened
+            size = stream.seek(0, io.SEEK_END)
+            if size > _blob_cache.max_item_bytes:
+                # Too large to be cached: only the requested range is read, in chunks
+                return stream_response(
+                    stream,
+                    size,
+                    media_type_from_format(fmt),
+                    etag,
+                    range_header=request.headers.get("range"),
+                    cache_control=cache_control,
+                )
+            with stream:
+                stream.seek(0)
+                result = (stream.read(), fmt) if size else None
+
+        if result is None or (kind == "preview" and not result[1]):
+            detail = "has no embedded blob" if kind == "blob" else "has no preview"
+            raise HTTPException(status_code=404, detail=f"Resource '{row_id}' {detail}.")
+
+        data, fmt = result
+        cached = CachedBlob(data=data, media_type=media_type_from_format(fmt))
+        _blob_cache.put(cache_key, cached)
+
+    return binary_response(
+        cached.data,
+        cached.media_type,
+        etag,
+        range_header=request.headers.get("range"),
+        cache_control=cache_control,
     )
 
 
-def _stream_preview(dataset: Dataset, table_name: str, row_id: str) -> StreamingResponse:
-    row = _get_row(dataset, table_name, row_id)
-    preview = getattr(row, "preview", b"") or b""
-    preview_format = getattr(row, "preview_format", "") or ""
-    if not preview or not preview_format:
-        raise HTTPException(status_code=404, detail=f"Resource '{row_id}' has no preview.")
+def _stream_blob(request: Request, dataset: Dataset, table_name: str, row_id: str) -> Response:
+    return _send_view_payload(request, dataset, table_name, row_id, "blob")
 
-    etag = hashlib.sha1(preview).hexdigest()  # noqa: S324
-    return StreamingResponse(
-        io.BytesIO(preview),
-        media_type=media_type_from_format(preview_format),
-        headers={
-            "Content-Length": str(len(preview)),
-            "Cache-Control": "public, max-age=3600",
-            "ETag": f'"{etag}"',
-        },
-    )
+
+def _stream_preview(request: Request, dataset: Dataset, table_name: str, row_id: str) -> Response:
+    return _send_view_payload(request, dataset, table_name, row_id, "preview", cache_control="public, max-age=3600")
 
 
 def _image_src(dataset_id: str, resource_name: str, row: Any) -> str:
     uri = getattr(row, "uri", "") or ""
-    if uri:
+    if uri and parse_blob_uri(uri) is None:
         return uri
     return f"/datasets/{dataset_id}/{resource_name}/{row.id}/blob"
 
@@ -265,15 +349,15 @@ def get_image(id: str, dataset_id: str, dataset: Dataset = Depends(get_dataset_d
 
 
 @router.get("/images/{id}/blob", operation_id="get_image_blob")
-def get_image_blob(id: str, dataset: Dataset = Depends(get_dataset_dep)) -> StreamingResponse:
+def get_image_blob(id: str, request: Request, dataset: Dataset = Depends(get_dataset_dep)) -> Response:
     """Stream the raw binary blob of an image."""
-    return _stream_blob(dataset, IMAGE_TABLE, id)
+    return _stream_blob(request, dataset, IMAGE_TABLE, id)
 
 
 @router.get("/images/{id}/preview", operation_id="get_image_preview")
-def get_image_preview(id: str, dataset: Dataset = Depends(get_dataset_dep)) -> StreamingResponse:
+def get_image_preview(id: str, request: Request, dataset: Dataset = Depends(get_dataset_dep)) -> Response:
     """Stream the preview thumbnail of an image."""
-    return _stream_preview(dataset, IMAGE_TABLE, id)
+    return _stream_preview(request, dataset, IMAGE_TABLE, id)
 
 
 @router.get("/texts", response_model=PaginatedResponse[TextResponse], operation_id="list_texts")
@@ -327,15 +411,15 @@ def get_sframe(id: str, dataset_id: str, dataset: Dataset = Depends(get_dataset_
 
 
 @router.get("/sframes/{id}/blob", operation_id="get_sframe_blob")
-def get_sframe_blob(id: str, dataset: Dataset = Depends(get_dataset_dep)) -> StreamingResponse:
+def get_sframe_blob(id: str, request: Request, dataset: Dataset = Depends(get_dataset_dep)) -> Response:
     """Stream the raw binary blob of a sequence frame."""
-    return _stream_blob(dataset, SFRAME_TABLE, id)
+    return _stream_blob(request, dataset, SFRAME_TABLE, id)
 
 
 @router.get("/sframes/{id}/preview", operation_id="get_sframe_preview")
-def get_sframe_preview(id: str, dataset: Dataset = Depends(get_dataset_dep)) -> StreamingResponse:
+def get_sframe_preview(id: str, request: Request, dataset: Dataset = Depends(get_dataset_dep)) -> Response:
     """Stream the preview thumbnail of a sequence frame."""
-    return _stream_preview(dataset, SFRAME_TABLE, id)
+    return _stream_preview(request, dataset, SFRAME_TABLE, id)
 
 
 @router.get(
@@ -424,10 +508,16 @@ def get_record_sframe_batch(
     view_name: str | None = None,
     start_frame: Annotated[int, Query(ge=0)] = 0,
     batch_size: Annotated[int, Query(ge=1, le=1000)] = 100,
+    prefetch: bool = True,
 ) -> StreamingResponse:
-    """Stream a batch of temporal frames as a multipart binary response."""
+    """Stream a batch of temporal frames as a multipart binary response.
+
+    Frames are sent as soon as they are read. Each listed frame gets one part, so that ``X-Total-Frames`` is known
+    before the payloads are read: frames without a payload are sent as empty parts. Once the batch is sent, the
+    following batch is loaded into the blob cache in the background unless ``prefetch`` is disabled.
+    """
     try:
-        frames = dataset.get_temporal_view_batch(
+        frames = dataset.get_temporal_view_frames(
             SFRAME_TABLE,
             record_id=record_id,
             view_name=view_name,
@@ -440,9 +530,15 @@ def get_record_sframe_batch(
     if not frames:
         raise HTTPException(status_code=404, detail="No frames found for the given parameters.")
 
-    payloads = [(frame_index, data, media_type_from_format(fmt)) for frame_index, data, fmt in frames]
+    version = dataset.open_table(SFRAME_TABLE).version
+
+    def payloads() -> Iterator[tuple[int, bytes, str]]:
+        yield from _iter_cached_frame_payloads(dataset, frames, version)
+        if prefetch:
+            _submit_prefetch(dataset, record_id, view_name, start_frame + batch_size, batch_size, version)
+
     return StreamingResponse(
-        iter_multipart_frames(payloads),
+        iter_multipart_frames(payloads()),
         media_type=f"multipart/x-mixed-replace; boundary={MULTIPART_BOUNDARY.decode()}",
         headers={
             "X-Total-Frames": str(len(frames)),
@@ -450,3 +546,71 @@ def get_record_sframe_batch(
             "X-Batch-Size": str(batch_size),
         },
     )
+
+
+def _frame_cache_key(dataset: Dataset, row_id: str, version: int) -> tuple:
+    return (*_cache_scope(dataset), SFRAME_TABLE, row_id, "blob", version)
+
+
+def _iter_cached_frame_payloads(
+    dataset: Dataset, frames: list[tuple[int, str]], version: int
+) -> Iterator[tuple[int, bytes, str]]:
+    """Yield the payloads and media types of frames in order, from the blob cache or streamed from the dataset.
+
+    Frames that are no longer in the dataset get an empty payload.
+    """
+    cached = {row_id: _blob_cache.get(_frame_cache_key(dataset, row_id, version)) for _, row_id in frames}
+    missing = [frame for frame in frames if cached[frame[1]] is None]
+    streamed = dataset.iter_temporal_view_payloads(SFRAME_TABLE, missing)
+    next_streamed = next(streamed, None)
+    for frame_index, row_id in frames:
+        blob = cached[row_id]
+        if blob is not None:
+            yield frame_index, blob.data, blob.media_type
+        elif next_streamed is not None and next_streamed[1] == row_id:
+            _, _, data, fmt = next_streamed
+            next_streamed = next(streamed, None)
+            yield frame_index, data, media_type_from_format(fmt)
+        else:
+            yield frame_index, b"", media_type_from_format("")
+
+
+def _prefetch_key(
+    dataset: Dataset, record_id: str, view_name: str | None, start_frame: int, batch_size: int, version: int
+) -> tuple:
+    return (str(dataset.path), record_id, view_name, start_frame, batch_size, version)
+
+
+def _submit_prefetch(
+    dataset: Dataset, record_id: str, view_name: str | None, start_frame: int, batch_size: int, version: int
+) -> None:
+    """Queue the prefetch of a window of temporal frames, unless the same window is already queued."""
+    key = _prefetch_key(dataset, record_id, view_name, start_frame, batch_size, version)
+    with _pending_prefetches_lock:
+        if key in _pending_prefetches:
+            return
+        _pending_prefetches.add(key)
+    _prefetch_executor.submit(
+        _prefetch_frame_payloads, dataset, record_id, view_name, start_frame, batch_size, version
+    )
+
+
+def _prefetch_frame_payloads(
+    dataset: Dataset, record_id: str, view_name: str | None, start_frame: int, batch_size: int, version: int
+) -> None:
+    """Load a window of temporal frames into the blob cache."""
+    try:
+        frames = dataset.get_temporal_view_frames(SFRAME_TABLE, record_id, view_name, start_frame, batch_size)
+        missing = [frame for frame in frames if _blob_cache.get(_frame_cache_key(dataset, frame[1], version)) is None]
+        for _, row_id, data, fmt in dataset.iter_temporal_view_payloads(SFRAME_TABLE, missing):
+            if data:
+                _blob_cache.put(
+                    _frame_cache_key(dataset, row_id, version),
+                    CachedBlob(data=data, media_type=media_type_from_format(fmt)),
+                )
+    except Exception:
+        # Prefetching is best effort: the next request reads the frames itself
+        logger.debug("Failed to prefetch frames of record %s from frame %d", record_id, start_frame, exc_info=True)
+    finally:
+        with _pending_prefetches_lock:
+            _pending_prefetches.discard(_prefetch_key(dataset, record_id, view_name, start_frame, batch_size, version))
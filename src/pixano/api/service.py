@@ -6,17 +6,21 @@
 
 """Generic CRUD service for the API."""
 
+from __future__ import annotations
+
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from fastapi import HTTPException
 from lancedb.pydantic import LanceModel
 from pydantic import BaseModel
 
-from pixano.datasets import Dataset
+from pixano.datasets import Dataset, TableQueryBuilder
 from pixano.datasets.utils import DatasetAccessError, DatasetPaginationError
 from pixano.datasets.utils.errors import DatasetIntegrityError
 from pixano.schemas import SchemaGroup, View
+from pixano.utils.python import to_sql_list
 
 from .models import PaginatedResponse, merge_update_payload, serialize_row
 from .resources import ResourceSpec
@@ -26,15 +30,36 @@ logger = logging.getLogger(__name__)
 
 
 MAX_QUERY_LIMIT = 1000
+MAX_BULK_SIZE = 1000
+FK_QUERY_CHUNK_SIZE = 1000
+
+# Payload fields holding foreign keys, mapped to the group of their candidate target tables
+FK_FIELD_GROUPS: dict[str, SchemaGroup] = {
+    "record_id": SchemaGroup.RECORD,
+    "entity_id": SchemaGroup.ENTITY,
+    "parent_id": SchemaGroup.ENTITY,
+    "entity_ids": SchemaGroup.ENTITY,
+    "tracklet_id": SchemaGroup.ANNOTATION,
+    "entity_dynamic_state_id": SchemaGroup.ENTITY_DYNAMIC_STATE,
+}
 
 
 class BaseService:
-    """Shared CRUD operations for API resources."""
+    """Shared CRUD operations for API resources.
+
+    Foreign-key lookups are memoized for the lifetime of the service (one request), and
+    :meth:`prefetch_references` resolves every key referenced by a batch of payloads with a
+    single ``id IN (...)`` query per candidate table.
+    """
 
     def __init__(self, dataset: Dataset, resource: ResourceSpec):
         """Initialize the service with a dataset and resource spec."""
         self.dataset = dataset
         self.resource = resource
+        # table -> {id: entity_id} for ids found in the table
+        self._fk_found: dict[str, dict[str, str | None]] = {}
+        # table -> ids already looked up in the table
+        self._fk_checked: dict[str, set[str]] = {}
 
     def resolve_table(self) -> str:
         """Resolve the backing table for this resource.
@@ -82,12 +107,67 @@ class BaseService:
             )
         return resolved_table
 
+    def _lookup_ids(self, table: str, ids: Iterable[str]) -> dict[str, str | None]:
+        """Look up ids in a table, querying only the ids not looked up yet.
+
+        Returns:
+            Mapping of the ids found in the table to their ``entity_id`` (None if the table has no such column).
+        """
+        found = self._fk_found.setdefault(table, {})
+        checked = self._fk_checked.setdefault(table, set())
+        missing = [fk_id for fk_id in dict.fromkeys(ids) if fk_id and fk_id not in checked]
+        if not missing:
+            return found
+
+        lance_table = self.dataset.open_table(table)
+        columns = ["id", "entity_id"] if "entity_id" in lance_table.schema.names else ["id"]
+        for start in range(0, len(missing), FK_QUERY_CHUNK_SIZE):
+            chunk = missing[start : start + FK_QUERY_CHUNK_SIZE]
+            rows = (
+                TableQueryBuilder(lance_table, self.dataset._db_connection)
+                .select(columns)
+                .where(f"id IN {to_sql_list(chunk)}")
+                .to_list()
+            )
+            for row in rows:
+                found[row["id"]] = row.get("entity_id")
+        checked.update(missing)
+        return found
+
+    def _find_in_group(self, group: SchemaGroup, fk_id: str) -> tuple[str, str | None] | None:
+        """Return the table holding `fk_id` in a schema group and the row entity_id, or None."""
+        for table in self.dataset.info.groups.get(group, []):
+            found = self._lookup_ids(table, [fk_id])
+            if fk_id in found:
+                return table, found[fk_id]
+        return None
+
+    def prefetch_references(self, payloads: Iterable[dict[str, Any]]) -> None:
+        """Resolve all foreign keys referenced by a batch of payloads.
+
+        Every id referenced through one of :data:`FK_FIELD_GROUPS` is looked up with one query per
+        candidate table, so the following ``validate_*`` calls are answered from memory.
+
+        Args:
+            payloads: The payloads to be validated.
+        """
+        ids_by_group: dict[SchemaGroup, set[str]] = {}
+        for payload in payloads:
+            for field_name, group in FK_FIELD_GROUPS.items():
+                value = payload.get(field_name)
+                values = value if isinstance(value, list) else [value]
+                ids_by_group.setdefault(group, set()).update(v for v in values if isinstance(v, str) and v)
+        for group, ids in ids_by_group.items():
+            if not ids:
+                continue
+            for table in self.dataset.info.groups.get(group, []):
+                self._lookup_ids(table, ids)
+
     def validate_fk_exists(self, table: str, fk_id: str, label: str) -> None:
         """Ensure a foreign key target exists."""
         if not fk_id:
             return
-        row = self.dataset.get_data(table, ids=fk_id)
-        if row is None:
+        if fk_id not in self._lookup_ids(table, [fk_id]):
             raise HTTPException(
                 status_code=400,
                 detail=f"Foreign key violation: {label}='{fk_id}' not found in '{table}'.",
@@ -101,11 +181,9 @@ class BaseService:
         """Validate that the referenced entity exists and return its table name."""
         if not entity_id:
             return None
-        tables: list[str] = list(self.dataset.info.groups.get(SchemaGroup.ENTITY, []))
-        for table in tables:
-            row = self.dataset.get_data(table, ids=entity_id)
-            if row is not None:
-                return table
+        target = self._find_in_group(SchemaGroup.ENTITY, entity_id)
+        if target is not None:
+            return target[0]
         raise HTTPException(
             status_code=400,
             detail=f"Foreign key violation: entity_id='{entity_id}' not found in any entity table.",
@@ -115,44 +193,40 @@ class BaseService:
         """Validate that the referenced tracklet exists and belongs to the expected entity."""
         if not tracklet_id:
             return
-        tables: list[str] = list(self.dataset.info.groups.get(SchemaGroup.ANNOTATION, []))
-        for table in tables:
-            row = self.dataset.get_data(table, ids=tracklet_id)
-            if row is None:
-                continue
-            if expected_entity_id and hasattr(row, "entity_id") and row.entity_id != expected_entity_id:
-                raise HTTPException(
-                    status_code=400,
-                    detail=(
-                        f"Cross-entity check failed: tracklet '{tracklet_id}' belongs to "
-                        f"entity '{row.entity_id}', not '{expected_entity_id}'."
-                    ),
-                )
-            return
-        raise HTTPException(status_code=400, detail=f"Foreign key violation: tracklet_id='{tracklet_id}' not found.")
+        target = self._find_in_group(SchemaGroup.ANNOTATION, tracklet_id)
+        if target is None:
+            raise HTTPException(
+                status_code=400, detail=f"Foreign key violation: tracklet_id='{tracklet_id}' not found."
+            )
+        _, entity_id = target
+        if expected_entity_id and entity_id is not None and entity_id != expected_entity_id:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Cross-entity check failed: tracklet '{tracklet_id}' belongs to "
+                    f"entity '{entity_id}', not '{expected_entity_id}'."
+                ),
+            )
 
     def validate_eds_exists(self, eds_id: str, expected_entity_id: str | None = None) -> None:
         """Validate that the referenced entity dynamic state exists."""
         if not eds_id:
             return
-        tables: list[str] = list(self.dataset.info.groups.get(SchemaGroup.ENTITY_DYNAMIC_STATE, []))
-        for table in tables:
-            row = self.dataset.get_data(table, ids=eds_id)
-            if row is None:
-                continue
-            if expected_entity_id and hasattr(row, "entity_id") and row.entity_id != expected_entity_id:
-                raise HTTPException(
-                    status_code=400,
-                    detail=(
-                        f"Cross-entity check failed: EDS '{eds_id}' belongs to "
-                        f"entity '{row.entity_id}', not '{expected_entity_id}'."
-                    ),
-                )
-            return
-        raise HTTPException(
-            status_code=400,
-            detail=f"Foreign key violation: entity_dynamic_state_id='{eds_id}' not found.",
-        )
+        target = self._find_in_group(SchemaGroup.ENTITY_DYNAMIC_STATE, eds_id)
+        if target is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Foreign key violation: entity_dynamic_state_id='{eds_id}' not found.",
+            )
+        _, entity_id = target
+        if expected_entity_id and entity_id is not None and entity_id != expected_entity_id:
+            raise HTTPException(
+                status_code=400,
+                detail=(
+                    f"Cross-entity check failed: EDS '{eds_id}' belongs to "
+                    f"entity '{entity_id}', not '{expected_entity_id}'."
+                ),
+            )
 
     def _response(self, row: LanceModel) -> BaseModel:
         payload = serialize_row(row, exclude_fields=self.resource.response_exclude_fields)
@@ -219,49 +293,91 @@ class BaseService:
 
     def create(self, data: dict[str, Any]) -> BaseModel:
         """Create a new resource row."""
+        return self.create_many([data])[0]
+
+    def create_many(self, items: list[dict[str, Any]]) -> list[BaseModel]:
+        """Create several resource rows in a single write.
+
+        Foreign keys of the whole batch are resolved up-front with :meth:`prefetch_references`.
+        """
         resolved_table = self.resolve_table()
-        payload = dict(data)
+        _check_bulk_size(items)
+        payloads = [dict(data) for data in items]
 
         if self.resource.validate_create is not None:
-            self.resource.validate_create(self, payload)
+            self.prefetch_references(payloads)
+            for payload in payloads:
+                self.resource.validate_create(self, payload)
 
         schema = self.dataset.info.tables[resolved_table]
         try:
-            row = schema.model_validate(payload)
+            rows = [schema.model_validate(payload) for payload in payloads]
         except Exception as err:
             raise HTTPException(status_code=400, detail=f"Invalid data: {err}")
 
         try:
-            created_rows = self.dataset.add_data(resolved_table, [row])
+            created_rows = self.dataset.add_data(resolved_table, rows)
         except DatasetIntegrityError as err:
             raise HTTPException(status_code=400, detail=f"Integrity error: {err}")
         except ValueError as err:
             raise HTTPException(status_code=400, detail=f"Invalid data: {err}")
 
-        return self._response(created_rows[0])
+        self._remember_rows(resolved_table, created_rows)
+        return [self._response(row) for row in created_rows]
 
     def update(self, id: str, data: dict[str, Any]) -> BaseModel:
         """Update an existing resource row."""
+        return self.update_many([{**data, "id": id}])[0]
+
+    def update_many(self, items: list[dict[str, Any]]) -> list[BaseModel]:
+        """Update several existing resource rows in a single write.
+
+        Args:
+            items: Partial update payloads, each with the ``id`` of the row to update.
+        """
         resolved_table = self.resolve_table()
-        existing = self.dataset.get_data(resolved_table, ids=id)
-        if existing is None:
-            raise HTTPException(status_code=404, detail=f"Resource '{id}' not found in '{resolved_table}'.")
+        _check_bulk_size(items)
+        patches = {}
+        for data in items:
+            patch = dict(data)
+            row_id = patch.pop("id", None)
+            if not isinstance(row_id, str) or not row_id:
+                raise HTTPException(status_code=400, detail="Invalid data: every update must have an 'id'.")
+            if row_id in patches:
+                raise HTTPException(status_code=400, detail=f"Invalid data: duplicate id '{row_id}' in bulk update.")
+            patches[row_id] = patch
+
+        existing_rows = {row.id: row for row in self.dataset.get_data(resolved_table, ids=list(patches))}
+        for row_id in patches:
+            if row_id not in existing_rows:
+                raise HTTPException(status_code=404, detail=f"Resource '{row_id}' not found in '{resolved_table}'.")
 
-        merged = merge_update_payload(existing, data)
         schema = self.dataset.info.tables[resolved_table]
         try:
-            row = schema.model_validate(merged)
+            rows = [
+                schema.model_validate(merge_update_payload(existing_rows[row_id], patch))
+                for row_id, patch in patches.items()
+            ]
         except Exception as err:
             raise HTTPException(status_code=400, detail=f"Invalid data: {err}")
 
         try:
-            updated_rows = self.dataset.update_data(resolved_table, [row])
+            updated_rows = self.dataset.update_data(resolved_table, rows)
         except DatasetIntegrityError as err:
             raise HTTPException(status_code=400, detail=f"Integrity error: {err}")
         except ValueError as err:
             raise HTTPException(status_code=400, detail=f"Invalid data: {err}")
 
-        return self._response(updated_rows[0])
+        self._remember_rows(resolved_table, updated_rows)
+        return [self._response(row) for row in updated_rows]
+
+    def _remember_rows(self, table: str, rows: list[LanceModel]) -> None:
+        """Record written rows in the foreign-key cache."""
+        found = self._fk_found.setdefault(table, {})
+        checked = self._fk_checked.setdefault(table, set())
+        for row in rows:
+            found[row.id] = getattr(row, "entity_id", None)
+            checked.add(row.id)
 
     def delete(self, id: str) -> None:
         """Delete a resource by ID."""
@@ -271,4 +387,13 @@ class BaseService:
             raise HTTPException(status_code=404, detail=f"Resource '{id}' not found in '{resolved_table}'.")
 
 
+def _check_bulk_size(items: list[dict[str, Any]]) -> None:
+    if not items:
+        raise HTTPException(status_code=400, detail="Invalid data: at least one item is required.")
+    if len(items) > MAX_BULK_SIZE:
+        raise HTTPException(
+            status_code=400, detail=f"Invalid data: at most {MAX_BULK_SIZE} items can be written at once."
+        )
+
+
 __all__ = ["BaseService"]
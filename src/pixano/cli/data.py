@@ -7,6 +7,7 @@
 import re
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
@@ -14,12 +15,17 @@ from pixano.cli._schema_loader import load_info
 from pixano.datasets.workspaces import WorkspaceType
 
 
+if TYPE_CHECKING:
+    from pixano.datasets.builders.folders.metadata import MetadataValidationReport
+
+
 class ImportMode(str, Enum):
     """Import modes controlling dataset creation behavior."""
 
     create = "create"
     overwrite = "overwrite"
     add = "add"
+    sync = "sync"
 
 
 class MetadataValidationMode(str, Enum):
@@ -29,6 +35,13 @@ class MetadataValidationMode(str, Enum):
     strict = "strict"
 
 
+class MediaStorage(str, Enum):
+    """Where imported media bytes are stored."""
+
+    embedded = "embedded"
+    content_addressed = "content_addressed"
+
+
 def _snake_case_name(value: str) -> str:
     snake = re.sub(r"[^a-zA-Z0-9]+", "_", value.strip().lower())
     snake = re.sub(r"_+", "_", snake).strip("_")
@@ -71,7 +84,10 @@ def import_data(
             "Folder import requires it as the dataset specification source of truth."
         ),
     ),
-    mode: ImportMode = typer.Option(ImportMode.create, help="Import mode: create, overwrite, or add."),
+    mode: ImportMode = typer.Option(
+        ImportMode.create,
+        help="Import mode: create, overwrite, add, or sync (only import new or changed files).",
+    ),
     metadata_validation: MetadataValidationMode = typer.Option(
         MetadataValidationMode.default,
         "--metadata-validation",
@@ -79,6 +95,20 @@ def import_data(
     ),
     dry_run: bool = typer.Option(False, "--dry-run", help="Validate metadata and exit without importing."),
     use_image_name_as_id: bool = typer.Option(False, help="Use image file name as record ID."),
+    media_storage: MediaStorage = typer.Option(
+        MediaStorage.embedded,
+        "--media-storage",
+        help=(
+            "Media storage: embedded (in the view tables) or content_addressed "
+            "(deduplicated files in the dataset directory)."
+        ),
+    ),
+    flush_memory_budget_mb: int | None = typer.Option(
+        None,
+        "--flush-memory-budget-mb",
+        min=1,
+        help="Flush buffered rows to the dataset once they hold about this many MiB of data, media included.",
+    ),
 ) -> None:
     """Import a dataset from an external source directory.
 
@@ -119,9 +149,26 @@ def import_data(
         metadata_validation_mode=metadata_validation.value,
         use_image_name_as_id=use_image_name_as_id,
         target_name=dataset_name,
+        media_storage=media_storage.value,
     )
 
-    report = builder.preflight_metadata(metadata_validation.value)
+    if dry_run:
+        report = builder.preflight_metadata(metadata_validation.value)
+        _echo_metadata_report(report)
+        if report.errors:
+            raise typer.Exit(code=1)
+        typer.echo("Dry-run completed successfully. No dataset was created.")
+        raise typer.Exit(code=0)
+
+    # Metadata rows are validated while the dataset is built, which stops at the first invalid row
+    flush_memory_budget = flush_memory_budget_mb * 1024 * 1024 if flush_memory_budget_mb is not None else None
+    dataset = builder.build(mode=mode.value, flush_memory_budget=flush_memory_budget)
+    _echo_metadata_report(builder.preflight_metadata(metadata_validation.value))
+    typer.echo(f"Dataset '{dataset_name}' built successfully ({dataset.num_rows} records).")
+
+
+def _echo_metadata_report(report: "MetadataValidationReport") -> None:
+    """Print the summary of a metadata validation report."""
     typer.echo(f"Metadata validation passed with {report.warning_count} warnings")
     if report.normalized_examples:
         for example in report.normalized_examples:
@@ -142,10 +189,60 @@ def import_data(
         for code, aggregate in sorted(report.errors.items()):
             samples = ", ".join(aggregate.samples)
             typer.echo(f"- Error: {code} ({aggregate.count} rows; e.g. {samples})", err=True)
+
+
+@data_app.command(name="check")
+def check_data(
+    dataset_dir: Path = typer.Argument(
+        ..., exists=True, file_okay=False, dir_okay=True, help="Path to the dataset directory."
+    ),
+) -> None:
+    """Check the ids and foreign keys of all the tables of a dataset.
+
+    Exits with code 1 if any integrity error is found.
+    """
+    from pixano.datasets import Dataset
+    from pixano.datasets.utils.integrity import compute_integrity_report
+
+    reports = compute_integrity_report(Dataset(dataset_dir))
+    for report in reports.values():
+        invalid = ", ".join(
+            f"{field_name}={len(pairs)}" for field_name, pairs in sorted(report.invalid_foreign_keys.items())
+        )
+        line = (
+            f"- {report.table_name}: {report.num_rows} rows, {report.missing_ids} missing ids, "
+            f"{len(report.duplicate_ids)} duplicate ids, {report.invalid_foreign_key_count} invalid foreign keys"
+        )
+        if invalid:
+            line += f" ({invalid})"
+        if report.orphan_ids:
+            line += f", {len(report.orphan_ids)} records without views"
+        typer.echo(line)
+
+    error_count = sum(report.error_count for report in reports.values())
+    if error_count:
+        typer.echo(f"Integrity check failed with {error_count} errors.", err=True)
         raise typer.Exit(code=1)
-    if dry_run:
-        typer.echo("Dry-run completed successfully. No dataset was created.")
-        raise typer.Exit(code=0)
+    typer.echo("Integrity check passed.")
 
-    dataset = builder.build(mode=mode.value)
-    typer.echo(f"Dataset '{dataset_name}' built successfully ({dataset.num_rows} records).")
+
+@data_app.command(name="optimize")
+def optimize_data(
+    dataset_dir: Path = typer.Argument(
+        ..., exists=True, file_okay=False, dir_okay=True, help="Path to the dataset directory."
+    ),
+    cleanup_older_than_days: int | None = typer.Option(
+        None, "--cleanup-older-than-days", min=0, help="Delete the table versions older than this number of days."
+    ),
+) -> None:
+    """Create the missing scalar indexes of a dataset, update them with the new rows and compact its tables."""
+    from datetime import timedelta
+
+    from pixano.datasets import Dataset
+
+    cleanup_older_than = timedelta(days=cleanup_older_than_days) if cleanup_older_than_days is not None else None
+    created = Dataset(dataset_dir).optimize(cleanup_older_than=cleanup_older_than)
+    for table_name, columns in created.items():
+        if columns:
+            typer.echo(f"- {table_name}: created indexes on {', '.join(columns)}")
+    typer.echo(f"Optimized {len(created)} tables.")
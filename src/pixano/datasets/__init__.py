@@ -8,6 +8,7 @@ from .dataset import Dataset
 from .dataset_features_values import DatasetFeaturesValues
 from .dataset_info import DatasetInfo
 from .dataset_stat import DatasetStatistic
+from .library_catalog import LibraryCatalog, LibraryCatalogEntry
 from .queries import TableQueryBuilder
 from .workspaces import WorkspaceType
 
@@ -17,6 +18,8 @@ __all__ = [
     "DatasetFeaturesValues",
     "DatasetInfo",
     "DatasetStatistic",
+    "LibraryCatalog",
+    "LibraryCatalogEntry",
     "TableQueryBuilder",
     "WorkspaceType",
 ]
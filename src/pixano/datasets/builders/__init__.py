@@ -4,12 +4,13 @@
 # License: CECILL-C
 # =====================================
 
-from .dataset_builder import DatasetBuilder
+from .dataset_builder import DatasetBuilder, FlushStats
 from .folders import FolderBaseBuilder, ImageFolderBuilder, MelFolderBuilder, VideoFolderBuilder, VQAFolderBuilder
 
 
 __all__ = [
     "DatasetBuilder",
+    "FlushStats",
     "FolderBaseBuilder",
     "ImageFolderBuilder",
     "MelFolderBuilder",
@@ -5,14 +5,23 @@
 # =====================================
 
 import logging
+import multiprocessing
+import os
+import queue
 import shutil
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Literal
+from typing import Any, Callable, Iterator, Literal
 
+import numpy as np
 import shortuuid
 import tqdm
 from lancedb.pydantic import LanceModel
+from pydantic import BaseModel
 
 from pixano.datasets import Dataset, DatasetInfo
 from pixano.schemas import Record, SchemaGroup
@@ -20,6 +29,102 @@ from pixano.schemas import Record, SchemaGroup
 
 logger = logging.getLogger(__name__)
 
+_STOP = object()
+
+
+@dataclass
+class FlushStats:
+    """Statistics of one batch flushed by :meth:`DatasetBuilder.build`.
+
+    Attributes:
+        index: Position of the flush in the build.
+        reason: What triggered the flush: ``"rows"`` when a table reached ``flush_every_n_samples`` rows,
+            ``"memory"`` when the buffers reached ``flush_memory_budget`` bytes, ``"final"`` at the end of generation.
+        num_rows: Number of rows flushed per table.
+        nbytes: Approximate size in bytes of the rows flushed per table, media included.
+        generate_seconds: Time spent generating the rows of the batch.
+        wait_seconds: Time generation was blocked waiting for the background writer, in pipelined mode.
+        write_seconds: Time spent validating and inserting the batch.
+    """
+
+    index: int
+    reason: Literal["rows", "memory", "final"]
+    num_rows: dict[str, int] = field(default_factory=dict)
+    nbytes: dict[str, int] = field(default_factory=dict)
+    generate_seconds: float = 0.0
+    wait_seconds: float = 0.0
+    write_seconds: float = 0.0
+
+    @property
+    def total_nbytes(self) -> int:
+        """Approximate size in bytes of the batch."""
+        return sum(self.nbytes.values())
+
+
+def _approximate_nbytes(value: Any) -> int:
+    """Approximate the in-memory payload size of a generated value, counting media bytes and strings."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, BaseModel):
+        return sum(_approximate_nbytes(item) for item in value.__dict__.values())
+    if isinstance(value, (list, tuple)):
+        if value and isinstance(value[0], (int, float)):
+            return 8 * len(value)
+        return sum(_approximate_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(_approximate_nbytes(key) + _approximate_nbytes(item) for key, item in value.items())
+    return 8
+
+
+class _BackgroundWriter:
+    """Write flushed batches on a dedicated thread, in submission order.
+
+    The queue is bounded so that generation blocks instead of buffering an unbounded number of batches when
+    writing is the bottleneck. The first write error stops further writes and is re-raised on the producer side.
+    """
+
+    def __init__(self, write: Callable[[Any], None], max_pending: int):
+        self._write = write
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="pixano-dataset-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = self._queue.get()
+            if batch is _STOP:
+                return
+            if self._error is not None:
+                continue
+            try:
+                self._write(batch)
+            except BaseException as error:
+                self._error = error
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, batch: Any) -> None:
+        """Queue a batch for writing, blocking while the queue is full."""
+        self._raise_if_failed()
+        self._queue.put(batch)
+
+    def close(self, raise_error: bool = True) -> None:
+        """Wait for all queued batches to be written.
+
+        Args:
+            raise_error: Whether to re-raise a write error. Disabled when the build is already failing.
+        """
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        if raise_error:
+            self._raise_if_failed()
+
 
 class DatasetBuilder(ABC):
     """Abstract base class for dataset builders.
@@ -32,6 +137,7 @@ class DatasetBuilder(ABC):
         previews_path: The path to the previews directory.
         info: Dataset information (including table→schema mapping).
         schemas: The schemas of the dataset tables (alias for info.tables).
+        flush_stats: Statistics of the batches flushed by the last build.
     """
 
     def __init__(
@@ -51,6 +157,9 @@ class DatasetBuilder(ABC):
         self.info: DatasetInfo = info
         self.schemas: dict[str, type[LanceModel]] = self.info.tables
         self._active_dataset: Dataset | None = None
+        self._executor: Executor | None = None
+        self.flush_stats: list[FlushStats] = []
+        self._last_flush_time = 0.0
 
     @property
     def record_schema(self) -> type[Record]:
@@ -64,10 +173,15 @@ class DatasetBuilder(ABC):
 
     def build(
         self,
-        mode: Literal["add", "create", "overwrite"] = "create",
+        mode: Literal["add", "create", "overwrite", "sync"] = "create",
         flush_every_n_samples: int = 1024,
+        flush_memory_budget: int | None = None,
         compact_every_n_transactions: int | None = None,
         check_integrity: Literal["raise", "warn", "none"] = "raise",
+        pipelined: bool = False,
+        num_workers: int | None = None,
+        max_pending_flushes: int = 2,
+        worker_type: Literal["process", "thread"] = "process",
     ) -> Dataset:
         """Build the dataset.
 
@@ -75,60 +189,153 @@ class DatasetBuilder(ABC):
         via :meth:`Dataset.create`. Data is then inserted in batches via
         :meth:`Dataset.add_records`.
 
+        The ``"sync"`` mode, for builders that support it, creates the dataset
+        if needed and only generates rows for new or changed source items,
+        deleting the rows of changed and removed ones.
+
+        In pipelined mode, batches are validated and inserted by a background
+        writer thread while generation goes on. In pipelined mode or when
+        ``num_workers`` is set, builders that support it spread per-file work
+        (media loading and decoding) over a worker pool, keeping results in order.
+
+        Once all rows are written, the dataset is optimized so that its scalar
+        indexes cover the new rows.
+
+        A failed ``"create"`` build deletes the dataset it created, and an
+        ``"overwrite"`` build writes to a staging directory that only replaces
+        the previous dataset once complete, unless the builder can resume an
+        interrupted build.
+
         Args:
-            mode: The mode for creating the tables ("create", "overwrite" or "add").
-            flush_every_n_samples: Samples accumulated before flushing. Defaults to 1024.
+            mode: The mode for creating the tables ("create", "overwrite", "add" or "sync").
+            flush_every_n_samples: Samples accumulated in a table before flushing. Defaults to 1024.
+            flush_memory_budget: If provided, approximate size in bytes of the accumulated rows of all tables,
+                media included, that triggers a flush. This bounds the memory held by large media rows that
+                ``flush_every_n_samples`` does not account for.
             compact_every_n_transactions: Deprecated and ignored. Dataset storage
                 maintenance is delegated to :class:`Dataset`.
             check_integrity: Integrity check mode ("raise", "warn" or "none").
+            pipelined: Whether to overlap generation with writing.
+            num_workers: Size of the worker pool. Defaults to the number of CPUs in pipelined mode, and to no
+                pool otherwise.
+            max_pending_flushes: Batches that can wait for the writer in pipelined mode before generation blocks.
+            worker_type: Whether the worker pool uses processes or threads.
 
         Returns:
             The built dataset.
         """
-        if mode not in ["add", "create", "overwrite"]:
-            raise ValueError(f"mode should be 'add', 'create' or 'overwrite' but got {mode}")
+        if mode not in ["add", "create", "overwrite", "sync"]:
+            raise ValueError(f"mode should be 'add', 'create', 'overwrite' or 'sync' but got {mode}")
         if check_integrity not in ["raise", "warn", "none"]:
             raise ValueError(f"check_integrity should be 'raise', 'warn' or 'none' but got {check_integrity}")
         if flush_every_n_samples <= 0:
             raise ValueError(f"flush_every_n_samples should be greater than 0 but got {flush_every_n_samples}")
+        if flush_memory_budget is not None and flush_memory_budget <= 0:
+            raise ValueError(f"flush_memory_budget should be greater than 0 but got {flush_memory_budget}")
         if compact_every_n_transactions is not None and compact_every_n_transactions <= 0:
             raise ValueError(
                 f"compact_every_n_transactions should be greater than 0 but got {compact_every_n_transactions}"
             )
 
+        if num_workers is not None and num_workers <= 0:
+            raise ValueError(f"num_workers should be greater than 0 but got {num_workers}")
+        if worker_type not in ["process", "thread"]:
+            raise ValueError(f"worker_type should be 'process' or 'thread' but got {worker_type}")
+        if pipelined and max_pending_flushes <= 0:
+            raise ValueError(f"max_pending_flushes should be greater than 0 but got {max_pending_flushes}")
+
+        if mode == "sync":
+            self._prepare_sync()
         dataset = self._prepare_dataset(mode)
         buffers = self._initialize_buffers()
+        buffer_nbytes = dict.fromkeys(buffers, 0)
+        self.flush_stats = []
+        self._last_flush_time = time.perf_counter()
 
         logger.info("Building dataset %s", self.info.name)
         self._active_dataset = dataset
+        writer: _BackgroundWriter | None = None
+        if pipelined:
+            writer = _BackgroundWriter(
+                lambda job: self._write_batch(job[0], dataset, check_integrity, checkpoint=job[1], stats=job[2]),
+                max_pending_flushes,
+            )
+        if pipelined or num_workers is not None:
+            self._executor = self._create_executor(worker_type, num_workers or os.cpu_count() or 1)
         try:
             for items in tqdm.tqdm(self.generate_data(), desc=f"Generate data for dataset {self.info.name}"):
-                self._accumulate_records(buffers, items)
+                self._accumulate_records(buffers, items, buffer_nbytes)
                 if any(len(rows) >= flush_every_n_samples for rows in buffers.values()):
-                    self._flush_accumulated(buffers, dataset, check_integrity)
-
-            self._flush_accumulated(buffers, dataset, check_integrity)
+                    self._flush_accumulated(buffers, dataset, check_integrity, writer, buffer_nbytes, "rows")
+                elif flush_memory_budget is not None and sum(buffer_nbytes.values()) >= flush_memory_budget:
+                    self._flush_accumulated(buffers, dataset, check_integrity, writer, buffer_nbytes, "memory")
+
+            self._flush_accumulated(buffers, dataset, check_integrity, writer, buffer_nbytes, "final")
+            if writer is not None:
+                writer.close()
+            if mode == "sync":
+                self._finish_sync(dataset)
+            dataset.optimize()
+            if dataset.path != self.target_dir:
+                dataset = self._replace_target_dir(dataset.path)
+        except BaseException:
+            if writer is not None:
+                writer.close(raise_error=False)
+            if dataset.path != self.target_dir or (mode == "create" and not self._can_resume_build()):
+                shutil.rmtree(dataset.path, ignore_errors=True)
+            raise
         finally:
+            if self._executor is not None:
+                self._executor.shutdown(cancel_futures=True)
+                self._executor = None
             self._active_dataset = None
+            self._reset_generation_state()
 
         logger.info("Dataset %s built in %s with id %s", self.info.name, self.target_dir, self.info.id)
         return dataset
 
-    def _prepare_dataset(self, mode: Literal["add", "create", "overwrite"]) -> Dataset:
+    @staticmethod
+    def _create_executor(worker_type: Literal["process", "thread"], num_workers: int) -> Executor:
+        """Create the pool that builders use for per-file work."""
+        if worker_type == "thread":
+            return ThreadPoolExecutor(max_workers=num_workers, thread_name_prefix="pixano-dataset-worker")
+        # Lance is not fork-safe, so workers are spawned.
+        return ProcessPoolExecutor(max_workers=num_workers, mp_context=multiprocessing.get_context("spawn"))
+
+    def _prepare_dataset(self, mode: Literal["add", "create", "overwrite", "sync"]) -> Dataset:
         """Open or create the target dataset for the requested build mode."""
-        if mode == "add":
+        if mode == "add" or (mode == "sync" and (self.target_dir / Dataset._INFO_FILE).exists()):
             dataset = Dataset(self.target_dir)
             if not self.info.id:
                 self.info.id = dataset.info.id
             return dataset
 
-        if mode == "overwrite" and self.target_dir.exists():
-            shutil.rmtree(self.target_dir)
-
         if not self.info.id:
             self.info.id = shortuuid.uuid()
+        if mode == "overwrite" and not self._can_resume_build():
+            # The previous dataset stays in place until the new one is complete
+            staging_dir = self.target_dir.with_name(f".{self.target_dir.name}.building")
+            if staging_dir.exists():
+                shutil.rmtree(staging_dir)
+            return Dataset.create(staging_dir, self.info)
+
+        if mode == "overwrite" and self.target_dir.exists():
+            shutil.rmtree(self.target_dir)
         return Dataset.create(self.target_dir, self.info)
 
+    def _replace_target_dir(self, staging_dir: Path) -> Dataset:
+        """Move a dataset built in a staging directory to the target directory, replacing the previous one."""
+        if self.target_dir.exists():
+            replaced_dir = self.target_dir.with_name(f".{self.target_dir.name}.replaced")
+            if replaced_dir.exists():
+                shutil.rmtree(replaced_dir)
+            self.target_dir.rename(replaced_dir)
+            staging_dir.rename(self.target_dir)
+            shutil.rmtree(replaced_dir)
+        else:
+            staging_dir.rename(self.target_dir)
+        return Dataset(self.target_dir)
+
     def _initialize_buffers(self) -> dict[str, list[LanceModel]]:
         """Create one in-memory buffer per known table."""
         return {table_name: [] for table_name in self.schemas.keys()}
@@ -137,8 +344,12 @@ class DatasetBuilder(ABC):
         self,
         buffers: dict[str, list[LanceModel]],
         items: dict[str, LanceModel | list[LanceModel]],
+        buffer_nbytes: dict[str, int] | None = None,
     ) -> None:
-        """Normalize generated rows and append them to the in-memory buffers."""
+        """Normalize generated rows and append them to the in-memory buffers.
+
+        With ``buffer_nbytes``, the approximate size of the appended rows is added to the size of their buffer.
+        """
         for table_name, item_value in items.items():
             if item_value is None or item_value == []:
                 continue
@@ -147,23 +358,101 @@ class DatasetBuilder(ABC):
 
             rows = item_value if isinstance(item_value, list) else [item_value]
             buffers[table_name].extend(rows)
+            if buffer_nbytes is not None:
+                buffer_nbytes[table_name] += sum(_approximate_nbytes(row) for row in rows)
 
     def _flush_accumulated(
         self,
         accumulate_data_tables: dict[str, list[LanceModel]],
         dataset: Dataset,
         check_integrity: Literal["raise", "warn", "none"],
+        writer: _BackgroundWriter | None = None,
+        buffer_nbytes: dict[str, int] | None = None,
+        reason: Literal["rows", "memory", "final"] = "final",
     ) -> None:
-        """Flush all non-empty accumulated buffers via ``dataset.add_records()``."""
+        """Flush all non-empty accumulated buffers via ``dataset.add_records()``.
+
+        With a writer, the batch is handed over to the background thread and the buffers are reset right away.
+        The generation checkpoint is taken now and committed once the batch is written. The statistics of the
+        flush are appended to ``flush_stats``.
+        """
         batch = {table_name: rows for table_name, rows in accumulate_data_tables.items() if rows}
         if not batch:
             return
 
-        self._validate_batch(batch, dataset)
-        dataset.add_records(batch, check_integrity=check_integrity)
+        now = time.perf_counter()
+        stats = FlushStats(
+            index=len(self.flush_stats),
+            reason=reason,
+            num_rows={table_name: len(rows) for table_name, rows in batch.items()},
+            nbytes={table_name: buffer_nbytes[table_name] for table_name in batch} if buffer_nbytes else {},
+            generate_seconds=now - self._last_flush_time,
+        )
+        self.flush_stats.append(stats)
+        checkpoint = self._generation_checkpoint()
+        if writer is None:
+            self._write_batch(batch, dataset, check_integrity, checkpoint=checkpoint, stats=stats)
+        else:
+            writer.submit((batch, checkpoint, stats))
+            stats.wait_seconds = time.perf_counter() - now
 
         for table_name in batch:
             accumulate_data_tables[table_name] = []
+            if buffer_nbytes is not None:
+                buffer_nbytes[table_name] = 0
+        self._last_flush_time = time.perf_counter()
+
+    def _write_batch(
+        self,
+        batch: dict[str, list[LanceModel]],
+        dataset: Dataset,
+        check_integrity: Literal["raise", "warn", "none"],
+        checkpoint: Any = None,
+        stats: FlushStats | None = None,
+    ) -> None:
+        """Validate and insert one batch, then commit the generation checkpoint taken when it was flushed."""
+        start = time.perf_counter()
+        if checkpoint is not None:
+            self._before_checkpointed_write(checkpoint, dataset)
+        self._validate_batch(batch, dataset)
+        dataset.add_records(batch, check_integrity=check_integrity)
+        if checkpoint is not None:
+            self._commit_generation_checkpoint(checkpoint)
+        if stats is not None:
+            stats.write_seconds = time.perf_counter() - start
+            logger.debug(
+                "Flush %d (%s): %d rows, ~%d bytes, generated in %.3fs, written in %.3fs",
+                stats.index,
+                stats.reason,
+                sum(stats.num_rows.values()),
+                stats.total_nbytes,
+                stats.generate_seconds,
+                stats.write_seconds,
+            )
+
+    def _generation_checkpoint(self) -> Any:
+        """Return the position of generation covered by the rows buffered so far, or ``None``."""
+        return None
+
+    def _before_checkpointed_write(self, checkpoint: Any, dataset: Dataset) -> None:
+        """Apply the dataset changes a generation checkpoint requires before its batch is written."""
+
+    def _commit_generation_checkpoint(self, checkpoint: Any) -> None:
+        """Persist a generation checkpoint once all the rows it covers are written."""
+
+    def _can_resume_build(self) -> bool:
+        """Whether the rows written by an interrupted build are kept for a later ``"add"`` build to resume."""
+        return False
+
+    def _prepare_sync(self) -> None:
+        """Load the state that lets generation skip unchanged source items in ``"sync"`` mode."""
+        raise ValueError(f"{type(self).__name__} does not support mode 'sync'")
+
+    def _finish_sync(self, dataset: Dataset) -> None:
+        """Delete the rows of source items that disappeared, once generation is complete in ``"sync"`` mode."""
+
+    def _reset_generation_state(self) -> None:
+        """Drop the per-build state of generation once a build ends, successfully or not."""
 
     @abstractmethod
     def generate_data(self) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
@@ -4,14 +4,19 @@
 # License: CECILL-C
 # =====================================
 
-from collections import defaultdict
+import hashlib
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Callable, Iterable, Iterator, Literal, TypeVar
 
-import pyarrow.json as pa_json
+import numpy as np
+import orjson
 import shortuuid
 from lancedb.pydantic import LanceModel
 
+from pixano.datasets import Dataset
 from pixano.datasets.builders.dataset_builder import DatasetBuilder
 from pixano.datasets.builders.validators import ViewFamilyIntegrityValidator
 from pixano.datasets.dataset_info import DatasetInfo
@@ -26,15 +31,44 @@ from pixano.schemas import (
     View,
     canonical_table_name_for_schema,
     canonical_table_name_for_slot,
+    is_image,
     is_sequence_frame,
     is_text,
     is_video,
 )
 from pixano.schemas.annotations.entity_annotation import AnnotationSourceKind
+from pixano.schemas.views.image import probe_image_bytes
 
 from .factories import AnnotationSource, FolderEntityFactory, FolderMessageFactory, FolderRecordFactory
-from .metadata import FolderMetadataService, MetadataValidationReport
+from .metadata import FolderMetadataService, MetadataCheckpoint, MetadataValidationReport
 from .processors import BBoxTrackProcessor, MaskTrackProcessor, TemporalRowFactory, TemporalSchemaResolver
+from .sync import FingerprintMethod, SyncDelta, SyncManifest, fingerprint_source_item
+
+
+# (view name, view schema, media file, timestamp, frame index or None for non-sequence views)
+_PlannedView = tuple[str, type[View], Path, float, int | None]
+# Frame index of the planned view of a video file whose frames are extracted into sequence frames
+_VIDEO_FRAMES = -1
+_T = TypeVar("_T")
+
+
+def load_view_media(view_file: Path, probe: bool) -> dict[str, Any]:
+    """Read a view media file and optionally decode its image fields.
+
+    It only handles plain values so that it can run in a worker process.
+
+    Args:
+        view_file: Media file.
+        probe: Whether to decode the dimensions, format and preview of the image.
+
+    Returns:
+        The ``raw_bytes`` of the file, with the fields of :func:`probe_image_bytes` if ``probe`` is set.
+    """
+    raw_bytes = view_file.read_bytes()
+    media: dict[str, Any] = {"raw_bytes": raw_bytes}
+    if probe:
+        media.update(probe_image_bytes(raw_bytes))
+    return media
 
 
 class FolderBaseBuilder(DatasetBuilder):
@@ -77,11 +111,19 @@ class FolderBaseBuilder(DatasetBuilder):
         METADATA_FILENAME: The metadata filename.
         EXTENSIONS: The list of supported extensions.
         DEFAULT_INFO: Default dataset schema and workspace for the builder.
+        PIPELINE_LOOKAHEAD: Records whose media files are loaded ahead by the worker pool in pipelined builds.
+        SYNC_MANIFEST_FILENAME: Name of the manifest kept in the dataset directory by builds in ``"sync"`` mode.
+        VIDEO_EXTENSIONS: Extensions of the video files whose frames are extracted into sequence frame views.
+        VIDEO_FRAME_CHUNK_SIZE: Sequence frames extracted from a video yielded together.
     """
 
     METADATA_FILENAME: str = "metadata.jsonl"
     EXTENSIONS: list[str]
     DEFAULT_INFO: DatasetInfo | None = None
+    PIPELINE_LOOKAHEAD: int = 64
+    SYNC_MANIFEST_FILENAME: str = "sync_manifest.json"
+    VIDEO_EXTENSIONS: list[str] = []
+    VIDEO_FRAME_CHUNK_SIZE: int = 256
 
     def __init__(
         self,
@@ -91,6 +133,9 @@ class FolderBaseBuilder(DatasetBuilder):
         metadata_validation_mode: str = "default",
         use_image_name_as_id: bool = False,
         target_name: str | None = None,
+        checkpoint_file: Path | str | None = None,
+        sync_fingerprint: FingerprintMethod = "stat",
+        media_storage: Literal["embedded", "content_addressed"] = "embedded",
     ) -> None:
         """Initialize the `FolderBaseBuilder`.
 
@@ -107,6 +152,13 @@ class FolderBaseBuilder(DatasetBuilder):
                                   This allows to reuse image embeddings after dataset overwrite.
             target_name: If provided, use this name for the target directory in the library
                 instead of deriving it from source_dir name.
+            checkpoint_file: If provided, the position of the last written source row is saved to this file
+                after each flush, and generation resumes after it. Resume an interrupted import with
+                ``build(mode="add")``.
+            sync_fingerprint: How ``build(mode="sync")`` detects changed media files: ``"stat"`` compares their
+                size and modification time, ``"content"`` hashes their bytes.
+            media_storage: ``"embedded"`` stores media bytes in the view tables, ``"content_addressed"`` stores
+                them once per distinct content in the blob store of the dataset, referenced by the view ``uri``.
         """
         info = self._merge_with_default_info(info)
         if not info.tables:
@@ -116,6 +168,10 @@ class FolderBaseBuilder(DatasetBuilder):
             raise ValueError(
                 f"DatasetInfo.workspace={info.workspace.value} is incompatible with {self.__class__.__name__}."
             )
+        if media_storage not in {"embedded", "content_addressed"}:
+            raise ValueError(f"media_storage should be 'embedded' or 'content_addressed' but got {media_storage}")
+        if sync_fingerprint not in {"stat", "content"}:
+            raise ValueError(f"sync_fingerprint should be 'stat' or 'content' but got {sync_fingerprint}")
         if metadata_validation_mode not in {"default", "strict"}:
             raise ValueError(
                 f"metadata_validation_mode should be 'default' or 'strict' but got {metadata_validation_mode}"
@@ -124,7 +180,21 @@ class FolderBaseBuilder(DatasetBuilder):
         self.use_image_name_as_id = use_image_name_as_id
         self.metadata_validation_mode = metadata_validation_mode
         self._metadata_report_cache: dict[str, MetadataValidationReport] = {}
-        info.storage_mode = "embedded"
+        self.checkpoint_file = Path(checkpoint_file) if checkpoint_file is not None else None
+        self._completed_splits: list[str] = []
+        self._generation_cursor: tuple[str, int] | None = None
+        self._partial_record_id: str | None = None
+        self._stale_partial_record_id: str | None = None
+        self.sync_fingerprint = sync_fingerprint
+        self._sync_manifest: SyncManifest | None = None
+        self._sync_seen: set[str] = set()
+        self._sync_record_ids: set[str] = set()
+        self._sync_written_record_ids: set[str] = set()
+        self._sync_delta = SyncDelta()
+        self.frame_stride = 1
+        self.frame_size: tuple[int, int] | None = None
+        self.frame_threads = 2
+        info.storage_mode = media_storage
 
         self.source_dir = Path(source_dir)
         if not self.source_dir.is_dir():
@@ -391,6 +461,10 @@ class FolderBaseBuilder(DatasetBuilder):
         self._metadata_report_cache[mode] = report
         return report
 
+    def _can_resume_build(self) -> bool:
+        """Whether a checkpoint lets ``build(mode="add")`` resume an interrupted build."""
+        return self.checkpoint_file is not None
+
     def _validate_batch(self, batch: dict[str, list[LanceModel]], dataset) -> None:
         """Apply folder-specific integrity validation before inserting a batch."""
         self._view_family_validator.validate(batch, dataset)
@@ -409,50 +483,381 @@ class FolderBaseBuilder(DatasetBuilder):
     ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
         """Generate data from the source directory.
 
+        Each ``metadata.jsonl`` is streamed once: rows are validated as they are read and generation stops at
+        the first invalid row. Once all splits are generated, the validation report is returned by
+        ``preflight_metadata`` without reading the metadata again.
+
         Returns:
             An iterator over the data following the dataset schemas.
         """
-        report = self.preflight_metadata(self.metadata_validation_mode)
-        if not report.is_valid:
-            raise ValueError(
-                f"Metadata validation failed with {report.error_count} errors. "
-                "Run the CLI with --dry-run to inspect the validation summary."
-            )
-
-        for split in self.source_dir.glob("*"):
+        mode = self.metadata_validation_mode
+        inline_report = MetadataValidationReport()
+        # The rows of splits completed by a resumed build are not read, so their report is partial
+        report_is_complete = True
+
+        checkpoint = MetadataCheckpoint.load(self.checkpoint_file) if self.checkpoint_file else MetadataCheckpoint()
+        self._completed_splits = list(checkpoint.completed_splits)
+        self._generation_cursor = (checkpoint.split, checkpoint.position) if checkpoint.split else None
+        if checkpoint.partial_record_id is not None:
+            self._stale_partial_record_id = checkpoint.partial_record_id
+
+        for split in sorted(self.source_dir.glob("*")):
             if not split.is_dir() or split.name.startswith("."):
                 continue
-
-            try:
-                dataset_pieces = self._read_metadata(split / self.METADATA_FILENAME)
-            except FileNotFoundError:
-                dataset_pieces = None
-
-            if dataset_pieces is None:
-                yield from self._generate_data_without_metadata(split)
+            if split.name in checkpoint.completed_splits:
+                report_is_complete = False
                 continue
 
-            for i, dataset_piece in enumerate(dataset_pieces):
-                yield from self._generate_data_from_metadata(split.name, i, dataset_piece)
+            resume_after = checkpoint.resume_position(split.name)
+            metadata_file = split / self.METADATA_FILENAME
+            inline_report.split_count += 1
+            if metadata_file.exists():
+                rows = self._read_metadata(metadata_file, split.name, inline_report)
+                yield from self._generate_data_from_metadata_rows(split.name, rows, resume_after)
+            else:
+                yield from self._generate_data_without_metadata(split, resume_after)
+            self._completed_splits.append(split.name)
+
+        if report_is_complete:
+            self._metadata_report_cache[mode] = inline_report
 
     def _generate_data_without_metadata(
         self,
         split: Path,
+        resume_after: int = 0,
     ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
         """Yield records and views for a split without ``metadata.jsonl``."""
         view_name, view_schema = list(self.views_schema.items())[0]
-        for view_file in sorted(split.glob("**/*")):
-            if not view_file.is_file() or view_file.suffix not in self.EXTENSIONS:
+        view_files = (
+            view_file
+            for view_file in sorted(split.glob("**/*"))
+            if view_file.is_file() and view_file.suffix in self.EXTENSIONS
+        )
+        pending: deque[tuple[int, tuple[str, str] | None, Path, list[Future | None]]] = deque()
+        for position, view_file in enumerate(view_files, start=1):
+            if position <= resume_after:
+                continue
+            sync_item = None
+            if self._sync_manifest is not None:
+                sync_item = self._fingerprint_source_item(str(view_file.relative_to(self.source_dir)), [view_file])
+                if sync_item is None:
+                    continue
+            media_futures = self._submit_view_media([self._plan_single_view(view_name, view_schema, view_file)])
+            pending.append((position, sync_item, view_file, media_futures))
+            if len(pending) > self._lookahead_records():
+                position, sync_item, view_file, media_futures = pending.popleft()
+                yield from self._track_row(
+                    split.name,
+                    position,
+                    self._generate_record_without_metadata(split, view_name, view_schema, view_file, media_futures),
+                    sync_item,
+                )
+        while pending:
+            position, sync_item, view_file, media_futures = pending.popleft()
+            yield from self._track_row(
+                split.name,
+                position,
+                self._generate_record_without_metadata(split, view_name, view_schema, view_file, media_futures),
+                sync_item,
+            )
+
+    def _generate_record_without_metadata(
+        self,
+        split: Path,
+        view_name: str,
+        view_schema: type[View],
+        view_file: Path,
+        media_futures: list[Future | None],
+    ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
+        """Yield the record and views of one media file of a split without ``metadata.jsonl``."""
+        record_metadata = self._build_default_custom_metadata_record()
+        record_metadata["id"] = view_file.stem
+        record_metadata["split"] = split.name
+        record = self._create_record(**record_metadata)
+        if self._is_video_frames_source(view_schema, view_file):
+            yield {self.record_table_name: record}
+            yield from self._generate_video_frame_views(record, view_name, view_schema, view_file, [], {})
+            return
+        media = media_futures[0].result() if media_futures[0] is not None else None
+        view = self._create_view(record, view_file, view_name, view_schema, media=media)
+        yield {
+            self.record_table_name: record,
+            canonical_table_name_for_schema(view_schema): view,
+        }
+
+    def _is_video_frames_source(self, view_schema: type[View], view_file: Path) -> bool:
+        """Whether a media file is a video whose frames are extracted into sequence frame views."""
+        return is_sequence_frame(view_schema) and view_file.suffix.lower() in self.VIDEO_EXTENSIONS
+
+    def _plan_single_view(self, view_name: str, view_schema: type[View], view_file: Path) -> _PlannedView:
+        """Plan the view of a split without ``metadata.jsonl``."""
+        frame_index = _VIDEO_FRAMES if self._is_video_frames_source(view_schema, view_file) else None
+        return view_name, view_schema, view_file, 0.0, frame_index
+
+    def _generate_video_frame_views(
+        self,
+        record: Record,
+        view_name: str,
+        view_schema: type[View],
+        video_file: Path,
+        views_data: list[tuple[str, View]],
+        frame_views_by_stem: dict[str, tuple[str, View, int, float]],
+    ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
+        """Stream the frames of a video as sequence frame views, in chunks of ``VIDEO_FRAME_CHUNK_SIZE``.
+
+        Frames are decoded, resized and encoded while the previous chunks are consumed. Copies of the views without
+        their media are added to ``views_data`` and ``frame_views_by_stem`` so that annotations can reference them.
+        ``frame_views_by_stem`` is keyed by the frame number in the source video: with ``frame_stride``, annotation
+        files name source frames, and annotations of skipped frames are dropped.
+        """
+        table_name = canonical_table_name_for_schema(view_schema)
+        chunk: list[View] = []
+        frames = iter_video_frames(
+            video_file,
+            partial(load_video_frame_media, size=self.frame_size),
+            stride=self.frame_stride,
+            num_threads=self.frame_threads,
+        )
+        for frame_index, timestamp, media in frames:
+            view = self._create_view(
+                record,
+                video_file,
+                view_name,
+                view_schema,
+                timestamp=timestamp * 1000.0,
+                frame_index=frame_index,
+                media=media,
+                view_id=f"{video_file.stem}_{frame_index}" if self.use_image_name_as_id else None,
+            )
+            chunk.append(view)
+            reference = view.model_copy(update={"raw_bytes": b"", "preview": b""})
+            views_data.append((view_name, reference))
+            source_index = frame_index * self.frame_stride
+            frame_views_by_stem[str(source_index)] = (view_name, reference, frame_index, view.timestamp)  # type: ignore[attr-defined]
+            if len(chunk) == self.VIDEO_FRAME_CHUNK_SIZE:
+                yield {table_name: chunk}
+                chunk = []
+        if chunk:
+            yield {table_name: chunk}
+
+    def _lookahead_records(self) -> int:
+        """Number of records whose media is loaded ahead of row creation when a worker pool is active."""
+        return self.PIPELINE_LOOKAHEAD if self._executor is not None else 0
+
+    def _submit_view_media(self, planned_views: list[_PlannedView]) -> list[Future | None]:
+        """Submit the file loading of planned views to the worker pool, if any."""
+        if self._executor is None:
+            return [None] * len(planned_views)
+        futures: list[Future | None] = []
+        for _view_name, view_schema, view_file, _timestamp, frame_index in planned_views:
+            if is_text(view_schema) or is_video(view_schema) or frame_index == _VIDEO_FRAMES:
+                futures.append(None)
                 continue
-            record_metadata = self._build_default_custom_metadata_record()
-            record_metadata["id"] = view_file.stem
-            record_metadata["split"] = split.name
-            record = self._create_record(**record_metadata)
-            view = self._create_view(record, view_file, view_name, view_schema)
-            yield {
-                self.record_table_name: record,
-                canonical_table_name_for_schema(view_schema): view,
-            }
+            probe = is_image(view_schema, strict=True) or is_sequence_frame(view_schema, strict=True)
+            futures.append(self._executor.submit(load_view_media, view_file, probe))
+        return futures
+
+    def _generate_data_from_metadata_rows(
+        self,
+        split_name: str,
+        rows: Iterable[tuple[int, dict[str, Any]]],
+        resume_after: int = 0,
+    ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
+        """Yield the batches of all metadata rows of a split, loading media ahead when a worker pool is active.
+
+        Args:
+            split_name: Name of the split.
+            rows: Line numbers and rows of the split metadata.
+            resume_after: Rows up to this line number are already written and are skipped.
+        """
+        pending: deque[
+            tuple[
+                int,
+                tuple[str, str] | None,
+                tuple[Record, str, dict[str, Any], list[_PlannedView]],
+                list[Future | None],
+            ]
+        ] = deque()
+        row_occurrences: Counter[str] = Counter()
+        for row_index, (line_number, dataset_piece) in enumerate(rows):
+            if line_number <= resume_after:
+                continue
+            prepared = self._prepare_metadata_row(split_name, row_index, dataset_piece)
+            sync_item = None
+            if self._sync_manifest is not None:
+                # Rows are keyed by their record id when they set one, and otherwise by their content, so that
+                # inserting or moving rows keeps the keys of the others.
+                payload = orjson.dumps(dataset_piece, option=orjson.OPT_SORT_KEYS)
+                if "id" in dataset_piece:
+                    row_key = f"id={prepared[0].id}"
+                else:
+                    row_key = hashlib.sha1(payload, usedforsecurity=False).hexdigest()
+                row_occurrences[row_key] += 1
+                sync_item = self._fingerprint_source_item(
+                    f"{split_name}/{self.METADATA_FILENAME}#{row_key}.{row_occurrences[row_key]}",
+                    [planned_view[2] for planned_view in prepared[3]],
+                    payload,
+                    prepared[0].id,
+                )
+                if sync_item is None:
+                    continue
+            pending.append((line_number, sync_item, prepared, self._submit_view_media(prepared[3])))
+            if len(pending) > self._lookahead_records():
+                line_number, sync_item, prepared, media_futures = pending.popleft()
+                yield from self._track_row(
+                    split_name, line_number, self._finish_metadata_row(prepared, media_futures), sync_item
+                )
+        while pending:
+            line_number, sync_item, prepared, media_futures = pending.popleft()
+            yield from self._track_row(
+                split_name, line_number, self._finish_metadata_row(prepared, media_futures), sync_item
+            )
+
+    def _track_row(
+        self,
+        split_name: str,
+        position: int,
+        batches: Iterable[dict[str, LanceModel | list[LanceModel]]],
+        sync_item: tuple[str, str] | None = None,
+    ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
+        """Yield the batches of one source row and move the generation cursor once its last batch is consumed.
+
+        While the row is in progress, its record is recorded as partial so that checkpoints taken by flushes inside
+        the row let a resumed build delete its partly written rows before generating it again.
+
+        In sync mode, ``sync_item`` holds the key and fingerprint of the row, which enter the manifest with the id
+        of its record once the row is written.
+        """
+        record_id: str | None = None
+        previous: dict[str, LanceModel | list[LanceModel]] | None = None
+        # Batches are yielded one step behind so that the last one of the row is known before it is yielded.
+        for batch in batches:
+            if previous is not None:
+                self._partial_record_id = record_id
+                yield previous
+            else:
+                record_id = batch[self.record_table_name].id  # type: ignore[union-attr]
+            previous = batch
+        if previous is None:
+            return
+        self._partial_record_id = None
+        self._generation_cursor = (split_name, position)
+        if sync_item is not None and record_id is not None:
+            key, fingerprint = sync_item
+            self._sync_delta.items[key] = {"fingerprint": fingerprint, "record_id": record_id}
+        yield previous
+
+    def _fingerprint_source_item(
+        self, key: str, files: list[Path], payload: bytes = b"", record_id: str | None = None
+    ) -> tuple[str, str] | None:
+        """Fingerprint a source item in sync mode and schedule the deletion of its records if it changed.
+
+        A new item that generates the record of a manifest item known under another key replaces that record.
+
+        Returns:
+            The key and fingerprint of the item, or ``None`` if the item is unchanged and must be skipped.
+        """
+        if self._sync_manifest is None:
+            raise ValueError("Source items can only be fingerprinted in mode 'sync'.")
+        fingerprint = fingerprint_source_item(files, self.sync_fingerprint, payload)
+        self._sync_seen.add(key)
+        entry = self._sync_manifest.items.get(key)
+        if entry is not None:
+            if entry["fingerprint"] == fingerprint:
+                return None
+            self._sync_delta.stale_record_ids.append(entry["record_id"])
+        elif record_id is not None and record_id in self._sync_record_ids:
+            self._sync_delta.stale_record_ids.append(record_id)
+        return key, fingerprint
+
+    def _generation_checkpoint(self) -> tuple[MetadataCheckpoint | None, SyncDelta | None] | None:
+        """Snapshot the generation cursor and the sync manifest changes since the previous flush."""
+        metadata_checkpoint = None
+        if self.checkpoint_file is not None:
+            split, position = self._generation_cursor or (None, 0)
+            metadata_checkpoint = MetadataCheckpoint(
+                completed_splits=list(self._completed_splits),
+                split=split,
+                position=position,
+                partial_record_id=self._partial_record_id,
+            )
+        sync_delta = None
+        if self._sync_manifest is not None:
+            sync_delta, self._sync_delta = self._sync_delta, SyncDelta()
+            sync_delta.partial_record_id = self._partial_record_id
+        if metadata_checkpoint is None and sync_delta is None:
+            return None
+        return metadata_checkpoint, sync_delta
+
+    def _before_checkpointed_write(
+        self, checkpoint: tuple[MetadataCheckpoint | None, SyncDelta | None], dataset: Dataset
+    ) -> None:
+        """Delete the records of changed source items, and of a row partly written by an interrupted build."""
+        if self._stale_partial_record_id is not None:
+            dataset.cascade_delete_records([self._stale_partial_record_id])
+            self._stale_partial_record_id = None
+        _, sync_delta = checkpoint
+        if sync_delta is not None and sync_delta.stale_record_ids:
+            # A record re-emitted earlier in this sync under another key must not be deleted.
+            written = self._sync_written_record_ids
+            stale_record_ids = [record_id for record_id in sync_delta.stale_record_ids if record_id not in written]
+            if stale_record_ids:
+                dataset.cascade_delete_records(stale_record_ids)
+
+    def _commit_generation_checkpoint(self, checkpoint: tuple[MetadataCheckpoint | None, SyncDelta | None]) -> None:
+        """Save the checkpoint and the sync manifest of a written batch."""
+        metadata_checkpoint, sync_delta = checkpoint
+        if metadata_checkpoint is not None and self.checkpoint_file is not None:
+            metadata_checkpoint.save(self.checkpoint_file)
+        if sync_delta is not None and self._sync_manifest is not None:
+            if not sync_delta.items and sync_delta.partial_record_id == self._sync_manifest.partial_record_id:
+                return
+            self._sync_written_record_ids.update(item["record_id"] for item in sync_delta.items.values())
+            self._sync_manifest.items.update(sync_delta.items)
+            self._sync_manifest.partial_record_id = sync_delta.partial_record_id
+            self._sync_manifest.save(self.target_dir / self.SYNC_MANIFEST_FILENAME)
+
+    def _prepare_sync(self) -> None:
+        """Load the sync manifest of the target dataset."""
+        if self.checkpoint_file is not None:
+            raise ValueError("checkpoint_file cannot be used with mode 'sync': the sync manifest tracks written rows")
+        manifest_file = self.target_dir / self.SYNC_MANIFEST_FILENAME
+        if (self.target_dir / Dataset._INFO_FILE).exists() and not manifest_file.exists():
+            raise ValueError(
+                f"Dataset {self.target_dir} has no sync manifest: only datasets first built in mode 'sync' can be "
+                "synced."
+            )
+        self._sync_manifest = SyncManifest.load(manifest_file)
+        self._sync_seen = set()
+        self._sync_record_ids = {item["record_id"] for item in self._sync_manifest.items.values()}
+        self._sync_written_record_ids = set()
+        self._sync_delta = SyncDelta()
+        self._stale_partial_record_id = self._sync_manifest.partial_record_id
+
+    def _finish_sync(self, dataset: Dataset) -> None:
+        """Delete the records of removed source items and drop them from the manifest."""
+        if self._sync_manifest is None:
+            raise ValueError("A sync can only be finished in mode 'sync'.")
+        removed_keys = [key for key in self._sync_manifest.items if key not in self._sync_seen]
+        if removed_keys:
+            # Records re-emitted during this sync under another key are kept.
+            removed_record_ids = [
+                self._sync_manifest.items[key]["record_id"]
+                for key in removed_keys
+                if self._sync_manifest.items[key]["record_id"] not in self._sync_written_record_ids
+            ]
+            if removed_record_ids:
+                dataset.cascade_delete_records(removed_record_ids)
+            for key in removed_keys:
+                del self._sync_manifest.items[key]
+        self._sync_manifest.save(self.target_dir / self.SYNC_MANIFEST_FILENAME)
+
+    def _reset_generation_state(self) -> None:
+        """Leave sync mode and forget the row being generated."""
+        self._sync_manifest = None
+        self._sync_delta = SyncDelta()
+        self._partial_record_id = None
+        self._stale_partial_record_id = None
 
     def _generate_data_from_metadata(
         self,
@@ -461,6 +866,16 @@ class FolderBaseBuilder(DatasetBuilder):
         dataset_piece: dict[str, Any],
     ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
         """Yield all batches generated from one metadata row."""
+        prepared = self._prepare_metadata_row(split_name, row_index, dataset_piece)
+        yield from self._finish_metadata_row(prepared, [None] * len(prepared[3]))
+
+    def _prepare_metadata_row(
+        self,
+        split_name: str,
+        row_index: int,
+        dataset_piece: dict[str, Any],
+    ) -> tuple[Record, str, dict[str, Any], list[_PlannedView]]:
+        """Create the record of one metadata row and resolve its view files."""
         normalized_piece = self._normalize_dataset_piece_keys(dict(dataset_piece))
         fps = normalized_piece.pop("fps", None)
         frame_period_ms = 1000.0 / (fps if fps is not None else 24.0)
@@ -472,16 +887,29 @@ class FolderBaseBuilder(DatasetBuilder):
         )
         record_metadata.setdefault("split", split_name)
         record = self._create_record(**record_metadata)
+        planned_views = self._plan_views_for_record(split_name, normalized_piece, frame_period_ms)
+        return record, split_name, normalized_piece, planned_views
 
-        views_data, frame_views_by_stem = self._create_views_for_record(
-            record, split_name, normalized_piece, frame_period_ms
-        )
-        components = self._create_components_for_record(
-            record, split_name, normalized_piece, views_data, frame_views_by_stem
-        )
+    def _finish_metadata_row(
+        self,
+        prepared: tuple[Record, str, dict[str, Any], list[_PlannedView]],
+        media_futures: list[Future | None],
+    ) -> Iterator[dict[str, LanceModel | list[LanceModel]]]:
+        """Yield the record, views and components of one prepared metadata row."""
+        record, split_name, normalized_piece, planned_views = prepared
+        media = [future.result() if future is not None else None for future in media_futures]
+        views_data, frame_views_by_stem = self._create_planned_views(record, planned_views, media)
 
         yield {self.record_table_name: record}
         yield from self._yield_view_batches(views_data)
+        for view_name, view_schema, view_file, _timestamp, frame_index in planned_views:
+            if frame_index == _VIDEO_FRAMES:
+                yield from self._generate_video_frame_views(
+                    record, view_name, view_schema, view_file, views_data, frame_views_by_stem
+                )
+        components = self._create_components_for_record(
+            record, split_name, normalized_piece, views_data, frame_views_by_stem
+        )
         combined_data = self._combine_component_data(*components)
         if combined_data:
             yield combined_data
@@ -508,8 +936,17 @@ class FolderBaseBuilder(DatasetBuilder):
         frame_period_ms: float,
     ) -> tuple[list[tuple[str, View]], dict[str, tuple[str, View, int, float]]]:
         """Create views declared in one metadata row."""
-        views_data: list[tuple[str, View]] = []
-        frame_views_by_stem: dict[str, tuple[str, View, int, float]] = {}
+        planned_views = self._plan_views_for_record(split_name, dataset_piece, frame_period_ms)
+        return self._create_planned_views(record, planned_views)
+
+    def _plan_views_for_record(
+        self,
+        split_name: str,
+        dataset_piece: dict[str, Any],
+        frame_period_ms: float,
+    ) -> list[_PlannedView]:
+        """Resolve the media files of the views declared in one metadata row."""
+        planned_views: list[_PlannedView] = []
 
         for view_name, raw_value in dataset_piece.items():
             if view_name not in self.views_schema:
@@ -523,23 +960,50 @@ class FolderBaseBuilder(DatasetBuilder):
                 for frame_index, frame_file in enumerate(frame_files):
                     if frame_file.suffix not in self.EXTENSIONS:
                         continue
+                    if self._is_video_frames_source(view_schema, frame_file):
+                        planned_views.append((view_name, view_schema, frame_file, 0.0, _VIDEO_FRAMES))
+                        continue
                     timestamp = frame_index * frame_period_ms
-                    view = self._create_view(
-                        record,
-                        frame_file,
-                        view_name,
-                        view_schema,
-                        timestamp=timestamp,
-                        frame_index=frame_index,
-                    )
-                    views_data.append((view_name, view))
-                    frame_views_by_stem[frame_file.stem] = (view_name, view, frame_index, timestamp)
+                    planned_views.append((view_name, view_schema, frame_file, timestamp, frame_index))
                 continue
 
             view_file = self._resolve_non_sequence_view_file(split_name, raw_value, view_name)
             if view_file is None or view_file.suffix not in self.EXTENSIONS:
                 continue
-            views_data.append((view_name, self._create_view(record, view_file, view_name, view_schema)))
+            planned_views.append((view_name, view_schema, view_file, 0.0, None))
+
+        return planned_views
+
+    def _create_planned_views(
+        self,
+        record: Record,
+        planned_views: list[_PlannedView],
+        media: list[dict[str, Any] | None] | None = None,
+    ) -> tuple[list[tuple[str, View]], dict[str, tuple[str, View, int, float]]]:
+        """Create the view rows of resolved media files, reusing media loaded by the worker pool."""
+        views_data: list[tuple[str, View]] = []
+        frame_views_by_stem: dict[str, tuple[str, View, int, float]] = {}
+
+        for i, (view_name, view_schema, view_file, timestamp, frame_index) in enumerate(planned_views):
+            if frame_index == _VIDEO_FRAMES:
+                continue
+            view_media = media[i] if media is not None else None
+            if frame_index is None:
+                views_data.append(
+                    (view_name, self._create_view(record, view_file, view_name, view_schema, media=view_media))
+                )
+                continue
+            view = self._create_view(
+                record,
+                view_file,
+                view_name,
+                view_schema,
+                timestamp=timestamp,
+                frame_index=frame_index,
+                media=view_media,
+            )
+            views_data.append((view_name, view))
+            frame_views_by_stem[view_file.stem] = (view_name, view, frame_index, timestamp)
 
         return views_data, frame_views_by_stem
 
@@ -649,13 +1113,20 @@ class FolderBaseBuilder(DatasetBuilder):
         view_schema: type[View],
         timestamp: float = 0.0,
         frame_index: int = 0,
+        media: dict[str, Any] | None = None,
+        view_id: str | None = None,
     ) -> View:
-        """Create one view row from a resolved media file."""
+        """Create one view row from a resolved media file.
+
+        ``media`` holds the output of :func:`load_view_media` when the file was already loaded by a worker.
+        """
         if not issubclass(view_schema, View):
             raise ValueError("View schema must be a subclass of View")
 
+        if view_id is None:
+            view_id = view_file.stem if self.use_image_name_as_id else shortuuid.uuid()
         kwargs: dict[str, Any] = {
-            "id": view_file.stem if self.use_image_name_as_id else shortuuid.uuid(),
+            "id": view_id,
             "record_id": record.id,
             "logical_name": view_name,
         }
@@ -664,11 +1135,15 @@ class FolderBaseBuilder(DatasetBuilder):
             kwargs["uri"] = str(view_file)
         elif is_video(view_schema):
             kwargs["uri"] = view_file
+        elif media is not None:
+            kwargs.update(media)
         else:
             kwargs["raw_bytes"] = view_file.read_bytes()
         if is_sequence_frame(view_schema):
             kwargs["timestamp"] = timestamp
             kwargs["frame_index"] = frame_index
+        if media is not None and "preview" in media:
+            return view_schema(**kwargs)
         return create_instance_of_schema(view_schema, **kwargs)
 
     def _create_messages(
@@ -779,44 +1254,194 @@ class FolderBaseBuilder(DatasetBuilder):
             all_annotations_data=all_annotations_data,
         )
 
-    def _read_metadata(self, metadata_file: Path) -> list[dict]:
+    def _read_metadata(
+        self,
+        metadata_file: Path,
+        split_name: str | None = None,
+        report: MetadataValidationReport | None = None,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Stream the line numbers and rows of a metadata file.
+
+        With a report, rows are validated as they are read and a ``ValueError`` is raised at the first error.
+        """
         if not metadata_file.exists():
             raise FileNotFoundError(f"Metadata file {metadata_file} not found")
-        return pa_json.read_json(metadata_file).to_pylist()
+        return self._stream_metadata(metadata_file, split_name or metadata_file.parent.name, report)
+
+    def _stream_metadata(
+        self,
+        metadata_file: Path,
+        split_name: str,
+        report: MetadataValidationReport | None,
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        rows = self._metadata_service.iter_metadata_rows(
+            metadata_file, split_name, report, self.metadata_validation_mode
+        )
+        for line_number, dataset_piece in rows:
+            self._raise_on_metadata_errors(report)
+            yield line_number, dataset_piece
+        self._raise_on_metadata_errors(report)
+
+    @staticmethod
+    def _raise_on_metadata_errors(report: MetadataValidationReport | None) -> None:
+        if report is None or report.is_valid:
+            return
+        code, issue = next(iter(report.errors.items()))
+        raise ValueError(
+            f"Metadata validation failed at {issue.samples[0]} ({code}). "
+            "Run the CLI with --dry-run to inspect the validation summary."
+        )
 
     def _build_default_custom_metadata_record(self) -> dict[str, Any]:
         """Create default values for custom record fields."""
         return self._record_factory.build_default_custom_metadata_record()
 
 
-def extract_video_frames(
-    video_path: Path, format: str = "JPEG", quality: int = 85
-) -> Iterator[tuple[int, float, bytes]]:
-    """Extract frames from a video as compressed image bytes.
+def encode_video_frame(
+    frame: np.ndarray, format: str = "JPEG", quality: int = 85, size: tuple[int, int] | None = None
+) -> bytes:
+    """Resize a decoded BGR video frame and compress it.
 
     Args:
-        video_path: Path to the video file.
+        frame: Frame decoded by OpenCV.
         format: Output image format (e.g., "JPEG", "PNG").
         quality: JPEG quality (1-100). Only used for JPEG format.
+        size: Target (width, height). Defaults to the frame resolution.
+
+    Returns:
+        The compressed image bytes.
+    """
+    import cv2
+
+    if size is not None and (frame.shape[1], frame.shape[0]) != tuple(size):
+        frame = cv2.resize(frame, tuple(size), interpolation=cv2.INTER_AREA)
+    encode_params = [cv2.IMWRITE_JPEG_QUALITY, quality] if format.upper() == "JPEG" else []
+    success, buffer = cv2.imencode(f".{format.lower()}", frame, encode_params)
+    if not success:
+        raise ValueError(f"Could not encode a video frame as {format}")
+    return buffer.tobytes()
+
+
+def load_video_frame_media(
+    frame: np.ndarray, format: str = "JPEG", quality: int = 85, size: tuple[int, int] | None = None
+) -> dict[str, Any]:
+    """Build the media fields of a ``SequenceFrame`` from a decoded BGR video frame.
+
+    The preview is resized from the decoded frame, so the compressed frame is never decoded again.
+
+    Args:
+        frame: Frame decoded by OpenCV.
+        format: Output image format (e.g., "JPEG", "PNG").
+        quality: JPEG quality (1-100). Only used for JPEG format.
+        size: Target (width, height). Defaults to the frame resolution.
+
+    Returns:
+        The same fields as :func:`load_view_media` with ``probe`` set.
+    """
+    import cv2
+
+    raw_bytes = encode_video_frame(frame, format, quality, size)
+    width, height = size if size is not None else (frame.shape[1], frame.shape[0])
+    scale = min(64 / width, 64 / height, 1.0)
+    thumbnail = cv2.resize(
+        frame,
+        (max(1, round(frame.shape[1] * scale)), max(1, round(frame.shape[0] * scale))),
+        interpolation=cv2.INTER_AREA,
+    )
+    return {
+        "raw_bytes": raw_bytes,
+        "width": width,
+        "height": height,
+        "format": format.upper(),
+        "preview": cv2.imencode(".png", thumbnail)[1].tobytes(),
+        "preview_format": "png",
+    }
+
+
+def iter_video_frames(
+    video_path: Path,
+    encode: Callable[[np.ndarray], _T],
+    stride: int = 1,
+    num_threads: int = 0,
+) -> Iterator[tuple[int, float, _T]]:
+    """Decode the frames of a video and encode them, in order.
+
+    Frames are decoded on the calling thread. With threads, up to ``2 * num_threads`` decoded frames are encoded
+    concurrently, which bounds the number of frames held in memory.
+
+    Args:
+        video_path: Path to the video file.
+        encode: Function turning a decoded BGR frame into the yielded value. It must be thread-safe.
+        stride: Keep one frame out of ``stride``. Skipped frames are grabbed but not decoded.
+        num_threads: Threads encoding frames. With 0, frames are encoded on the calling thread.
 
     Yields:
-        Tuples of (frame_index, timestamp_seconds, image_bytes).
+        Tuples of (frame_index, timestamp_seconds, encoded_frame), where frame_index counts the kept frames and
+        the timestamp is the one of the frame in the video.
     """
     import cv2
 
+    if stride <= 0:
+        raise ValueError(f"stride should be greater than 0 but got {stride}")
+
     cap = cv2.VideoCapture(str(video_path))
     fps = cap.get(cv2.CAP_PROP_FPS)
     if fps <= 0:
         fps = 30.0  # fallback
-    idx = 0
-    while cap.isOpened():
-        ret, frame = cap.read()
-        if not ret:
-            break
-        encode_params = []
-        if format.upper() == "JPEG":
-            encode_params = [cv2.IMWRITE_JPEG_QUALITY, quality]
-        _, buffer = cv2.imencode(f".{format.lower()}", frame, encode_params)
-        yield idx, idx / fps, buffer.tobytes()
-        idx += 1
-    cap.release()
+    executor = ThreadPoolExecutor(max_workers=num_threads) if num_threads > 0 else None
+    pending: deque[tuple[int, float, Future]] = deque()
+    try:
+        source_index = 0
+        frame_index = 0
+        while cap.isOpened():
+            if source_index % stride:
+                if not cap.grab():
+                    break
+                source_index += 1
+                continue
+            ret, frame = cap.read()
+            if not ret:
+                break
+            timestamp = source_index / fps
+            if executor is None:
+                yield frame_index, timestamp, encode(frame)
+            else:
+                pending.append((frame_index, timestamp, executor.submit(encode, frame)))
+                if len(pending) >= 2 * num_threads:
+                    index, time, future = pending.popleft()
+                    yield index, time, future.result()
+            frame_index += 1
+            source_index += 1
+        while pending:
+            index, time, future = pending.popleft()
+            yield index, time, future.result()
+    finally:
+        cap.release()
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+def extract_video_frames(
+    video_path: Path,
+    format: str = "JPEG",
+    quality: int = 85,
+    stride: int = 1,
+    size: tuple[int, int] | None = None,
+    num_threads: int = 0,
+) -> Iterator[tuple[int, float, bytes]]:
+    """Extract frames from a video as compressed image bytes.
+
+    Args:
+        video_path: Path to the video file.
+        format: Output image format (e.g., "JPEG", "PNG").
+        quality: JPEG quality (1-100). Only used for JPEG format.
+        stride: Keep one frame out of ``stride``.
+        size: Target (width, height) of the frames. Defaults to the video resolution.
+        num_threads: Threads resizing and encoding frames while the next ones are decoded.
+
+    Yields:
+        Tuples of (frame_index, timestamp_seconds, image_bytes).
+    """
+    yield from iter_video_frames(
+        video_path, partial(encode_video_frame, format=format, quality=quality, size=size), stride, num_threads
+    )
@@ -10,9 +10,11 @@ import json
 import re
 import unicodedata
 from collections import defaultdict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
+
+import orjson
 
 from pixano.schemas import canonical_table_name_for_slot
 
@@ -109,6 +111,41 @@ class MetadataValidationReport:
             self.normalized_examples.append(description)
 
 
+@dataclass
+class MetadataCheckpoint:
+    """Position of the last source row whose data is written, used to resume an interrupted folder import.
+
+    Attributes:
+        completed_splits: Splits whose rows are all written.
+        split: Split of the last written row.
+        position: Line number of the last written row in the split ``metadata.jsonl``, or 1-based index of the
+            last written media file for splits without metadata.
+        partial_record_id: Record of the next row when its rows are only partly written, deleted on resume.
+    """
+
+    completed_splits: list[str] = field(default_factory=list)
+    split: str | None = None
+    position: int = 0
+    partial_record_id: str | None = None
+
+    def resume_position(self, split_name: str) -> int:
+        """Return the position after which rows of a split still have to be generated."""
+        return self.position if split_name == self.split else 0
+
+    @classmethod
+    def load(cls, path: Path) -> MetadataCheckpoint:
+        """Load a checkpoint, or return an empty one if the file does not exist."""
+        if not path.exists():
+            return cls()
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, path: Path) -> None:
+        """Atomically write the checkpoint."""
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(json.dumps(asdict(self)), encoding="utf-8")
+        tmp_path.replace(path)
+
+
 class FolderMetadataService:
     """Normalizes and validates ``metadata.jsonl`` rows for folder imports."""
 
@@ -332,30 +369,62 @@ class FolderMetadataService:
     def preflight_metadata(self, validation_mode: str) -> MetadataValidationReport:
         """Validate every metadata row found in the source directory."""
         report = MetadataValidationReport()
-        for split in self.source_dir.glob("*"):
+        for split in sorted(self.source_dir.glob("*")):
             if not split.is_dir() or split.name.startswith("."):
                 continue
             report.split_count += 1
             metadata_file = split / self.metadata_filename
             if not metadata_file.exists():
                 continue
-            with metadata_file.open("r", encoding="utf-8") as handle:
-                for line_number, raw_line in enumerate(handle, start=1):
-                    stripped_line = raw_line.strip()
-                    if not stripped_line:
-                        continue
-                    report.row_count += 1
-                    try:
-                        dataset_piece = json.loads(stripped_line)
-                    except json.JSONDecodeError:
-                        report.add_error("invalid_jsonl", f"{split.name}:{line_number}")
-                        continue
-                    if not isinstance(dataset_piece, dict):
-                        report.add_error("invalid_metadata_row", f"{split.name}:{line_number}")
-                        continue
-                    self.validate_dataset_piece(dataset_piece, split.name, line_number, report, validation_mode)
+            for _ in self.iter_metadata_rows(metadata_file, split.name, report, validation_mode):
+                pass
         return report
 
+    def iter_metadata_rows(
+        self,
+        metadata_file: Path,
+        split_name: str,
+        report: MetadataValidationReport | None = None,
+        validation_mode: str = "default",
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """Stream the rows of a ``metadata.jsonl`` file, one line at a time.
+
+        With a report, each row is validated as it is read and malformed rows are recorded as errors and skipped.
+        Without a report, rows are only parsed and a malformed row raises.
+
+        Args:
+            metadata_file: Path of the ``metadata.jsonl`` file.
+            split_name: Split the file belongs to, used for issue locations.
+            report: Report aggregating the validation issues.
+            validation_mode: Metadata validation mode ("default" or "strict").
+
+        Returns:
+            An iterator over the line numbers and rows of the file.
+        """
+        with metadata_file.open("rb") as handle:
+            for line_number, raw_line in enumerate(handle, start=1):
+                stripped_line = raw_line.strip()
+                if not stripped_line:
+                    continue
+                location = f"{split_name}:{line_number}"
+                if report is not None:
+                    report.row_count += 1
+                try:
+                    dataset_piece = orjson.loads(stripped_line)
+                except orjson.JSONDecodeError as error:
+                    if report is None:
+                        raise ValueError(f"Invalid JSON in metadata row {location}") from error
+                    report.add_error("invalid_jsonl", location)
+                    continue
+                if not isinstance(dataset_piece, dict):
+                    if report is None:
+                        raise ValueError(f"Metadata row {location} is not a JSON object")
+                    report.add_error("invalid_metadata_row", location)
+                    continue
+                if report is not None:
+                    self.validate_dataset_piece(dataset_piece, split_name, line_number, report, validation_mode)
+                yield line_number, dataset_piece
+
     def _known_top_level_keys(self) -> set[str]:
         return (
             set(self.record_field_names)
@@ -16,6 +16,7 @@ import numpy as np
 import PIL.Image
 import shortuuid
 
+from pixano.features.utils.image import label_image_to_rles
 from pixano.schemas import (
     CompressedRLE,
     Entity,
@@ -33,6 +34,20 @@ from pixano.schemas.annotations.compressed_rle import is_compressed_rle
 from .factories import AnnotationSource
 
 
+def _find_frame_view(
+    frame_views_by_stem: dict[str, tuple[str, View, int, float]], stem: str
+) -> tuple[str, View, int, float] | None:
+    """Find the frame view of an annotation file stem.
+
+    Frames extracted from a video are keyed by their frame number in the source video, so zero-padded numeric stems
+    also match them.
+    """
+    frame_info = frame_views_by_stem.get(stem)
+    if frame_info is None and stem.isdigit():
+        frame_info = frame_views_by_stem.get(str(int(stem)))
+    return frame_info
+
+
 @dataclass(frozen=True)
 class TemporalSchemaResolver:
     """Resolve schemas used by temporal annotation processors."""
@@ -145,7 +160,11 @@ class MaskTrackProcessor:
         all_entity_dynamic_states_data: dict[str, list[EntityDynamicState]],
         all_annotations_data: dict[str, list[RecordComponent]],
     ) -> None:
-        """Populate temporal rows from mask glob annotations."""
+        """Populate temporal rows from mask glob annotations.
+
+        Each indexed mask file is a label image where pixel values are object ids (0 is background). Frames are
+        streamed: one label image is held in memory at a time and decomposed into one RLE per object present.
+        """
         for annotation_key, annotation_schema in self.annotations_schema.items():
             if not is_compressed_rle(annotation_schema):
                 continue
@@ -162,54 +181,44 @@ class MaskTrackProcessor:
             if not mask_files:
                 continue
 
-            frame_masks: list[tuple[np.ndarray, str, View, int, float]] = []
-            all_object_ids: set[int] = set()
-
-            for mask_file in mask_files:
-                frame_info = frame_views_by_stem.get(mask_file.stem)
-                if frame_info is None:
-                    continue
-                view_name, view, frame_index, timestamp = frame_info
-
-                mask_img = PIL.Image.open(mask_file)
-                mask_array = np.array(mask_img)
-
-                unique_ids = set(np.unique(mask_array).tolist())
-                unique_ids.discard(0)
-                all_object_ids.update(unique_ids)
-                frame_masks.append((mask_array, view_name, view, frame_index, timestamp))
-
-            if not all_object_ids:
-                continue
-
             entity_name, entity_schema = self.schema_resolver.resolve_tracking_entity_schema()
             state_name, state_schema = self.schema_resolver.resolve_entity_dynamic_state_schema()
             tracklet_table_name = canonical_table_name_for_slot("tracklet")
             has_tracklets = tracklet_table_name in self.annotations_schema
 
             object_entities: dict[int, Entity] = {}
-            for obj_id in sorted(all_object_ids):
-                if entity_name is None or entity_schema is None:
-                    break
-                entity = self.row_factory.create_tracking_entity(record, entity_schema=entity_schema, object_id=obj_id)
-                all_entities_data[entity_name].append(entity)
-                object_entities[obj_id] = entity
+            object_tracklet_ids: dict[int, str] = {}
+            # First and last appearance of each object as (frame_index, timestamp)
+            object_extents: dict[int, tuple[tuple[int, float], tuple[int, float]]] = {}
+            seq_view_name: str | None = None
 
-            object_tracklet_ids = {
-                obj_id: shortuuid.uuid()
-                for obj_id in sorted(all_object_ids)
-                if has_tracklets and obj_id in object_entities
-            }
-            object_appearances: dict[int, list[tuple[int, float]]] = defaultdict(list)
+            # Masks are decoded and decomposed one frame at a time
+            for mask_file in mask_files:
+                frame_info = _find_frame_view(frame_views_by_stem, mask_file.stem)
+                if frame_info is None:
+                    continue
+                view_name, view, frame_index, timestamp = frame_info
 
-            for mask_array, _view_name, view, frame_index, timestamp in frame_masks:
-                for obj_id in sorted(all_object_ids):
-                    binary_mask = (mask_array == obj_id).astype(np.uint8)
-                    if binary_mask.sum() == 0:
-                        continue
+                with PIL.Image.open(mask_file) as mask_img:
+                    object_rles = label_image_to_rles(np.asarray(mask_img))
+                if seq_view_name is None:
+                    seq_view_name = view_name
+
+                for obj_id, rle in object_rles.items():
+                    entity = object_entities.get(obj_id)
+                    if entity is None and entity_name is not None and entity_schema is not None:
+                        entity = self.row_factory.create_tracking_entity(
+                            record, entity_schema=entity_schema, object_id=obj_id
+                        )
+                        all_entities_data[entity_name].append(entity)
+                        object_entities[obj_id] = entity
+                        if has_tracklets:
+                            object_tracklet_ids[obj_id] = shortuuid.uuid()
+
+                    appearance = (frame_index, timestamp)
+                    first, last = object_extents.get(obj_id, (appearance, appearance))
+                    object_extents[obj_id] = (min(first, appearance), max(last, appearance))
 
-                    object_appearances[obj_id].append((frame_index, timestamp))
-                    entity = object_entities.get(obj_id)  # type: ignore[assignment]
                     entity_id = entity.id if entity else ""
                     tracklet_id = object_tracklet_ids.get(obj_id, "")
                     entity_dynamic_state_id = ""
@@ -227,33 +236,31 @@ class MaskTrackProcessor:
                         all_entity_dynamic_states_data[state_name].append(entity_dynamic_state)
                         entity_dynamic_state_id = entity_dynamic_state.id
 
-                    rle = CompressedRLE.from_mask(
-                        binary_mask,
-                        id=shortuuid.uuid(),
-                        record_id=record.id,
-                        view_id=view.id,
-                        frame_id=view.id,
-                        frame_index=frame_index,
-                        entity_id=entity_id,
-                        source_type=self.row_factory.source.source_type,
-                        source_name=self.row_factory.source.source_name,
-                        tracklet_id=tracklet_id,
-                        entity_dynamic_state_id=entity_dynamic_state_id,
+                    all_annotations_data[annotation_key].append(
+                        CompressedRLE(
+                            size=rle["size"],
+                            counts=rle["counts"],
+                            id=shortuuid.uuid(),
+                            record_id=record.id,
+                            view_id=view.id,
+                            frame_id=view.id,
+                            frame_index=frame_index,
+                            entity_id=entity_id,
+                            source_type=self.row_factory.source.source_type,
+                            source_name=self.row_factory.source.source_name,
+                            tracklet_id=tracklet_id,
+                            entity_dynamic_state_id=entity_dynamic_state_id,
+                        )
                     )
-                    all_annotations_data[annotation_key].append(rle)
 
-            if has_tracklets and frame_masks:
-                seq_view_name = frame_masks[0][1]
-                for obj_id, appearances in object_appearances.items():
+            if has_tracklets and seq_view_name is not None:
+                for obj_id, ((start_idx, start_ts), (end_idx, end_ts)) in object_extents.items():
                     entity = object_entities.get(obj_id)  # type: ignore[assignment]
                     if entity is None:
                         continue
-                    appearances.sort()
-                    start_idx, start_ts = appearances[0]
-                    end_idx, end_ts = appearances[-1]
 
                     tracklet = Tracklet(
-                        id=object_tracklet_ids.get(obj_id, shortuuid.uuid()),
+                        id=object_tracklet_ids[obj_id],
                         record_id=record.id,
                         view_name=seq_view_name,
                         entity_id=entity.id,
@@ -363,7 +370,7 @@ class BBoxTrackProcessor:
 
             default_view_name = ""
             for stem, data in file_data:
-                frame_info = frame_views_by_stem.get(stem)
+                frame_info = _find_frame_view(frame_views_by_stem, stem)
                 if frame_info is None:
                     continue
 
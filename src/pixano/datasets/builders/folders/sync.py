@@ -0,0 +1,84 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Literal
+
+
+FingerprintMethod = Literal["stat", "content"]
+
+
+def fingerprint_source_item(files: list[Path], method: FingerprintMethod, payload: bytes = b"") -> str:
+    """Fingerprint a source item from its files and its metadata payload.
+
+    Args:
+        files: Media files of the item.
+        method: ``"stat"`` hashes the size and modification time of the files, ``"content"`` hashes their bytes.
+        payload: Serialized metadata of the item.
+
+    Returns:
+        Hexadecimal digest of the item.
+    """
+    digest = hashlib.sha1(payload, usedforsecurity=False)
+    for file in files:
+        digest.update(str(file).encode())
+        if method == "content":
+            with file.open("rb") as handle:
+                for chunk in iter(lambda: handle.read(1 << 20), b""):
+                    digest.update(chunk)
+        else:
+            stat = file.stat()
+            digest.update(f":{stat.st_size}:{stat.st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class SyncManifest:
+    """Fingerprints of the source items imported in a dataset, used by builds in ``"sync"`` mode.
+
+    Attributes:
+        items: Source item key mapped to its ``fingerprint`` and the ``record_id`` generated from it.
+        partial_record_id: Record of a source item whose rows are only partly written, deleted by the next sync.
+    """
+
+    items: dict[str, dict[str, str]] = field(default_factory=dict)
+    partial_record_id: str | None = None
+
+    @classmethod
+    def load(cls, path: Path) -> SyncManifest:
+        """Load a manifest, or return an empty one if the file does not exist."""
+        if not path.exists():
+            return cls()
+        return cls(**json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self, path: Path) -> None:
+        """Atomically write the manifest."""
+        tmp_path = path.with_name(f"{path.name}.tmp")
+        tmp_path.write_text(
+            json.dumps({"items": self.items, "partial_record_id": self.partial_record_id}), encoding="utf-8"
+        )
+        tmp_path.replace(path)
+
+
+@dataclass
+class SyncDelta:
+    """Manifest changes covered by one flushed batch.
+
+    Attributes:
+        items: Generated source items, with the same layout as ``SyncManifest.items``.
+        stale_record_ids: Records generated from a previous version of a changed item, deleted before the batch
+            is written.
+        partial_record_id: Record of the source item whose rows are only partly covered by the batch.
+    """
+
+    items: dict[str, dict[str, str]] = field(default_factory=dict)
+    stale_record_ids: list[str] = field(default_factory=list)
+    partial_record_id: str | None = None
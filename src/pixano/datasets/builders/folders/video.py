@@ -4,6 +4,8 @@
 # License: CECILL-C
 # =====================================
 
+from typing import Any
+
 from pixano.datasets import DatasetInfo
 from pixano.datasets.workspaces import WorkspaceType
 from pixano.schemas import BBox, Entity, EntityDynamicState, KeyPoints, Record, SequenceFrame, Tracklet
@@ -25,9 +27,14 @@ VIDEO_EXTENSIONS = [
 
 
 class VideoFolderBuilder(FolderBaseBuilder):
-    """Builder for video datasets stored in a folder."""
+    """Builder for video datasets stored in a folder.
+
+    Sequence frame views can be given as image files or as video files, whose frames are extracted and streamed
+    into the sequence frame table.
+    """
 
     EXTENSIONS = VIDEO_EXTENSIONS + IMAGE_EXTENSIONS
+    VIDEO_EXTENSIONS = VIDEO_EXTENSIONS
     DEFAULT_INFO = DatasetInfo(
         workspace=WorkspaceType.VIDEO,
         record=Record,
@@ -38,3 +45,31 @@ class VideoFolderBuilder(FolderBaseBuilder):
         tracklet=Tracklet,
         views={"image": SequenceFrame},
     )
+
+    def __init__(
+        self,
+        *args: Any,
+        frame_stride: int = 1,
+        frame_size: tuple[int, int] | None = None,
+        frame_threads: int = 2,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the builder.
+
+        Args:
+            args: Positional arguments of [FolderBaseBuilder][pixano.datasets.builders.folders.FolderBaseBuilder].
+            frame_stride: Keep one frame out of ``frame_stride`` when extracting the frames of a video.
+            frame_size: If provided, (width, height) the extracted frames are resized to.
+            frame_threads: Threads encoding extracted frames. With 0, frames are encoded while decoding.
+            kwargs: Keyword arguments of [FolderBaseBuilder][pixano.datasets.builders.folders.FolderBaseBuilder].
+        """
+        if frame_stride <= 0:
+            raise ValueError(f"frame_stride should be greater than 0 but got {frame_stride}")
+        if frame_size is not None and min(frame_size) <= 0:
+            raise ValueError(f"frame_size should contain positive values but got {frame_size}")
+        if frame_threads < 0:
+            raise ValueError(f"frame_threads should be positive but got {frame_threads}")
+        super().__init__(*args, **kwargs)
+        self.frame_stride = frame_stride
+        self.frame_size = frame_size
+        self.frame_threads = frame_threads
@@ -7,10 +7,14 @@
 from __future__ import annotations
 
 import io
+import logging
+import threading
 from collections import defaultdict
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Literal, Union, cast, overload
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator, List, Literal, Union, cast, overload
 
 import lancedb
 import PIL.Image
@@ -20,13 +24,16 @@ import shortuuid
 from lancedb.common import DATA
 from lancedb.pydantic import LanceModel
 from lancedb.table import LanceTable
+from pydantic import BaseModel
 
 from pixano.datasets.queries import TableQueryBuilder
+from pixano.datasets.utils.blob_store import BlobStore, blob_uri, parse_blob_uri
 from pixano.datasets.utils.errors import DatasetAccessError, DatasetPaginationError
 from pixano.datasets.utils.integrity import (
     IntegrityCheck,
     check_table_integrity,
     handle_integrity_errors,
+    validate_arrow_batch,
     validate_batch,
 )
 from pixano.features.utils.image import create_mosaic, image_to_base64
@@ -46,12 +53,34 @@ from pixano.utils.python import to_sql_list, unique_list
 from .dataset_features_values import Constraint, ConstraintDict, DatasetFeaturesValues, TableName
 from .dataset_info import DatasetInfo
 from .dataset_stat import DatasetStatistic
+from .library_catalog import LibraryCatalog
 
 
 if TYPE_CHECKING:
     pass
 
 
+logger = logging.getLogger(__name__)
+
+# Single worker folding the rows written to tables into their indexes, off the write path
+_index_refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pixano-index-refresh")
+# Tables whose index refresh is queued or running, so that a table is only refreshed once at a time
+_pending_index_refreshes: set[str] = set()
+_pending_index_refreshes_lock = threading.Lock()
+
+
+def _refresh_table_indexes(db_path: Path, table_name: str, key: str) -> None:
+    """Fold the unindexed rows of a table into its indexes and compact it."""
+    try:
+        lancedb.connect(db_path).open_table(table_name).optimize()
+    except Exception:
+        # The refresh is best effort: the rows stay searchable and the next optimize folds them
+        logger.warning("Failed to refresh the indexes of table %s in %s", table_name, db_path, exc_info=True)
+    finally:
+        with _pending_index_refreshes_lock:
+            _pending_index_refreshes.discard(key)
+
+
 def _combine_where_clauses(*clauses: str | None) -> str | None:
     filtered = [clause for clause in clauses if clause]
     return " AND ".join(filtered) if filtered else None
@@ -81,6 +110,21 @@ def _validate_ids_record_ids_and_limit_and_skip(
         raise DatasetPaginationError("limit and skip must be non-negative integers")
 
 
+@dataclass
+class TableCacheStats:
+    """Counters of the table-handle cache of a :class:`Dataset`.
+
+    Attributes:
+        hits: Number of `open_table` calls served from the cache.
+        misses: Number of `open_table` calls that opened the table from LanceDB.
+        invalidations: Number of cached handles dropped.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
 def _validate_raise_or_warn(raise_or_warn: str) -> None:
     """Validate the raise_or_warn argument."""
     if raise_or_warn not in ("raise", "warn", "none"):
@@ -97,12 +141,27 @@ class Dataset:
     named ``"record"`` and its schema must inherit from :class:`Record`.  All
     auxiliary tables must have schemas that inherit from :class:`RecordComponent`.
 
+    Table handles returned by :meth:`open_table` are cached for the lifetime of the dataset. Writes made through
+    the dataset are visible to its handles. A handle is moved to the latest version of its table when the
+    table version directory changed, which picks up the versions written by other processes on local
+    storage. Object stores have no directory modification times: call :meth:`invalidate_table_cache` to read
+    the versions written elsewhere.
+
+    The dataset maintains the scalar indexes declared by
+    [DatasetInfo.scalar_index_columns][pixano.datasets.DatasetInfo.scalar_index_columns]: they are created
+    on the first write to a table that lacks them. New rows are folded into them by :meth:`optimize`, and by a
+    background thread every ``_INDEX_REFRESH_ROWS`` rows written through the dataset. Until then, filters scan
+    the unindexed rows.
+
     Attributes:
         path: Path to the dataset.
         info: Dataset info (including table→schema mapping).
         features_values: Dataset features values.
         stats: Dataset statistics.
         thumbnail: Dataset thumbnail base 64 URL.
+        table_cache_stats: Hit/miss counters of the table-handle cache.
+        blob_store: Content-addressed store holding the view media of datasets whose ``storage_mode`` is
+            ``"content_addressed"``.
     """
 
     _DB_PATH: str = "db"
@@ -111,6 +170,14 @@ class Dataset:
     _FEATURES_VALUES_FILE: str = "features_values.json"
     _STAT_FILE: str = "stats.json"
     _THUMB_FILE: str = "preview.png"
+    _BLOB_STORE_PATH: str = "media"
+    _MEDIA_BLOB_COLUMNS: tuple[str, ...] = ("raw_bytes", "preview")
+    _SEMANTIC_SEARCH_OVERFETCH: int = 4
+    _SEMANTIC_SEARCH_MIN_FETCH: int = 64
+    _DELETE_CHUNK_SIZE: int = 10_000
+    _TEMPORAL_READ_BATCH_SIZE: int = 8
+    _INDEX_REFRESH_ROWS: int | None = 100_000
+    _BLOB_PRUNE_GRACE_PERIOD: timedelta = timedelta(hours=1)
 
     path: Path
     info: DatasetInfo
@@ -137,9 +204,15 @@ class Dataset:
         self.stats = DatasetStatistic.from_json(self._stat_file) if self._stat_file.is_file() else []
         self.thumbnail = self._thumb_file
         self.previews_path = self.path / self._PREVIEWS_PATH
+        self.blob_store = BlobStore(self.path / self._BLOB_STORE_PATH)
 
         self._db_connection = self._connect()
         self._num_rows_cache: int | None = None
+        self._table_handles: dict[str, LanceTable] = {}
+        self._table_versions_mtimes: dict[str, int | None] = {}
+        self.table_cache_stats = TableCacheStats()
+        self._indexed_tables: set[str] = set()
+        self._unindexed_rows: dict[str, int] = {}
 
     # ------------------------------------------------------------------
     # Factory
@@ -270,11 +343,12 @@ class Dataset:
         pil_images = []
         table = self.open_table(image_table_name)
         columns = ["id"]
-        if "raw_bytes" in table.schema.names:
-            columns.append("raw_bytes")
+        for column_name in ("raw_bytes", "uri"):
+            if column_name in table.schema.names:
+                columns.append(column_name)
         rows = TableQueryBuilder(table, self._db_connection).select(columns).limit(4).to_list()
         for row in rows:
-            blob = row.get("raw_bytes", b"")
+            blob = row.get("raw_bytes", b"") or self._read_stored_media(row.get("uri", ""))
             if blob:
                 try:
                     pil_images.append(PIL.Image.open(io.BytesIO(blob)))
@@ -341,11 +415,18 @@ class Dataset:
             fill_value=fill_value,
             embedding_functions=None,
         )
+        self.invalidate_table_cache([name])
+        self._table_handles[name] = table
+        self._table_versions_mtimes[name] = self._table_versions_mtime(name)
 
         # Register in info and persist
         self.info.tables[name] = schema
         self.info.to_json(self._info_file)
 
+        self._indexed_tables.discard(name)
+        self._unindexed_rows.pop(name, None)
+        if data is not None:
+            self._ensure_scalar_indexes(name, table)
         return table
 
     def _override_blob_columns_schema(self, table_name: str, schema: type[LanceModel]) -> pa.Schema | None:
@@ -369,12 +450,15 @@ class Dataset:
                 modified = True
         return arrow_schema if modified else None
 
-    def _get_blob_columns(self, table_name: str, schema: type[LanceModel] | None = None) -> set[str]:
+    def _get_blob_columns(
+        self, table_name: str, schema: type[LanceModel] | None = None, include_media: bool = False
+    ) -> set[str]:
         """Get blob column names for a table.
 
         Args:
             table_name: The table name.
             schema: Optional schema class (looked up from info.tables if not provided).
+            include_media: Whether to include the binary media columns of views (``raw_bytes``, ``preview``).
 
         Returns:
             Set of blob column names.
@@ -383,7 +467,8 @@ class Dataset:
             schema = self.info.tables.get(table_name)
         if schema is None:
             return set()
-        return {"blob"} if "blob" in schema.model_fields else set()
+        blob_names = ("blob", *self._MEDIA_BLOB_COLUMNS) if include_media else ("blob",)
+        return {name for name in blob_names if name in schema.model_fields}
 
     def open_tables(self, names: list[str] | None = None, exclude_embeddings: bool = True) -> dict[str, LanceTable]:
         """Open the dataset tables with LanceDB.
@@ -408,6 +493,10 @@ class Dataset:
     def open_table(self, name: str) -> LanceTable:
         """Open a dataset table with LanceDB.
 
+        The handle is cached, so the table manifest is only read and the embedding function only resolved
+        the first time a table is opened. A cached handle is checked out to the latest version of the table
+        when the table version directory changed since it was last used.
+
         Args:
             name: Name of the table to open.
 
@@ -417,6 +506,17 @@ class Dataset:
         if name not in self.info.tables:
             raise DatasetAccessError(f"Table {name} not found in dataset")
 
+        table = self._table_handles.get(name)
+        if table is not None:
+            self.table_cache_stats.hits += 1
+            versions_mtime = self._table_versions_mtime(name)
+            if versions_mtime is not None and versions_mtime != self._table_versions_mtimes.get(name):
+                table.checkout_latest()
+                self._table_versions_mtimes[name] = versions_mtime
+            return table
+        self.table_cache_stats.misses += 1
+        versions_mtime = self._table_versions_mtime(name)
+
         table = self._db_connection.open_table(name)
 
         schema_table = self.info.tables[name]
@@ -426,8 +526,103 @@ class Dataset:
                 schema_table.get_embedding_fn_from_table(self, name, table.schema.metadata)
             except TypeError:  # no embedding function
                 pass
+        self._table_handles[name] = table
+        self._table_versions_mtimes[name] = versions_mtime
         return table
 
+    def _table_versions_mtime(self, name: str) -> int | None:
+        """Return the modification time of the version directory of a table, or None if it is unavailable."""
+        try:
+            return (self._db_path / f"{name}.lance" / "_versions").stat().st_mtime_ns
+        except (OSError, ValueError):
+            return None
+
+    def _ensure_scalar_indexes(self, table_name: str, table: LanceTable | None = None) -> list[str]:
+        """Create the scalar indexes declared for a table that are missing or of another type.
+
+        Columns holding another kind of index, such as a full-text one, are left untouched.
+
+        Args:
+            table_name: Table name.
+            table: Handle of the table. If None, the table is opened.
+
+        Returns:
+            Columns whose index was created.
+        """
+        if table is None:
+            table = self.open_table(table_name)
+        existing = {
+            index.columns[0]: index.index_type.upper() for index in table.list_indices() if len(index.columns) == 1
+        }
+        created: list[str] = []
+        for column, index_type in self.info.scalar_index_columns(table_name).items():
+            current = existing.get(column)
+            if current == index_type or current not in (None, "BTREE", "BITMAP"):
+                continue
+            table.create_scalar_index(column, index_type=index_type, replace=current is not None)
+            created.append(column)
+        self._indexed_tables.add(table_name)
+        return created
+
+    def _track_written_rows(self, table_name: str, table: LanceTable, num_rows: int) -> None:
+        """Keep the scalar indexes of a table up to date after rows were written to it.
+
+        The indexes are created on the first write, and the rows are folded into them in the background once
+        ``_INDEX_REFRESH_ROWS`` rows were written.
+        """
+        if table_name not in self._indexed_tables:
+            self._ensure_scalar_indexes(table_name, table)
+        if self._INDEX_REFRESH_ROWS is None:
+            return
+        pending = self._unindexed_rows.get(table_name, 0) + num_rows
+        if pending >= self._INDEX_REFRESH_ROWS:
+            self._submit_index_refresh(table_name)
+            pending = 0
+        self._unindexed_rows[table_name] = pending
+
+    def _submit_index_refresh(self, table_name: str) -> None:
+        """Queue the refresh of the indexes of a table, unless one is already queued for it."""
+        key = str(self._db_path / table_name)
+        with _pending_index_refreshes_lock:
+            if key in _pending_index_refreshes:
+                return
+            _pending_index_refreshes.add(key)
+        _index_refresh_executor.submit(_refresh_table_indexes, self._db_path, table_name, key)
+
+    def optimize(
+        self, table_names: list[str] | None = None, cleanup_older_than: timedelta | None = None
+    ) -> dict[str, list[str]]:
+        """Create the missing scalar indexes of tables, fold their new rows into their indexes and compact them.
+
+        Args:
+            table_names: Tables to optimize. If None, optimize all tables.
+            cleanup_older_than: Delete the table versions older than this age. If None, LanceDB's default
+                retention applies.
+
+        Returns:
+            Table names mapped to the columns whose index was created.
+        """
+        # Wait for the background refreshes, whose commits would conflict with the compaction
+        _index_refresh_executor.submit(lambda: None).result()
+        created: dict[str, list[str]] = {}
+        for table_name in table_names if table_names is not None else list(self.info.tables):
+            table = self.open_table(table_name)
+            created[table_name] = self._ensure_scalar_indexes(table_name, table)
+            table.optimize(cleanup_older_than=cleanup_older_than)
+            self._unindexed_rows[table_name] = 0
+        return created
+
+    def invalidate_table_cache(self, names: list[str] | None = None) -> None:
+        """Drop cached table handles so that the next :meth:`open_table` reopens them.
+
+        Args:
+            names: Names of the tables to drop. If None, drop all cached handles.
+        """
+        for name in list(self._table_handles.keys()) if names is None else names:
+            self._table_versions_mtimes.pop(name, None)
+            if self._table_handles.pop(name, None) is not None:
+                self.table_cache_stats.invalidations += 1
+
     @overload
     def get_data(
         self,
@@ -439,6 +634,8 @@ class Dataset:
         record_ids: list[str] | None = None,
         sortcol: str | None = None,
         order: str | None = None,
+        columns: list[str] | None = None,
+        exclude_blobs: bool = False,
     ) -> list[LanceModel]: ...
     @overload
     def get_data(
@@ -451,6 +648,8 @@ class Dataset:
         record_ids: None = None,
         sortcol: str | None = None,
         order: str | None = None,
+        columns: list[str] | None = None,
+        exclude_blobs: bool = False,
     ) -> LanceModel | None: ...
 
     def get_data(
@@ -463,11 +662,16 @@ class Dataset:
         record_ids: list[str] | None = None,
         sortcol: str | None = None,
         order: str | None = None,
+        columns: list[str] | None = None,
+        exclude_blobs: bool = False,
     ) -> list[LanceModel] | LanceModel | None:
         """Read data from a table.
 
         Data can be filtered by ids, record ids, where clause, or limit and skip.
 
+        Columns that are not read (because of `columns` or `exclude_blobs`) are filled with the schema defaults,
+        so they must not be required fields of the table schema.
+
         Args:
             table_name: Table name.
             ids: ids to read.
@@ -477,6 +681,8 @@ class Dataset:
             record_ids: Record ids to filter by (filters on ``record_id`` column).
             sortcol: column to order by.
             order: sort order (asc or desc).
+            columns: Columns to read. If not set, all non-blob columns are read.
+            exclude_blobs: Whether to skip the binary media columns (``raw_bytes``, ``preview``) of the table.
 
         Returns:
             List of values.
@@ -495,39 +701,26 @@ class Dataset:
 
         _validate_ids_record_ids_and_limit_and_skip(ids, limit, skip, record_ids)
 
-        if record_ids is not None:
-            sql_record_ids = to_sql_list(record_ids)
         table = self.open_table(table_name)
-        blob_cols = self._get_blob_columns(table_name)
+        blob_cols = self._get_blob_columns(table_name, include_media=exclude_blobs)
 
         if ids is None and record_ids is None and limit is None:
             limit = table.count_rows()
 
+        query = TableQueryBuilder(table, self._db_connection, blob_columns=blob_cols)
+        if columns is not None:
+            query = query.select(columns)
+
         if ids is None:
-            if record_ids is None:
-                if where is not None:
-                    query = (
-                        TableQueryBuilder(table, self._db_connection, blob_columns=blob_cols)
-                        .where(where)
-                        .limit(limit)
-                        .offset(skip)
-                    )
-                else:
-                    query = (
-                        TableQueryBuilder(table, self._db_connection, blob_columns=blob_cols).limit(limit).offset(skip)
-                    )
-            else:
+            if record_ids is not None:
                 sql_record_ids = to_sql_list(record_ids)
                 if where is not None:
                     where += f" AND record_id IN {sql_record_ids}"
                 else:
                     where = f"record_id IN {sql_record_ids}"
-                query = (
-                    TableQueryBuilder(table, self._db_connection, blob_columns=blob_cols)
-                    .where(where)
-                    .limit(limit)
-                    .offset(skip)
-                )
+            if where is not None:
+                query = query.where(where)
+            query = query.limit(limit).offset(skip)
             if sortcol is not None and order is not None:
                 query = query.order_by(sortcol, order == "desc")
         else:
@@ -536,11 +729,13 @@ class Dataset:
                 where += f" AND id IN {sql_ids}"
             else:
                 where = f"id IN {sql_ids}"
-            query = TableQueryBuilder(table, self._db_connection, blob_columns=blob_cols).where(where)
+            query = query.where(where)
 
         schema = self.info.tables[table_name]
 
         query_models: list[LanceModel] = query.to_pydantic(schema)
+        if not exclude_blobs and (columns is None or "raw_bytes" in columns):
+            self._load_stored_view_media(query_models)
 
         return query_models if return_list else (query_models[0] if query_models != [] else None)
 
@@ -556,9 +751,59 @@ class Dataset:
         Returns:
             Tuple of (blob_bytes, format_string) or None if not found.
         """
+        return self._get_view_payload(table_name, row_id, "raw_bytes", "format")
+
+    def open_view_binary(self, table_name: str, row_id: str) -> tuple[BinaryIO, str] | None:
+        """Open the binary content of a single view row as a seekable file-like object.
+
+        Media of the blob store are read lazily from disk, so large payloads can be read by range or in chunks
+        without being loaded in memory. Embedded ``raw_bytes`` are wrapped in memory. The caller closes the handle.
+
+        Args:
+            table_name: View table name.
+            row_id: The row ID.
+
+        Returns:
+            Tuple of (binary_handle, format_string) or None if not found.
+        """
+        table = self.open_table(table_name)
+        columns = ["id"] + [name for name in ("raw_bytes", "uri", "format") if name in table.schema.names]
+        where = f"id IN {to_sql_list(row_id)}"
+        rows = TableQueryBuilder(table, self._db_connection).select(columns).where(where).limit(1).to_list()
+        if not rows:
+            return None
+
+        row = rows[0]
+        fmt = row.get("format", "")
+        if row.get("raw_bytes"):
+            return io.BytesIO(row["raw_bytes"]), fmt
+        digest = parse_blob_uri(row.get("uri", "") or "")
+        if digest is None:
+            return None
+        try:
+            return self.blob_store.path(digest).open("rb"), fmt
+        except FileNotFoundError:
+            return None
+
+    def get_view_preview(self, table_name: str, row_id: str) -> tuple[bytes, str] | None:
+        """Load the preview thumbnail of a single view row.
+
+        Args:
+            table_name: View table name.
+            row_id: The row ID.
+
+        Returns:
+            Tuple of (preview_bytes, preview_format) or None if not found or without preview.
+        """
+        return self._get_view_payload(table_name, row_id, "preview", "preview_format")
+
+    def _get_view_payload(
+        self, table_name: str, row_id: str, data_column: str, format_column: str
+    ) -> tuple[bytes, str] | None:
+        """Read a binary column and its format column for a single view row, without loading other blobs."""
         table = self.open_table(table_name)
         columns = ["id"]
-        for column_name in ("raw_bytes", "format"):
+        for column_name in (data_column, format_column, "uri"):
             if column_name in table.schema.names:
                 columns.append(column_name)
 
@@ -569,63 +814,185 @@ class Dataset:
             return None
 
         row = rows[0]
-        blob = row.get("raw_bytes", b"")
+        blob = row.get(data_column, b"")
+        if not blob and data_column == "raw_bytes":
+            blob = self._read_stored_media(row.get("uri", ""))
         if not blob:
             return None
-        fmt = row.get("format", "")
+        fmt = row.get(format_column, "")
         return blob, fmt
 
-    def get_temporal_view_batch(
+    def get_temporal_view_frames(
         self,
         table_name: str,
         record_id: str,
         view_name: str | None = None,
         start_frame: int = 0,
         batch_size: int = 100,
-    ) -> list[tuple[int, bytes, str]]:
-        """Load one ordered batch of temporal view frames with their binary payloads.
-
-        Returns a list of ``(frame_index, blob_bytes, format_string)`` tuples,
-        reading from the embedded ``raw_bytes`` column.
+    ) -> list[tuple[int, str]]:
+        """List one ordered batch of temporal view frames without reading their binary payloads.
 
         Args:
             table_name: View table name containing temporal frames.
             record_id: The record ID to filter by.
             view_name: Optional logical view name to filter by.
             start_frame: Starting frame index.
-            batch_size: Number of frames to load.
+            batch_size: Number of frames to list.
 
         Returns:
-            List of (frame_index, blob_bytes, format) tuples.
+            List of (frame_index, row_id) tuples, ordered by frame index.
         """
         table = self.open_table(table_name)
         if "frame_index" not in table.schema.names:
             raise DatasetAccessError(f"Table '{table_name}' is not a temporal view table.")
 
-        end_frame = start_frame + batch_size
-        columns = ["frame_index"]
-        for column_name in ("raw_bytes", "format"):
-            if column_name in table.schema.names:
-                columns.append(column_name)
-
         where = _combine_where_clauses(
             f"record_id IN {to_sql_list(record_id)}",
             f"logical_name IN {to_sql_list(view_name)}" if view_name is not None else None,
             f"frame_index >= {start_frame}",
-            f"frame_index < {end_frame}",
+            f"frame_index < {start_frame + batch_size}",
         )
         assert where is not None
 
-        query = table.search(None).select(columns).where(where).limit(batch_size)
-        rows = query.to_list()
-        rows.sort(key=lambda row: int(row.get("frame_index", -1)))
+        rows = table.search(None).select(["id", "frame_index"]).where(where).limit(batch_size).to_list()
+        return sorted(((int(row["frame_index"]), row["id"]) for row in rows), key=lambda frame: frame[0])
+
+    def iter_temporal_view_payloads(
+        self, table_name: str, frames: list[tuple[int, str]]
+    ) -> Iterator[tuple[int, str, bytes, str]]:
+        """Stream the binary payloads of temporal view frames, in the order of ``frames``.
+
+        Payloads are read through an Arrow record batch reader and each frame is yielded as soon as it and the
+        frames before it are read, instead of once the whole batch is loaded. Frames stored out of order are held
+        until their turn. Frames whose row is not found, for instance because it was deleted after the frames were
+        listed, are skipped.
+
+        Args:
+            table_name: View table name containing temporal frames.
+            frames: The (frame_index, row_id) tuples returned by :meth:`get_temporal_view_frames`.
+
+        Yields:
+            Tuples of (frame_index, row_id, blob_bytes, format). ``blob_bytes`` is empty for frames without an
+            embedded or stored payload.
+        """
+        if not frames:
+            return
+        table = self.open_table(table_name)
+        columns = ["id"] + [name for name in ("raw_bytes", "format", "uri") if name in table.schema.names]
+        reader = (
+            table.search(None)
+            .select(columns)
+            .where(f"id IN {to_sql_list([row_id for _, row_id in frames])}")
+            .limit(len(frames))
+            .to_batches(self._TEMPORAL_READ_BATCH_SIZE)
+        )
+
+        read: dict[str, dict] = {}
+        position = 0
+        for batch in reader:
+            for row in batch.to_pylist():
+                read[row["id"]] = row
+            while position < len(frames) and frames[position][1] in read:
+                frame_index, row_id = frames[position]
+                row = read.pop(row_id)
+                blob = row.get("raw_bytes") or self._read_stored_media(row.get("uri", ""))
+                yield frame_index, row_id, blob, row.get("format", "")
+                position += 1
+
+        # The reader is exhausted: the frames left that were not read are missing from the table
+        for frame_index, row_id in frames[position:]:
+            row = read.pop(row_id, None)
+            if row is not None:
+                blob = row.get("raw_bytes") or self._read_stored_media(row.get("uri", ""))
+                yield frame_index, row_id, blob, row.get("format", "")
+
+    def get_temporal_view_batch(
+        self,
+        table_name: str,
+        record_id: str,
+        view_name: str | None = None,
+        start_frame: int = 0,
+        batch_size: int = 100,
+    ) -> list[tuple[int, bytes, str]]:
+        """Load one ordered batch of temporal view frames with their binary payloads.
+
+        Returns a list of ``(frame_index, blob_bytes, format_string)`` tuples,
+        reading from the embedded ``raw_bytes`` column or from the blob store.
+        See :meth:`iter_temporal_view_payloads` to stream them instead.
+
+        Args:
+            table_name: View table name containing temporal frames.
+            record_id: The record ID to filter by.
+            view_name: Optional logical view name to filter by.
+            start_frame: Starting frame index.
+            batch_size: Number of frames to load.
+
+        Returns:
+            List of (frame_index, blob_bytes, format) tuples.
+        """
+        frames = self.get_temporal_view_frames(table_name, record_id, view_name, start_frame, batch_size)
+        return [
+            (frame_index, blob, fmt)
+            for frame_index, _, blob, fmt in self.iter_temporal_view_payloads(table_name, frames)
+            if blob
+        ]
+
+    def _read_stored_media(self, uri: str | None) -> bytes:
+        """Read the blob referenced by a view ``uri``, or return empty bytes if it does not reference the store."""
+        digest = parse_blob_uri(uri) if uri else None
+        if digest is None:
+            return b""
+        return self.blob_store.get(digest) or b""
 
-        result = []
+    def _load_stored_view_media(self, rows: list[LanceModel]) -> None:
+        """Load the media of view rows stored in the blob store back into their ``raw_bytes``."""
+        if self.info.storage_mode != "content_addressed":
+            return
         for row in rows:
-            blob = row.get("raw_bytes", b"")
-            if blob:
-                result.append((int(row["frame_index"]), blob, row.get("format", "")))
-        return result
+            uri = getattr(row, "uri", "")
+            if uri and parse_blob_uri(uri) is not None:
+                row.raw_bytes = self._read_stored_media(uri)
+                row.uri = ""
+
+    def _store_view_media(self, table_name: str, rows: list[LanceModel]) -> list[LanceModel]:
+        """Move the ``raw_bytes`` of view rows to the blob store when the dataset stores media out of line.
+
+        The given rows are not modified: rows holding media are copied, with a ``uri`` that references the stored
+        blob and empty ``raw_bytes``.
+
+        Returns:
+            The rows to write.
+        """
+        if self.info.storage_mode != "content_addressed" or table_name not in self.info.groups[SchemaGroup.VIEW]:
+            return rows
+        stored: list[LanceModel] = []
+        for row in rows:
+            raw_bytes = getattr(row, "raw_bytes", b"")
+            if raw_bytes:
+                row = row.model_copy(update={"raw_bytes": b"", "uri": blob_uri(self.blob_store.put(raw_bytes))})
+            stored.append(row)
+        return stored
+
+    def prune_blob_store(self, older_than: timedelta | None = None) -> int:
+        """Delete the blobs of the blob store that no view references anymore.
+
+        Blobs are stored before the rows that reference them are committed, so only the blobs stored or reused
+        for longer than ``older_than`` are deleted.
+
+        Args:
+            older_than: Minimum age of the deleted blobs. If None, ``_BLOB_PRUNE_GRACE_PERIOD``.
+
+        Returns:
+            Number of deleted blobs.
+        """
+        referenced: set[str] = set()
+        for table_name in self.info.groups[SchemaGroup.VIEW]:
+            table = self.open_table(table_name)
+            if "uri" not in table.schema.names:
+                continue
+            query = TableQueryBuilder(table, self._db_connection).select(["uri"]).where(f"uri LIKE '{blob_uri('')}%'")
+            referenced.update(digest for row in query.to_list() if (digest := parse_blob_uri(row["uri"])) is not None)
+        return self.blob_store.prune(referenced, self._BLOB_PRUNE_GRACE_PERIOD if older_than is None else older_than)
 
     @overload
     def get_records(self, ids: list[str] | None = None, limit: int | None = None, skip: int = 0) -> list[Record]: ...
@@ -764,7 +1131,7 @@ class Dataset:
         if len(ids) == 0:
             return {}
         table = self.open_table(table_name)
-        ids_found = list(
+        ids_found = set(
             TableQueryBuilder(table, self._db_connection)
             .select(["id"])
             .where(f"id in {to_sql_list(ids)}")
@@ -817,6 +1184,7 @@ class Dataset:
             data, schema=table_schema.to_arrow_schema(remove_vector=True, remove_metadata=True)
         )
         table.add(data)
+        self._track_written_rows(table_name, table, data.num_rows)
         return None
 
     def add_data(
@@ -857,7 +1225,8 @@ class Dataset:
                 d.created_at = datetime.now()
             if hasattr(d, "updated_at"):
                 d.updated_at = d.created_at if hasattr(d, "created_at") else datetime.now()
-        table.add(data)
+        table.add(self._store_view_media(actual_table_name, data))
+        self._track_written_rows(actual_table_name, table, len(data))
 
         if actual_table_name == SchemaGroup.RECORD.value:
             self._num_rows_cache = None
@@ -964,12 +1333,114 @@ class Dataset:
         for table_name in ordered_tables:
             rows = normalized[table_name]
             table = self.open_table(table_name)
-            table.add(rows)
+            table.add(self._store_view_media(table_name, rows))
+            self._track_written_rows(table_name, table, len(rows))
 
         # Invalidate row-count cache if records were touched
         if SchemaGroup.RECORD.value in normalized:
             self._num_rows_cache = None
 
+    def add_arrow(
+        self,
+        table_name: str,
+        data: pa.Table | pa.RecordBatch,
+        check_integrity: Literal["raise", "warn", "none"] = "raise",
+    ) -> None:
+        """Insert Arrow rows into a table without building one pydantic object per row.
+
+        See [add_arrow_records][pixano.datasets.Dataset.add_arrow_records].
+
+        Args:
+            table_name: Table name.
+            data: Rows to insert.
+            check_integrity: Integrity-check mode ("raise", "warn" or "none").
+        """
+        self.add_arrow_records({table_name: data}, check_integrity=check_integrity)
+
+    def add_arrow_records(
+        self,
+        data: dict[str, pa.Table | pa.RecordBatch],
+        check_integrity: Literal["raise", "warn", "none"] = "raise",
+    ) -> None:
+        """Insert Arrow rows into multiple tables in a single call.
+
+        Arrow counterpart of [add_records][pixano.datasets.Dataset.add_records]: tables are inserted in
+        dependency order, temporal tables are sorted by timestamp and integrity checks are vectorized.
+        Missing columns are filled with the schema defaults, and ``created_at``/``updated_at`` with the
+        insertion time.
+
+        Args:
+            data: Mapping of table name to the rows to insert. ``None`` or empty values are skipped.
+            check_integrity: Integrity-check mode.
+                ``"raise"`` (default) aborts on the first error,
+                ``"warn"`` emits warnings, ``"none"`` skips validation.
+        """
+        _validate_raise_or_warn(check_integrity)
+        normalized: dict[str, pa.Table] = {}
+        for table_name, value in data.items():
+            if value is None or value.num_rows == 0:
+                continue
+            if table_name not in self.info.tables:
+                raise DatasetAccessError(f"Table {table_name} not found in dataset {self.id}.")
+            if isinstance(value, pa.RecordBatch):
+                value = pa.Table.from_batches([value])
+            normalized[table_name] = self._conform_arrow_table(table_name, value)
+
+        if not normalized:
+            return
+
+        ordered_tables = self._table_insert_order(list(normalized.keys()))
+
+        if check_integrity != "none":
+            pending_ids = {table_name: pl.from_arrow(rows.column("id")) for table_name, rows in normalized.items()}
+            for table_name in ordered_tables:
+                validate_arrow_batch(
+                    table_name,
+                    normalized[table_name],
+                    self,
+                    raise_or_warn=check_integrity,
+                    pending_ids=pending_ids,
+                )
+
+        for table_name in ordered_tables:
+            table = self.open_table(table_name)
+            table.add(normalized[table_name])
+            self._track_written_rows(table_name, table, normalized[table_name].num_rows)
+
+        if SchemaGroup.RECORD.value in normalized:
+            self._num_rows_cache = None
+
+    def _conform_arrow_table(self, table_name: str, data: pa.Table) -> pa.Table:
+        """Cast Arrow rows to the stored table schema, filling missing columns with schema defaults."""
+        schema = self.info.tables[table_name]
+        target_schema = self.open_table(table_name).schema
+        unknown_columns = set(data.column_names) - set(target_schema.names)
+        if unknown_columns:
+            raise DatasetAccessError(f"Unknown columns {sorted(unknown_columns)} for table {table_name}.")
+
+        now = datetime.now()
+        columns: list[pa.Array | pa.ChunkedArray] = []
+        for field in target_schema:
+            if field.name in data.column_names:
+                columns.append(data.column(field.name).cast(field.type))
+                continue
+            if field.name in ("created_at", "updated_at"):
+                default = now
+            else:
+                model_field = schema.model_fields.get(field.name)
+                if model_field is None or model_field.is_required():
+                    raise DatasetAccessError(f"Missing required column {field.name} for table {table_name}.")
+                default = model_field.get_default(call_default_factory=True)
+                if isinstance(default, BaseModel):
+                    default = default.model_dump()
+            columns.append(pa.repeat(pa.scalar(default, type=field.type), data.num_rows))
+        table = pa.Table.from_arrays(columns, schema=target_schema)
+
+        # Sort temporal batches (sequence frames) by timestamp for storage co-locality
+        if "timestamp" in schema.model_fields:
+            table = table.sort_by("timestamp")
+        return table
+
     def delete_data(self, table_name: str, ids: list[str]) -> list[str]:
         """Delete data from a table.
 
@@ -1007,8 +1478,7 @@ class Dataset:
     def delete_records(self, ids: list[str]) -> list[str]:
         """Delete records and all associated data across all tables.
 
-        Cascading deletion: deletes from the record table first, then from all
-        auxiliary tables where ``record_id`` matches the given ids.
+        See [cascade_delete_records][pixano.datasets.Dataset.cascade_delete_records].
 
         Args:
             ids: Record ids to delete.
@@ -1016,27 +1486,116 @@ class Dataset:
         Returns:
             The list of ids not found in the record table.
         """
-        sql_ids = to_sql_list(ids)
+        if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+            raise DatasetAccessError("ids must be a list of strings")
+        if not ids:
+            return []
+
+        unique_ids = list(dict.fromkeys(ids))
+        found: set[str] = set()
+        for chunk in self._chunks(unique_ids):
+            found.update(
+                id for id, is_found in self.find_ids_in_table(SchemaGroup.RECORD.value, set(chunk)).items() if is_found
+            )
+        self.cascade_delete_records(unique_ids)
+        return [id for id in unique_ids if id not in found]
 
-        ids_not_found = []
-        for table_name in self.info.tables.keys():
-            if table_name == SchemaGroup.RECORD.value:
-                ids_not_found = self.delete_data(table_name, ids)
-            else:
-                table = self.open_table(table_name)
-                table_ids = (
-                    table.search()
+    def cascade_delete_records(self, ids: list[str], max_workers: int | None = None) -> dict[str, int]:
+        """Delete records and all associated data across all tables.
+
+        Rows are deleted with ``record_id IN (...)`` predicates, without reading their ids first. Entities whose
+        ``parent_id`` references a deleted entity are deleted too, as well as the rows that reference a deleted
+        entity through ``entity_id``. Each table is deleted from with one predicate per chunk of
+        ``_DELETE_CHUNK_SIZE`` ids. Tables are processed concurrently, and the record table is processed last.
+
+        Args:
+            ids: Record ids to delete.
+            max_workers: Maximum number of tables processed concurrently.
+
+        Returns:
+            Number of deleted rows per table.
+        """
+        if not isinstance(ids, list) or not all(isinstance(i, str) for i in ids):
+            raise DatasetAccessError("ids must be a list of strings")
+        counts = dict.fromkeys(self.info.tables, 0)
+        if not ids:
+            return counts
+
+        record_chunks = list(self._chunks(list(dict.fromkeys(ids))))
+        entity_tables = self.info.groups.get(SchemaGroup.ENTITY, set())
+        entity_ids = self._find_ids(entity_tables, "record_id", record_chunks)
+        # Descendant entities may belong to other records
+        known_ids, child_ids = set(entity_ids), entity_ids
+        while child_ids:
+            found = self._find_ids(entity_tables, "parent_id", list(self._chunks(child_ids)))
+            child_ids = [entity_id for entity_id in dict.fromkeys(found) if entity_id not in known_ids]
+            known_ids.update(child_ids)
+            entity_ids.extend(child_ids)
+        entity_chunks = list(self._chunks(entity_ids))
+
+        def delete_from_table(table_name: str) -> int:
+            schema = self.info.tables[table_name]
+            predicates: list[str] = []
+            if "record_id" in schema.model_fields:
+                predicates.extend(f"record_id IN {to_sql_list(chunk)}" for chunk in record_chunks)
+            if table_name in entity_tables:
+                predicates.extend(f"id IN {to_sql_list(chunk)}" for chunk in entity_chunks)
+            elif "entity_id" in schema.model_fields:
+                predicates.extend(f"entity_id IN {to_sql_list(chunk)}" for chunk in entity_chunks)
+            return self._delete_rows(table_name, predicates)
+
+        dependent_tables = [name for name in self.info.tables if name != SchemaGroup.RECORD.value]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for table_name, deleted in zip(dependent_tables, executor.map(delete_from_table, dependent_tables)):
+                counts[table_name] = deleted
+
+        counts[SchemaGroup.RECORD.value] = self._delete_rows(
+            SchemaGroup.RECORD.value, [f"id IN {to_sql_list(chunk)}" for chunk in record_chunks]
+        )
+        self._num_rows_cache = None
+
+        return counts
+
+    def _find_ids(self, table_names: Iterable[str], column: str, chunks: list[list[str]]) -> list[str]:
+        """Return the ids of the rows of tables whose ``column`` holds one of the values of ``chunks``."""
+        found: list[str] = []
+        for table_name in table_names:
+            if column not in self.info.tables[table_name].model_fields:
+                continue
+            table = self.open_table(table_name)
+            for chunk in chunks:
+                found.extend(
+                    TableQueryBuilder(table, self._db_connection)
                     .select(["id"])
-                    .where(f"record_id in {sql_ids}")
-                    .limit(None)
-                    .to_arrow()["id"]
-                    .to_pylist()
+                    .where(f"{column} IN {to_sql_list(chunk)}")
+                    .to_polars()["id"]
+                    .to_list()
                 )
-                if table_ids == []:
-                    continue
-                table_sql_ids = to_sql_list(table_ids)
-                table.delete(where=f"id in {table_sql_ids}")
-        return ids_not_found
+        return found
+
+    def _delete_rows(self, table_name: str, predicates: list[str]) -> int:
+        """Delete the rows matching each predicate in turn and return how many were deleted.
+
+        Each deletion is counted as the difference between the row counts of the versions before and after it,
+        which are read from the table metadata instead of scanning the matching rows.
+        """
+        table = self.open_table(table_name) if predicates else None
+        deleted = 0
+        for predicate in predicates:
+            version, num_rows = table.version, table.count_rows()
+            result = table.delete(predicate)
+            if result.version != version + 1:
+                # Another write was committed before the deletion: count the rows of the version it applied to
+                previous = self._db_connection.open_table(table_name)
+                previous.checkout(result.version - 1)
+                num_rows = previous.count_rows()
+            deleted += num_rows - table.count_rows()
+        return deleted
+
+    def _chunks(self, ids: list[str]) -> Iterator[list[str]]:
+        """Split ids into chunks of ``_DELETE_CHUNK_SIZE``, each turned into its own bounded SQL predicate."""
+        for start in range(0, len(ids), self._DELETE_CHUNK_SIZE):
+            yield ids[start : start + self._DELETE_CHUNK_SIZE]
 
     @overload
     def update_data(
@@ -1117,7 +1676,10 @@ class Dataset:
                 d.updated_at = datetime.now()
             if d.id not in ids_found and hasattr(d, "created_at"):
                 d.created_at = d.updated_at if hasattr(d, "updated_at") else datetime.now()
-        table.merge_insert("id").when_matched_update_all().when_not_matched_insert_all().execute(data)
+        table.merge_insert("id").when_matched_update_all().when_not_matched_insert_all().execute(
+            self._store_view_media(actual_table_name, data)
+        )
+        self._track_written_rows(actual_table_name, table, len(data))
 
         if not return_separately:
             return data
@@ -1145,65 +1707,136 @@ class Dataset:
         Returns:
             The found dataset.
         """
-        # Fast path: try direct path first (dataset dir often matches id)
-        direct = directory / id / "info.json"
-        if direct.exists():
-            info = DatasetInfo.from_json(direct)
-            if info.id == id:
-                return Dataset(direct.parent)
-
-        # Fallback: scan all directories
-        for json_fp in directory.glob("*/info.json"):
-            info = DatasetInfo.from_json(json_fp)
-            if info.id == id:
-                return Dataset(json_fp.parent)
-        raise FileNotFoundError(f"Dataset {id} not found in {directory}")
+        entry = LibraryCatalog(directory).find(id)
+        return Dataset(directory / entry.path)
+
+    def _check_view_embedding_table(self, table_name: str) -> None:
+        if not isinstance(table_name, str):
+            raise DatasetAccessError("table_name must be a string.")
+        elif table_name not in self.info.tables:
+            raise DatasetAccessError(f"Table {table_name} not found in dataset {self.id}.")
+        elif table_name not in self.info.groups.get(SchemaGroup.EMBEDDING, set()) or not is_view_embedding(
+            self.info.tables[table_name]
+        ):
+            raise DatasetAccessError(f"Table {table_name} is not a view embedding table.")
+
+    def create_embedding_index(
+        self,
+        table_name: str,
+        index_type: Literal["IVF_FLAT", "IVF_PQ", "IVF_HNSW_SQ", "IVF_HNSW_PQ"] = "IVF_PQ",
+        metric: Literal["l2", "cosine", "dot"] = "l2",
+        num_partitions: int | None = None,
+        num_sub_vectors: int | None = None,
+        replace: bool = True,
+    ) -> None:
+        """Create or rebuild the approximate nearest neighbor index of a view embedding table.
+
+        Without an index, semantic search scans every vector of the table. The metric is saved in the dataset
+        info and used by [semantic_search][pixano.datasets.Dataset.semantic_search].
+
+        Args:
+            table_name: Table name for embeddings.
+            index_type: Type of vector index.
+            metric: Distance metric.
+            num_partitions: Number of IVF partitions. If None, LanceDB picks it from the table size.
+            num_sub_vectors: Number of PQ sub-vectors. If None, LanceDB picks it from the vector dimension.
+            replace: If True, replace an existing index, otherwise raise an error if one exists.
+        """
+        self._check_view_embedding_table(table_name)
+        table = self.open_table(table_name)
+        table.create_index(
+            metric=metric,
+            num_partitions=num_partitions,
+            num_sub_vectors=num_sub_vectors,
+            vector_column_name="vector",
+            replace=replace,
+            index_type=index_type,
+        )
+        self.info.embedding_metrics[table_name] = metric
+        self.info.to_json(self._info_file)
+
+    def _rank_records_by_distance(
+        self,
+        table: LanceTable,
+        query: str | list[float],
+        num_records: int,
+        nprobes: int | None = None,
+        refine_factor: int | None = None,
+        metric: Literal["l2", "cosine", "dot"] = "l2",
+    ) -> pl.DataFrame:
+        """Rank records by their closest embedding to the query.
+
+        Embeddings are fetched by growing windows until `num_records` distinct records are found or the table is
+        exhausted. The distinct records of a top-k window are always the best ranked ones, so the prefix is exact.
+
+        Returns:
+            Dataframe of `record_id` and minimal `_distance`, sorted by distance.
+        """
+        fetch_limit = max(num_records * self._SEMANTIC_SEARCH_OVERFETCH, self._SEMANTIC_SEARCH_MIN_FETCH)
+        while True:
+            search = table.search(query).distance_type(metric).select(["record_id", "_distance"]).limit(fetch_limit)
+            if nprobes is not None:
+                search = search.nprobes(nprobes)
+            if refine_factor is not None:
+                search = search.refine_factor(refine_factor)
+            results = search.to_polars()
+            ranked = results.group_by("record_id").agg(pl.min("_distance")).sort(["_distance", "record_id"])
+            if len(ranked) >= num_records or len(results) < fetch_limit:
+                return ranked
+            fetch_limit *= 4
 
     def semantic_search(
-        self, query: str, table_name: str, limit: int, skip: int = 0
+        self,
+        query: str,
+        table_name: str,
+        limit: int,
+        skip: int = 0,
+        nprobes: int | None = None,
+        refine_factor: int | None = None,
+        metric: Literal["l2", "cosine", "dot"] | None = None,
     ) -> tuple[list[LanceModel], list[float], list[str]]:
         """Perform a semantic search.
 
-        It searches for the closest records to the query in the table embeddings.
+        It searches for the closest records to the query in the table embeddings. Only the embeddings needed to
+        rank `skip + limit` distinct records are fetched.
 
         Args:
             query: Text query for semantic search.
             table_name: Table name for embeddings.
             limit: Limit number of records.
             skip: Skip number of records.
+            nprobes: Number of IVF partitions to probe when the table is indexed.
+            refine_factor: Re-rank `limit * refine_factor` candidates with exact distances when the table is indexed.
+            metric: Distance metric. If None, the metric of the table index, or "l2" if the table is not indexed.
 
         Returns:
-            Tuple of records, distances, and full sorted list of record ids.
+            Tuple of records, distances, and sorted list of the ranked record ids (at least `skip + limit` when
+            the table holds enough records).
         """
         if not isinstance(query, str):
             raise DatasetAccessError("query must be a string.")
-        elif not isinstance(table_name, str):
-            raise DatasetAccessError("table_name must be a string.")
         elif not isinstance(limit, int) or limit < 1:
             raise DatasetAccessError("limit must be a strictly positive integer.")
         elif not isinstance(skip, int) or skip < 0:
             raise DatasetAccessError("skip must be a positive integer.")
-        elif table_name not in self.info.tables:
-            raise DatasetAccessError(f"Table {table_name} not found in dataset {self.id}.")
-        elif table_name not in self.info.groups.get(SchemaGroup.EMBEDDING, set()) or not is_view_embedding(
-            self.info.tables[table_name]
-        ):
-            raise DatasetAccessError(f"Table {table_name} is not a view embedding table.")
+        self._check_view_embedding_table(table_name)
 
         table = self.open_table(table_name)
-        semantic_results: pl.DataFrame = (
-            table.search(query).select(["record_id"]).limit(table.count_rows()).to_polars()
-        )
-        record_results = semantic_results.group_by("record_id").agg(pl.min("_distance")).sort("_distance")
+        if metric is None:
+            metric = self.info.embedding_metrics.get(table_name, "l2")
+        record_results = self._rank_records_by_distance(table, query, skip + limit, nprobes, refine_factor, metric)
         full_record_ids = record_results["record_id"].to_list()
-        record_ids = full_record_ids[skip : skip + limit]
-
-        record_rows = self.get_data(SchemaGroup.RECORD.value, ids=record_ids)
-        record_rows = sorted(record_rows, key=lambda x: record_ids.index(x.id))
-        distances = [
-            record_results.row(by_predicate=(pl.col("record_id") == record.id), named=True)["_distance"]
-            for record in record_rows
-        ]
+        page = record_results.slice(skip, limit)
+        record_ids = page["record_id"].to_list()
+        if not record_ids:
+            return [], [], full_record_ids
+
+        rows_by_id = {row.id: row for row in self.get_data(SchemaGroup.RECORD.value, ids=record_ids)}
+        record_rows, distances = [], []
+        for record_id, distance in zip(record_ids, page["_distance"].to_list()):
+            if record_id in rows_by_id:
+                record_rows.append(rows_by_id[record_id])
+                distances.append(distance)
         return record_rows, distances, full_record_ids
 
     @staticmethod
@@ -1218,7 +1851,8 @@ class Dataset:
         """
         dataset_infos = []
         for json_fp in directory.glob("*/info.json"):
-            dataset_infos.append(DatasetInfo.from_json(json_fp))
+            if not json_fp.parent.name.startswith("."):
+                dataset_infos.append(DatasetInfo.from_json(json_fp))
         return dataset_infos
 
     def add_constraint(
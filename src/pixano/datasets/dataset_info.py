@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Literal, overload
+from typing import Any, Literal, overload
 
 import PIL.Image
 from lancedb.pydantic import LanceModel
@@ -59,6 +59,34 @@ _DATASET_INFO_SLOT_TYPES: dict[str, type[LanceModel]] = {
     "text_span": TextSpan,
 }
 
+ScalarIndexType = Literal["BTREE", "BITMAP"]
+
+# Columns filtered by most queries, indexed by default when the table schema has them. BITMAP suits the
+# low-cardinality columns, BTREE the identifiers and frame positions.
+_DEFAULT_SCALAR_INDEXES: dict[SchemaGroup, dict[str, ScalarIndexType]] = {
+    SchemaGroup.RECORD: {"id": "BTREE", "split": "BITMAP"},
+    SchemaGroup.VIEW: {"id": "BTREE", "record_id": "BTREE", "logical_name": "BITMAP", "frame_index": "BTREE"},
+    SchemaGroup.ENTITY: {"id": "BTREE", "record_id": "BTREE", "parent_id": "BTREE"},
+    SchemaGroup.ENTITY_DYNAMIC_STATE: {
+        "id": "BTREE",
+        "record_id": "BTREE",
+        "entity_id": "BTREE",
+        "view_id": "BTREE",
+        "tracklet_id": "BTREE",
+        "frame_index": "BTREE",
+    },
+    SchemaGroup.ANNOTATION: {
+        "id": "BTREE",
+        "record_id": "BTREE",
+        "entity_id": "BTREE",
+        "view_id": "BTREE",
+        "tracklet_id": "BTREE",
+        "frame_index": "BTREE",
+        "conversation_id": "BTREE",
+    },
+    SchemaGroup.EMBEDDING: {"id": "BTREE", "record_id": "BTREE", "view_id": "BTREE"},
+}
+
 
 class DatasetInfo(BaseModel):
     """Information and schema definition of a dataset.
@@ -85,6 +113,11 @@ class DatasetInfo(BaseModel):
         message: Message schema.
         text_span: Text span schema.
         views: Mapping of logical view names to view schema classes.
+        scalar_indexes: Per-table overrides of the scalar indexes maintained by the dataset, mapping column
+            names to an index type, or to ``None`` to drop a default index. See
+            [scalar_index_columns][pixano.datasets.DatasetInfo.scalar_index_columns].
+        embedding_metrics: Distance metric of the vector index of each view embedding table, used by
+            semantic search.
     """
 
     id: str = ""
@@ -93,7 +126,7 @@ class DatasetInfo(BaseModel):
     size: str = "Unknown"
     preview: str = ""
     workspace: WorkspaceType = WorkspaceType.UNDEFINED
-    storage_mode: Literal["filesystem", "embedded", "mixed"] = "filesystem"
+    storage_mode: Literal["filesystem", "embedded", "mixed", "content_addressed"] = "filesystem"
     record: type[Record] | None = None
     entity: type[Entity] | None = None
     entity_dynamic_state: type[EntityDynamicState] | None = None
@@ -105,6 +138,8 @@ class DatasetInfo(BaseModel):
     message: type[Message] | None = None
     text_span: type[TextSpan] | None = None
     views: dict[str, type[View]] = Field(default_factory=dict)
+    scalar_indexes: dict[str, dict[str, ScalarIndexType | None]] = Field(default_factory=dict)
+    embedding_metrics: dict[str, Literal["l2", "cosine", "dot"]] = Field(default_factory=dict)
     tables: dict[str, type[LanceModel]] = Field(default_factory=dict, exclude=True)
 
     model_config = {"arbitrary_types_allowed": True}
@@ -191,6 +226,16 @@ class DatasetInfo(BaseModel):
 
         validate_canonical_table_map(derived_tables)
 
+        for table_name, columns in self.scalar_indexes.items():
+            schema_cls = derived_tables.get(table_name)
+            if schema_cls is None:
+                raise ValueError(f"Scalar indexes are declared for unknown table '{table_name}'.")
+            unknown_columns = sorted(set(columns) - set(schema_cls.model_fields))
+            if unknown_columns:
+                raise ValueError(
+                    f"Scalar indexes of table '{table_name}' reference unknown columns {unknown_columns}."
+                )
+
         self.tables = derived_tables
         return self
 
@@ -211,6 +256,32 @@ class DatasetInfo(BaseModel):
                 pass
         return groups
 
+    def scalar_index_columns(self, table_name: str) -> dict[str, ScalarIndexType]:
+        """Return the scalar indexes to maintain on a table.
+
+        Defaults depend on the schema group of the table and cover the foreign keys and the columns the API
+        filters on. They are restricted to the columns of the table schema and updated with the
+        ``scalar_indexes`` overrides of the table.
+
+        Args:
+            table_name: Table name.
+
+        Returns:
+            Column names mapped to their index type.
+        """
+        schema_cls = self.tables.get(table_name)
+        if schema_cls is None:
+            return {}
+        try:
+            defaults = _DEFAULT_SCALAR_INDEXES.get(schema_to_group(schema_cls), {})
+        except ValueError:
+            defaults = {}
+        columns: dict[str, ScalarIndexType | None] = {
+            column: index_type for column, index_type in defaults.items() if column in schema_cls.model_fields
+        }
+        columns.update(self.scalar_indexes.get(table_name, {}))
+        return {column: index_type for column, index_type in columns.items() if index_type is not None}
+
     # ------------------------------------------------------------------
     # Serialization
     # ------------------------------------------------------------------
@@ -240,6 +311,8 @@ class DatasetInfo(BaseModel):
         model_dumped["views"] = {
             logical_name: _serialize_table_schema(schema_cls) for logical_name, schema_cls in self.views.items()
         }
+        model_dumped["scalar_indexes"] = model_dumped.pop("scalar_indexes")
+        model_dumped["embedding_metrics"] = model_dumped.pop("embedding_metrics")
         json_fp.write_text(json.dumps(model_dumped, indent=4), encoding="utf-8")
 
     @staticmethod
@@ -254,8 +327,19 @@ class DatasetInfo(BaseModel):
         Returns:
             the dataset info object.
         """
-        info_json = json.loads(json_fp.read_text(encoding="utf-8"))
+        return DatasetInfo.from_dict(json.loads(json_fp.read_text(encoding="utf-8")))
+
+    @staticmethod
+    def from_dict(info_json: dict[str, Any]) -> "DatasetInfo":
+        """Build DatasetInfo from the content of an ``info.json`` file.
+
+        Args:
+            info_json: Parsed ``info.json`` content. It is not modified.
 
+        Returns:
+            the dataset info object.
+        """
+        info_json = dict(info_json)
         info_json["workspace"] = (
             WorkspaceType(info_json["workspace"]) if "workspace" in info_json else WorkspaceType.UNDEFINED
         )
@@ -277,6 +361,27 @@ class DatasetInfo(BaseModel):
     # Directory / ID loading helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def load_preview(dataset_dir: Path) -> str:
+        """Load the preview of a dataset, generating it if it does not exist.
+
+        Args:
+            dataset_dir: Dataset directory.
+
+        Returns:
+            The base64 preview, or an empty string if it could not be loaded.
+        """
+        try:
+            preview_path = dataset_dir.resolve() / "previews/dataset_preview.jpg"
+            if not preview_path.exists():
+                from pixano.datasets.dataset import Dataset
+
+                return Dataset(dataset_dir).generate_preview()
+            thumb = get_image_thumbnail(PIL.Image.open(preview_path), (350, 150))
+            return image_to_base64(thumb, "JPEG")
+        except Exception:  # TODO: specify exception URL and Value
+            return ""
+
     @overload
     @staticmethod
     def load_directory(
@@ -308,18 +413,7 @@ class DatasetInfo(BaseModel):
         # Browse directory
         for json_fp in sorted(directory.glob("*/info.json")):
             info: DatasetInfo = DatasetInfo.from_json(json_fp)
-            try:
-                preview_path = json_fp.parent.resolve() / "previews/dataset_preview.jpg"
-                if not preview_path.exists():
-                    from pixano.datasets.dataset import Dataset
-
-                    dataset = Dataset(json_fp.parent)
-                    info.preview = dataset.generate_preview()
-                else:
-                    thumb = get_image_thumbnail(PIL.Image.open(preview_path), (350, 150))
-                    info.preview = image_to_base64(thumb, "JPEG")
-            except Exception:  # TODO: specify exception URL and Value
-                info.preview = ""
+            info.preview = DatasetInfo.load_preview(json_fp.parent)
             if return_path:
                 library.append((info, json_fp.parent))  #  type: ignore[arg-type]
             else:
@@ -363,17 +457,6 @@ class DatasetInfo(BaseModel):
         for json_fp in directory.glob("*/info.json"):
             info = DatasetInfo.from_json(json_fp)
             if info.id == id:
-                try:
-                    preview_path = json_fp.parent / "previews/dataset_preview.jpg"
-                    if not preview_path.exists():
-                        from pixano.datasets.dataset import Dataset
-
-                        dataset = Dataset(json_fp.parent)
-                        info.preview = dataset.generate_preview()
-                    else:
-                        thumb = get_image_thumbnail(PIL.Image.open(preview_path), (350, 150))
-                        info.preview = image_to_base64(thumb, "JPEG")
-                except Exception:
-                    info.preview = ""
+                info.preview = DatasetInfo.load_preview(json_fp.parent)
                 return (info, json_fp.parent) if return_path else info
         raise FileNotFoundError(f"No dataset found with ID {id}")
@@ -11,6 +11,9 @@ table schemas to/from JSON-compatible dicts.  These are used by
 :class:`DatasetInfo` to persist the ``tables`` mapping in ``info.json``.
 """
 
+import hashlib
+import json
+import threading
 from base64 import b64decode, b64encode
 from datetime import datetime
 from typing import Any, get_args, get_origin
@@ -47,6 +50,11 @@ _MANIFEST_TYPES: dict[str, type] = {
 
 _TIMESTAMP_EXCLUDE = {"created_at": True, "updated_at": True}
 
+# Schema classes deserialized in this process, keyed by base type and manifest hash, so that datasets with
+# identical schemas share the same classes.
+_SCHEMA_CLASS_CACHE: dict[tuple[type[LanceModel], str], type[LanceModel]] = {}
+_SCHEMA_CLASS_CACHE_LOCK = threading.Lock()
+
 
 class DatasetItem(BaseModel):
     """Legacy compatibility model for item-centric tests and fixtures."""
@@ -275,6 +283,8 @@ def _serialize_table_schema(schema: type[LanceModel]) -> dict[str, Any]:
 def _deserialize_table_schema(payload: dict[str, Any]) -> type[LanceModel]:
     """Deserialize a JSON dict back into a LanceModel schema class.
 
+    Custom schema classes are cached per process: deserializing the same payload again returns the same class.
+
     Args:
         payload: Serialized schema dict (from :func:`_serialize_table_schema`).
 
@@ -290,9 +300,14 @@ def _deserialize_table_schema(payload: dict[str, Any]) -> type[LanceModel]:
     if model_name is None:
         return base_type
 
-    fields = {
-        field_name: _deserialize_field(base_type, field_name, field_payload)
-        for field_name, field_payload in payload["fields"].items()
-        if not _manifest_field_matches_base(field_name, field_payload, base_type.model_fields.get(field_name))
-    }
-    return create_model(model_name, __base__=base_type, **fields)
+    key = (base_type, hashlib.sha1(json.dumps(payload, sort_keys=True).encode(), usedforsecurity=False).hexdigest())
+    with _SCHEMA_CLASS_CACHE_LOCK:
+        schema = _SCHEMA_CLASS_CACHE.get(key)
+        if schema is None:
+            fields = {
+                field_name: _deserialize_field(base_type, field_name, field_payload)
+                for field_name, field_payload in payload["fields"].items()
+                if not _manifest_field_matches_base(field_name, field_payload, base_type.model_fields.get(field_name))
+            }
+            schema = _SCHEMA_CLASS_CACHE[key] = create_model(model_name, __base__=base_type, **fields)
+    return schema
@@ -6,9 +6,12 @@
 
 
 import json
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import IO, Any, Iterable, Iterator
 
 from fastapi.encoders import jsonable_encoder
 from lancedb.pydantic import LanceModel
@@ -29,8 +32,67 @@ from ..dataset_info import DatasetInfo
 from .dataset_exporter import DatasetExporter
 
 
+def _dumps(item: Any) -> str:
+    """Encode an exported item on a single line."""
+    return json.dumps(item, default=jsonable_encoder)
+
+
+class _JSONArraySpool:
+    """Append-only JSON array spooled to an anonymous temporary file, one encoded item per line.
+
+    The file is created with the first item, so an empty spool does not touch the disk.
+    """
+
+    def __init__(self, directory: Path):
+        self._directory = directory
+        self._file: IO[str] | None = None
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def append(self, item: Any) -> None:
+        self.extend([item])
+
+    def extend(self, items: Iterable[Any]) -> None:
+        if self._file is None:
+            self._file = tempfile.TemporaryFile("w+", encoding="utf-8", dir=self._directory)
+        for item in items:
+            self._file.write(_dumps(item))
+            self._file.write("\n")
+            self._len += 1
+
+    def iter_encoded(self) -> Iterator[str]:
+        """Iterate over the encoded items."""
+        if self._file is None:
+            return
+        self._file.seek(0)
+        for line in self._file:
+            yield line.rstrip("\n")
+        self._file.seek(0, os.SEEK_END)
+
+    def __iter__(self) -> Iterator[Any]:
+        for line in self.iter_encoded():
+            yield json.loads(line)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._len = 0
+
+
+def _mask_geometry(mask: CompressedRLE) -> tuple[list[list], float]:
+    """Compute the polygons and the area of a mask."""
+    return mask.to_polygons(), mask.area
+
+
 class COCODatasetExporter(DatasetExporter):
-    """Default JSON dataset exporter."""
+    """COCO dataset exporter.
+
+    The ``images`` and ``annotations`` arrays are spooled to temporary files as records are exported and
+    streamed to the output file when it is saved, so memory does not grow with the size of the export.
+    """
 
     def __init__(
         self,
@@ -39,6 +101,7 @@ class COCODatasetExporter(DatasetExporter):
         overwrite: bool = False,
         category_format: str = "coco91",
         custom_category_dict: dict[str, int] | None = None,
+        num_workers: int | None = None,
     ):
         """Initialize a new instance of the DatasetExporter class.
 
@@ -48,13 +111,40 @@ class COCODatasetExporter(DatasetExporter):
             overwrite: Whether to overwrite existing directory.
             category_format: Category format for name to ID conversion ("coco91", "coco80", "voc").
             custom_category_dict: Custom category dictionary for name to ID conversion (supersedes category_format).
+            num_workers: If provided, size of the thread pool computing the polygons and areas of masks.
         """
+        if num_workers is not None and num_workers <= 0:
+            raise ValueError(f"num_workers should be greater than 0 but got {num_workers}")
         self.dataset = dataset
         self.export_dir = Path(export_dir)
         self._overwrite = overwrite
         self.category_dict = (
             custom_category_dict if custom_category_dict is not None else CATEGORY_IDS[category_format]
         )
+        self.num_workers = num_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def export(
+        self, file_name: str = "pixano_export", items_per_file: int | None = None, batch_size: int | None = None
+    ) -> None:
+        """Export the dataset to the specified directory.
+
+        See [DatasetExporter.export][pixano.datasets.exporters.DatasetExporter.export].
+        """
+        try:
+            super().export(file_name=file_name, items_per_file=items_per_file, batch_size=batch_size)
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def _mask_geometries(self, masks: list[CompressedRLE]) -> list[tuple[list[list], float]]:
+        """Compute the polygons and areas of masks, in the worker pool if there is one."""
+        if self.num_workers is None or len(masks) < 2:
+            return [_mask_geometry(mask) for mask in masks]
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_workers, thread_name_prefix="pixano-coco-export")
+        return list(self._executor.map(_mask_geometry, masks))
 
     def initialize_export_data(self, info: DatasetInfo) -> dict[str, Any]:
         """Initialize the dictionary or list of dictionaries to be exported.
@@ -83,8 +173,8 @@ class COCODatasetExporter(DatasetExporter):
                     "url": "",
                 }
             ],
-            "images": [],
-            "annotations": [],
+            "images": _JSONArraySpool(self.export_dir),
+            "annotations": _JSONArraySpool(self.export_dir),
             "categories": [],
         }
         return export_data
@@ -104,8 +194,9 @@ class COCODatasetExporter(DatasetExporter):
         view_rows_by_name: dict[str, list[Image | SequenceFrame]] = {}
         entity_categories: dict[str, str] = {}
 
-        # Keep annotations in a dictionary to merge bbox/mask geometry with entity categories.
-        anns = {s["id"]: s for s in export_data["annotations"]}
+        # Keep annotations in a dictionary to merge bbox/mask geometry with entity categories. Annotation ids
+        # derive from the record's image ids, so annotations of different records never merge.
+        anns: dict[str, dict[str, Any]] = {}
         for schema_name, schema_data in record_data.items():
             if schema_data:
                 schema_data_list = schema_data if isinstance(schema_data, list) else [schema_data]
@@ -119,6 +210,7 @@ class COCODatasetExporter(DatasetExporter):
                         if isinstance(schema, Entity) and hasattr(schema, "category"):
                             entity_categories[schema.id] = str(schema.category).strip().lower()
 
+        located: list[tuple[BBox | CompressedRLE, str]] = []
         for schema_data in record_data.values():
             if not schema_data:
                 continue
@@ -129,24 +221,31 @@ class COCODatasetExporter(DatasetExporter):
                 if not isinstance(schema, BBox | CompressedRLE):
                     continue
                 image_id = _resolve_image_id(schema, view_rows_by_name)
-                if image_id == "":
-                    continue
-                entity_id = schema.entity_id or schema.id
-                ann_id = f"{image_id}_{entity_id}"
-                anns[ann_id] = coco_annotation(
-                    ann=schema,
-                    image_id=image_id,
-                    entity_id=entity_id,
-                    category_name=entity_categories.get(entity_id),
-                    existing_coco_ann=anns.get(ann_id),
-                    category_dict=self.category_dict,
-                )
-        export_data["annotations"] = list(anns.values())
+                if image_id != "":
+                    located.append((schema, image_id))
+
+        masks = [schema for schema, _ in located if isinstance(schema, CompressedRLE)]
+        mask_geometries = dict(zip(map(id, masks), self._mask_geometries(masks)))
+        for schema, image_id in located:
+            entity_id = schema.entity_id or schema.id
+            ann_id = f"{image_id}_{entity_id}"
+            anns[ann_id] = coco_annotation(
+                ann=schema,
+                image_id=image_id,
+                entity_id=entity_id,
+                category_name=entity_categories.get(entity_id),
+                existing_coco_ann=anns.get(ann_id),
+                category_dict=self.category_dict,
+                mask_geometry=mask_geometries.get(id(schema)),
+            )
+        export_data["annotations"].extend(anns.values())
         return export_data
 
     def save_data(self, export_data: dict[str, Any], split: str, file_name: str, file_num: int) -> None:
         """Save data to the specified directory.
 
+        The file is streamed to disk one array item per line and atomically moved in place.
+
         The saved directory has the following structure:
             export_dir/{split}_{file_name}_0.json
                       /...
@@ -162,7 +261,31 @@ class COCODatasetExporter(DatasetExporter):
             file_num: The number of the file to save the data in.
         """
         json_path = self.export_dir / f"{split}_{file_name}_{file_num}.json"
-        json_path.write_text(json.dumps(jsonable_encoder(export_data), indent=4), encoding="utf-8")
+        tmp_path = json_path.with_name(f"{json_path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as file:
+            file.write("{")
+            for index, (key, value) in enumerate(export_data.items()):
+                file.write(f"{',' if index else ''}\n    {json.dumps(key)}: ")
+                if isinstance(value, _JSONArraySpool | list):
+                    _write_json_array(file, value)
+                else:
+                    file.write(json.dumps(jsonable_encoder(value), indent=4).replace("\n", "\n    "))
+            file.write("\n}\n")
+        os.replace(tmp_path, json_path)
+        for value in export_data.values():
+            if isinstance(value, _JSONArraySpool):
+                value.close()
+
+
+def _write_json_array(file: IO[str], items: "_JSONArraySpool | list[Any]") -> None:
+    """Write a JSON array of a saved export, one item per line."""
+    encoded = items.iter_encoded() if isinstance(items, _JSONArraySpool) else map(_dumps, items)
+    separator = "[\n        "
+    for item in encoded:
+        file.write(separator)
+        file.write(item)
+        separator = ",\n        "
+    file.write("[]" if separator.startswith("[") else "\n    ]")
 
 
 def coco_image(image: Image, view: str) -> dict[str, Any]:
@@ -207,6 +330,7 @@ def coco_annotation(
     category_name: str | None = None,
     existing_coco_ann: dict[str, Any] | None = None,
     category_dict: dict[str, int] | None = None,
+    mask_geometry: tuple[list[list], float] | None = None,
 ) -> dict[str, Any]:
     """Return annotation in COCO format.
 
@@ -217,6 +341,8 @@ def coco_annotation(
         category_name: Optional category name for the annotation.
         existing_coco_ann: Existing annotation in COCO format to complete
         category_dict: Category dictonary for name to ID conversion
+        mask_geometry: Precomputed polygons and area of a mask annotation.
+
     Returns:
         Annotation in COCO format
     """
@@ -247,6 +373,7 @@ def coco_annotation(
         coco_ann["confidence"] = ann.confidence
     elif isinstance(ann, CompressedRLE):
         coco_ann["pixano_segmentation_id"] = ann.id
-        coco_ann["segmentation"] = ann.to_polygons()
-        coco_ann["area"] = ann.area
+        if mask_geometry is None:
+            mask_geometry = _mask_geometry(ann)
+        coco_ann["segmentation"], coco_ann["area"] = mask_geometry
     return coco_ann
@@ -7,6 +7,7 @@
 
 import logging
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from pathlib import Path
 from typing import Any
 
@@ -34,8 +35,11 @@ class DatasetExporter(ABC):
     Attributes:
         dataset: The dataset to be exported.
         export_dir: The directory where the exported files will be saved.
+        fetch_size: The maximum number of records whose rows are fetched together from each table.
     """
 
+    fetch_size: int = 1024
+
     def __init__(self, dataset: Dataset, export_dir: str | Path, overwrite: bool = False):
         """Initialize a new instance of the DatasetExporter class.
 
@@ -93,16 +97,40 @@ class DatasetExporter(ABC):
         Returns:
             Dict of table_name → row(s).
         """
-        data: dict[str, LanceModel | list[LanceModel] | None] = {}
-        for table_name, schema_cls in self.dataset.info.tables.items():
+        return self._get_records_data([record_id])[record_id]
+
+    def _get_records_data(self, record_ids: list[str]) -> dict[str, dict[str, LanceModel | list[LanceModel] | None]]:
+        """Fetch all related rows for a batch of records across all tables.
+
+        Each table is queried once for the whole batch and the rows are grouped by record in memory, so the
+        number of table scans does not grow with the number of records.
+
+        Args:
+            record_ids: The record IDs.
+
+        Returns:
+            Dict of record_id → (dict of table_name → row(s)), in the order of `record_ids`.
+        """
+        data: dict[str, dict[str, LanceModel | list[LanceModel] | None]] = {record_id: {} for record_id in record_ids}
+        if not record_ids:
+            return data
+
+        for table_name in self.dataset.info.tables.keys():
+            rows_by_record: dict[str, list[LanceModel]] = defaultdict(list)
+            rows = self.dataset.get_data(table_name, record_ids=record_ids)
             if table_name == SchemaGroup.RECORD.value:
                 # Record table — single row
-                rows = self.dataset.get_data(table_name, where=f"id = '{record_id}'")
-                data[table_name] = rows[0] if rows else None
+                for row in rows:
+                    rows_by_record[row.id].append(row)
+                for record_id in record_ids:
+                    record_rows = rows_by_record.get(record_id)
+                    data[record_id][table_name] = record_rows[0] if record_rows else None
             else:
-                # RecordComponent tables — filter by record_id
-                rows = self.dataset.get_data(table_name, where=f"record_id = '{record_id}'")
-                data[table_name] = rows if rows else None
+                # RecordComponent tables — grouped by record_id
+                for row in rows:
+                    rows_by_record[row.record_id].append(row)
+                for record_id in record_ids:
+                    data[record_id][table_name] = rows_by_record.get(record_id) or None
         return data
 
     def export(
@@ -161,19 +189,21 @@ class DatasetExporter(ABC):
                     .offset(cur_records_exported)
                     .to_polars()["id"]
                 )
-                for record_id in record_ids:
-                    cur_records_exported += 1
-                    record_data = self._get_record_data(record_id)
-                    export_data = self.export_record(export_data, record_data)
-
-                    if (
-                        cur_records_exported == num_split_records or cur_records_exported % split_items_per_file == 0
-                    ):  # Export every n records
-                        self.save_data(export_data, split, file_name, file_num)
-
-                        file_num += 1
-                        if cur_records_exported != num_split_records:
-                            export_data = self.initialize_export_data(info)
+                for chunk_start in range(0, len(record_ids), self.fetch_size):
+                    records_data = self._get_records_data(record_ids[chunk_start : chunk_start + self.fetch_size])
+                    for record_data in records_data.values():
+                        cur_records_exported += 1
+                        export_data = self.export_record(export_data, record_data)
+
+                        if (
+                            cur_records_exported == num_split_records
+                            or cur_records_exported % split_items_per_file == 0
+                        ):  # Export every n records
+                            self.save_data(export_data, split, file_name, file_num)
+
+                            file_num += 1
+                            if cur_records_exported != num_split_records:
+                                export_data = self.initialize_export_data(info)
 
             logger.info(
                 f"Completed export split {split} of dataset {self.dataset.info.name} in {file_num} file"
@@ -0,0 +1,280 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import lancedb
+
+from .dataset_info import DatasetInfo
+
+
+logger = logging.getLogger(__name__)
+
+
+def _mtime(path: Path) -> float | None:
+    """Return the modification time of a path, or None if it is unavailable (missing path, S3 prefix)."""
+    try:
+        return path.stat().st_mtime
+    except (OSError, ValueError):
+        return None
+
+
+def _read_json(path: Path) -> Any:
+    """Read a JSON file, or return None if it is missing or invalid."""
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning(f"Invalid library catalog file {path}, rebuilding it.")
+        return None
+
+
+def _write_json(path: Path, content: Any) -> bool:
+    """Atomically write a JSON file, returning whether it could be written."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(content), encoding="utf-8")
+        tmp_path.replace(path)
+    except OSError:
+        logger.warning(f"Could not write library catalog file {path}.")
+        return False
+    return True
+
+
+@dataclass
+class LibraryCatalogEntry:
+    """Summary of a dataset of a library.
+
+    Attributes:
+        id: Dataset ID.
+        name: Dataset name.
+        workspace: Dataset workspace.
+        path: Dataset directory name, relative to the library.
+        info: Content of the dataset ``info.json``, without its preview.
+        num_rows: Number of rows per table.
+        versions: Last version per table.
+        signature: State of the dataset files the entry was computed from.
+    """
+
+    id: str
+    name: str
+    workspace: str
+    path: str
+    info: dict[str, Any] = field(default_factory=dict)
+    num_rows: dict[str, int] = field(default_factory=dict)
+    versions: dict[str, int] = field(default_factory=dict)
+    signature: list[float | int | None] = field(default_factory=list)
+
+    @property
+    def num_records(self) -> int:
+        """Return the number of rows of the record table."""
+        return self.num_rows.get("records", 0)
+
+    def to_dataset_info(self) -> DatasetInfo:
+        """Return the dataset info of the entry."""
+        return DatasetInfo.from_dict(self.info)
+
+
+class LibraryCatalog:
+    """Catalog of the datasets of a library, persisted at the library root.
+
+    Listing a library from the catalog neither reads the dataset infos nor counts the table rows again: an
+    entry is only recomputed when its signature changed. The signature holds the modification times of the
+    dataset ``info.json`` and of the version directory of each table. Object stores such as S3 have no
+    directory modification times, so the current table versions are read instead.
+
+    The library is only browsed again when the library directory changed, or on every refresh when its
+    modification time is not available. Previews are kept in a separate file that only :meth:`previews`
+    reads. Libraries where the catalog cannot be written keep working from an in-memory catalog.
+
+    Attributes:
+        directory: Library directory.
+        entries: Catalog entries per dataset directory name.
+        library_mtime: Modification time of the library directory when it was last browsed.
+    """
+
+    _CATALOG_FILE: str = ".catalog.json"
+    _PREVIEWS_FILE: str = ".catalog_previews.json"
+
+    def __init__(self, directory: Path):
+        """Load the catalog of a library.
+
+        Args:
+            directory: Library directory.
+        """
+        self.directory = directory
+        self.entries: dict[str, LibraryCatalogEntry] = {}
+        self.library_mtime: float | None = None
+        self._dirty = False
+        content = _read_json(self.path)
+        try:
+            if content is not None:
+                self.library_mtime = content["library_mtime"]
+                self.entries = {name: LibraryCatalogEntry(**entry) for name, entry in content["entries"].items()}
+        except (KeyError, TypeError):
+            logger.warning(f"Invalid library catalog file {self.path}, rebuilding it.")
+            self.library_mtime, self.entries = None, {}
+
+    @property
+    def path(self) -> Path:
+        """Return the path of the catalog file."""
+        return self.directory / self._CATALOG_FILE
+
+    def save(self) -> None:
+        """Atomically write the catalog if it changed."""
+        if not self._dirty:
+            return
+        content = {
+            "library_mtime": self.library_mtime,
+            "entries": {name: asdict(entry) for name, entry in self.entries.items()},
+        }
+        if _write_json(self.path, content):
+            self._dirty = False
+
+    @staticmethod
+    def _signature(dataset_dir: Path) -> list[float | int | None]:
+        """Return the state of the dataset files that invalidates its entry."""
+        from pixano.datasets.dataset import Dataset
+
+        db_path = dataset_dir / Dataset._DB_PATH
+        tables = sorted(db_path.glob("*.lance"))
+        signature: list[float | int | None] = [_mtime(dataset_dir / Dataset._INFO_FILE)]
+        signature.extend(_mtime(table / "_versions") for table in tables)
+        if None in signature[1:]:
+            try:
+                db = lancedb.connect(db_path)
+                signature[1:] = [db.open_table(table.stem).version for table in tables]
+            except Exception as e:
+                logger.warning(f"Failed to read the table versions of dataset {dataset_dir}: {e}")
+        return signature
+
+    def _compute_entry(self, name: str, signature: list[float | int | None]) -> LibraryCatalogEntry | None:
+        """Compute the entry of a dataset, or return None if the directory does not hold a dataset."""
+        from pixano.datasets.dataset import Dataset
+
+        dataset_dir = self.directory / name
+        info = _read_json(dataset_dir / Dataset._INFO_FILE)
+        if not isinstance(info, dict):
+            return None
+        info.pop("preview", None)
+        entry = LibraryCatalogEntry(
+            id=info.get("id", ""),
+            name=info.get("name", ""),
+            workspace=info.get("workspace", ""),
+            path=name,
+            info=info,
+            signature=signature,
+        )
+        db_path = dataset_dir / Dataset._DB_PATH
+        try:
+            db = lancedb.connect(db_path)
+            for table_path in sorted(db_path.glob("*.lance")):
+                table = db.open_table(table_path.stem)
+                entry.num_rows[table_path.stem] = table.count_rows()
+                entry.versions[table_path.stem] = table.version
+        except Exception as e:
+            logger.warning(f"Failed to read the tables of dataset {dataset_dir}: {e}")
+        return entry
+
+    def _refresh_entry(self, name: str) -> LibraryCatalogEntry | None:
+        """Recompute the entry of a dataset if its files changed since it was computed."""
+        entry = self.entries.get(name)
+        signature = self._signature(self.directory / name)
+        if entry is not None and entry.signature == signature:
+            return entry
+        entry = self._compute_entry(name, signature)
+        if entry is None:
+            if self.entries.pop(name, None) is not None:
+                self._dirty = True
+        else:
+            self.entries[name] = entry
+            self._dirty = True
+        return entry
+
+    def refresh(self) -> list[LibraryCatalogEntry]:
+        """Bring the catalog up to date with the library and save it.
+
+        Returns:
+            The catalog entries, sorted by dataset directory name.
+        """
+        library_mtime = _mtime(self.directory)
+        if library_mtime is None or library_mtime != self.library_mtime:
+            # Hidden directories hold datasets being built
+            names = {path.name for path in self.directory.glob("*") if path.is_dir() and not path.name.startswith(".")}
+            for name in set(self.entries) - names:
+                del self.entries[name]
+                self._dirty = True
+            if library_mtime != self.library_mtime:
+                self.library_mtime = library_mtime
+                self._dirty = True
+            for name in sorted(names - set(self.entries)):
+                self._refresh_entry(name)
+        for name in list(self.entries):
+            self._refresh_entry(name)
+        self.save()
+        return [self.entries[name] for name in sorted(self.entries)]
+
+    def find(self, id: str) -> LibraryCatalogEntry:
+        """Find the entry of a dataset.
+
+        The catalog is trusted as long as the ``info.json`` of the matching entry did not change, so finding a
+        known dataset neither reads its files nor writes the catalog.
+
+        Args:
+            id: Dataset ID.
+
+        Returns:
+            The dataset entry.
+        """
+        from pixano.datasets.dataset import Dataset
+
+        for entry in self.entries.values():
+            if entry.id == id and entry.signature[:1] == [_mtime(self.directory / entry.path / Dataset._INFO_FILE)]:
+                return entry
+        for entry in self.refresh():
+            if entry.id == id:
+                return entry
+        raise FileNotFoundError(f"No dataset found with ID {id} in {self.directory}")
+
+    def previews(self, entries: list[LibraryCatalogEntry]) -> dict[str, str]:
+        """Return the previews of datasets of the catalog, loading or generating the missing ones.
+
+        Args:
+            entries: Catalog entries.
+
+        Returns:
+            Base64 previews per dataset directory name.
+        """
+        from pixano.datasets.dataset import Dataset
+
+        previews_path = self.directory / self._PREVIEWS_FILE
+        content = _read_json(previews_path)
+        cached: dict[str, dict[str, Any]] = content if isinstance(content, dict) else {}
+        updated = {}
+        for entry in entries:
+            preview_file = self.directory / entry.path / Dataset._PREVIEWS_PATH / "dataset_preview.jpg"
+            mtime = _mtime(preview_file)
+            preview = cached.get(entry.path)
+            # Without a preview file, a cached (empty) preview is only kept while the dataset did not change
+            if (
+                preview is None
+                or preview.get("mtime") != mtime
+                or (mtime is None and preview.get("signature") != entry.signature)
+            ):
+                preview = {"preview": DatasetInfo.load_preview(self.directory / entry.path)}
+                preview["mtime"] = _mtime(preview_file)
+                preview["signature"] = entry.signature
+            updated[entry.path] = preview
+        if updated != {name: cached.get(name) for name in updated}:
+            _write_json(previews_path, {**cached, **updated})
+        return {name: preview["preview"] for name, preview in updated.items()}
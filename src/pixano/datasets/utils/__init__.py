@@ -4,10 +4,20 @@
 # License: CECILL-C
 # =====================================
 
+from .analytics import (
+    ShapeHistograms,
+    compute_pairwise_iou,
+    compute_shape_histograms,
+    flag_duplicates,
+    load_annotation_geometry,
+)
+from .blob_store import BlobStore, blob_uri, parse_blob_uri
 from .errors import DatasetAccessError, DatasetPaginationError, DatasetWriteError
 from .integrity import (
+    TableIntegrityReport,
     check_dataset_integrity,
     check_table_integrity,
+    compute_integrity_report,
     get_integry_checks_from_schemas,
     handle_integrity_errors,
 )
@@ -17,16 +27,26 @@ from .video import create_video_preview
 
 
 __all__ = [
+    "BlobStore",
     "DatasetAccessError",
     "DatasetPaginationError",
     "DatasetWriteError",
+    "ShapeHistograms",
+    "TableIntegrityReport",
+    "blob_uri",
     "check_dataset_integrity",
     "check_table_integrity",
+    "compute_integrity_report",
+    "compute_pairwise_iou",
+    "compute_shape_histograms",
     "create_video_preview",
     "coco_ids_80to91",
     "category_id",
     "category_name",
+    "flag_duplicates",
     "get_integry_checks_from_schemas",
     "handle_integrity_errors",
+    "load_annotation_geometry",
     "mosaic",
+    "parse_blob_uri",
 ]
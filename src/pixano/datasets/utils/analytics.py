@@ -0,0 +1,284 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+import polars as pl
+
+from pixano.datasets.queries import TableQueryBuilder
+from pixano.features.utils.rle import rles_area, rles_bbox, rles_iou
+from pixano.schemas import is_bbox, is_compressed_rle
+
+
+if TYPE_CHECKING:
+    from pixano.datasets import Dataset
+
+
+_GROUP_COLUMNS = ("record_id", "view_id", "frame_id", "frame_index")
+_PAIR_CHUNK_ROWS = 100_000
+_IOU_SCHEMA = {"id": pl.String, "other_id": pl.String, "iou": pl.Float64}
+
+
+@dataclass
+class ShapeHistograms:
+    """Histograms of the areas and aspect ratios of the annotations of a table.
+
+    Areas and aspect ratios are computed on the bounding boxes, or on the pixels and bounding boxes of masks,
+    in the units the coordinates are stored in.
+
+    Attributes:
+        table_name: Table name.
+        num_rows: Number of annotations.
+        area_edges: Bin edges of the area histogram.
+        area_counts: Number of annotations per area bin.
+        aspect_ratio_edges: Bin edges of the width / height ratio histogram.
+        aspect_ratio_counts: Number of annotations per aspect ratio bin. Annotations with a null height are not
+            counted.
+    """
+
+    table_name: str
+    num_rows: int = 0
+    area_edges: list[float] = field(default_factory=list)
+    area_counts: list[int] = field(default_factory=list)
+    aspect_ratio_edges: list[float] = field(default_factory=list)
+    aspect_ratio_counts: list[int] = field(default_factory=list)
+
+
+def _group_columns(dataset: "Dataset", table_name: str) -> list[str]:
+    """Columns identifying the frame an annotation belongs to."""
+    fields = dataset.info.tables[table_name].model_fields
+    return [column for column in _GROUP_COLUMNS if column in fields]
+
+
+def load_annotation_geometry(dataset: "Dataset", table_name: str, where: str | None = None) -> pl.DataFrame:
+    """Load the geometry of the annotations of a bounding box or mask table as a dataframe.
+
+    Only the id, frame and geometry columns are read. The boxes are returned in xyxy format in the units they are
+    stored in, and masks also keep their ``size`` and ``counts``.
+
+    Args:
+        dataset: The dataset.
+        table_name: Bounding box or mask table.
+        where: Optional filter on the rows.
+
+    Returns:
+        Dataframe with the ``id`` and frame columns, ``x0``, ``y0``, ``x1``, ``y1``, ``area`` and ``score``
+        (the confidence of boxes, the area of masks).
+    """
+    schema = dataset.info.tables.get(table_name)
+    if schema is None:
+        raise ValueError(f"Unknown table '{table_name}'.")
+    group_columns = _group_columns(dataset, table_name)
+    query = TableQueryBuilder(dataset.open_table(table_name), dataset._db_connection)
+
+    if is_bbox(schema):
+        query = query.select(["id", *group_columns, "coords", "format", "confidence"])
+        frame = (query.where(where) if where is not None else query).to_polars()
+        coords = pl.col("coords")
+        is_xywh = pl.col("format") == "xywh"
+        frame = frame.select(
+            "id",
+            *group_columns,
+            coords.list.get(0).cast(pl.Float64).alias("x0"),
+            coords.list.get(1).cast(pl.Float64).alias("y0"),
+            pl.when(is_xywh).then(coords.list.get(0) + coords.list.get(2)).otherwise(coords.list.get(2)).alias("x1"),
+            pl.when(is_xywh).then(coords.list.get(1) + coords.list.get(3)).otherwise(coords.list.get(3)).alias("y1"),
+            pl.col("confidence").cast(pl.Float64).alias("score"),
+        )
+        return frame.with_columns(
+            pl.col("x1").cast(pl.Float64),
+            pl.col("y1").cast(pl.Float64),
+            ((pl.col("x1") - pl.col("x0")) * (pl.col("y1") - pl.col("y0"))).cast(pl.Float64).alias("area"),
+        )
+
+    if is_compressed_rle(schema):
+        query = query.select(["id", *group_columns, "size", "counts"])
+        frame = (query.where(where) if where is not None else query).to_polars()
+        rles = [{"size": size, "counts": counts} for size, counts in zip(frame["size"], frame["counts"])]
+        boxes = rles_bbox(rles)
+        areas = rles_area(rles)
+        return frame.with_columns(
+            pl.Series("x0", boxes[:, 0]),
+            pl.Series("y0", boxes[:, 1]),
+            pl.Series("x1", boxes[:, 0] + boxes[:, 2]),
+            pl.Series("y1", boxes[:, 1] + boxes[:, 3]),
+            pl.Series("area", areas),
+            pl.Series("score", areas),
+        )
+
+    raise ValueError(f"Table '{table_name}' should be a bounding box or mask table but got {schema.__name__}.")
+
+
+def _overlapping_pairs(frame: pl.DataFrame, group_columns: list[str]) -> pl.DataFrame:
+    """Pair the annotations of the same frame whose boxes intersect, with the IoU of their boxes.
+
+    Frames are processed by chunks of about ``_PAIR_CHUNK_ROWS`` annotations, so the self-join stays bounded by
+    the size of the frames.
+
+    Args:
+        frame: Annotation geometry with a ``_row`` index column.
+        group_columns: Columns identifying the frame of an annotation.
+
+    Returns:
+        Dataframe of ``_group``, ``_row``, ``_row_other``, ``id``, ``other_id`` and ``iou``.
+    """
+    if group_columns:
+        groups = frame.select(group_columns).unique(maintain_order=True).with_row_index("_group")
+        frame = frame.join(groups, on=group_columns, how="left")
+    else:
+        frame = frame.with_columns(pl.lit(0, dtype=pl.UInt32).alias("_group"))
+    chunks = frame.group_by("_group").len().sort("_group")
+    chunks = chunks.select("_group", (pl.col("len").cum_sum() // _PAIR_CHUNK_ROWS).alias("_chunk"))
+    frame = frame.select("_row", "_group", "id", "x0", "y0", "x1", "y1", "area").join(chunks, on="_group")
+
+    intersection_width = pl.min_horizontal("x1", "x1_other") - pl.max_horizontal("x0", "x0_other")
+    intersection_height = pl.min_horizontal("y1", "y1_other") - pl.max_horizontal("y0", "y0_other")
+    intersection = intersection_width.clip(lower_bound=0) * intersection_height.clip(lower_bound=0)
+    pairs = [pl.DataFrame(schema={"_group": pl.UInt32, "_row": pl.UInt32, "_row_other": pl.UInt32, **_IOU_SCHEMA})]
+    for chunk in frame.partition_by("_chunk", include_key=False):
+        joined = chunk.join(chunk, on="_group", suffix="_other").filter(pl.col("_row") < pl.col("_row_other"))
+        joined = joined.with_columns(intersection.alias("_intersection")).filter(pl.col("_intersection") > 0)
+        union = pl.col("area") + pl.col("area_other") - pl.col("_intersection")
+        pairs.append(
+            joined.select(
+                pl.col("_group").cast(pl.UInt32),
+                "_row",
+                "_row_other",
+                "id",
+                pl.col("id_other").alias("other_id"),
+                (pl.col("_intersection") / union).alias("iou"),
+            )
+        )
+    return pl.concat(pairs)
+
+
+def _iou_pairs(dataset: "Dataset", table_name: str, where: str | None) -> tuple[pl.DataFrame, pl.DataFrame]:
+    """Load the geometry of a table, with a ``_row`` index, and the IoU of its overlapping pairs."""
+    frame = load_annotation_geometry(dataset, table_name, where).with_row_index("_row")
+    pairs = _overlapping_pairs(frame, _group_columns(dataset, table_name))
+    if pairs.is_empty() or "counts" not in frame.columns:
+        return frame, pairs
+
+    # Masks only overlap if their boxes do, so mask IoUs are computed for the frames with overlapping boxes
+    rles = [{"size": size, "counts": counts} for size, counts in zip(frame["size"], frame["counts"])]
+    groups = []
+    for group in pairs.partition_by("_group", maintain_order=True):
+        first, second = group["_row"].to_numpy(), group["_row_other"].to_numpy()
+        rows, positions = np.unique(np.concatenate([first, second]), return_inverse=True)
+        group_rles = [rles[row] for row in rows.tolist()]
+        matrix = rles_iou(group_rles, group_rles)
+        groups.append(group.with_columns(pl.Series("iou", matrix[positions[: len(first)], positions[len(first) :]])))
+    return frame, pl.concat(groups)
+
+
+def compute_pairwise_iou(
+    dataset: "Dataset", table_name: str, min_iou: float = 0.0, where: str | None = None
+) -> pl.DataFrame:
+    """Compute the IoU of the overlapping pairs of annotations of the same frame in a bounding box or mask table.
+
+    Annotations are grouped by their ``record_id``, ``view_id``, ``frame_id`` and ``frame_index`` columns.
+    Pairs whose boxes do not intersect are skipped by a vectorized join, and mask IoUs are only computed for
+    the frames with intersecting boxes. Box coordinates are compared in the units they are stored in.
+
+    Args:
+        dataset: The dataset.
+        table_name: Bounding box or mask table.
+        min_iou: Only pairs with an IoU above this value are returned.
+        where: Optional filter on the rows.
+
+    Returns:
+        Dataframe of the frame columns, ``id``, ``other_id`` and ``iou`` of the pairs, in table order.
+    """
+    group_columns = _group_columns(dataset, table_name)
+    frame, pairs = _iou_pairs(dataset, table_name, where)
+    return (
+        pairs.filter(pl.col("iou") > min_iou)
+        .join(frame.select("_row", *group_columns), on="_row")
+        .sort("_row", "_row_other")
+        .select(*group_columns, *_IOU_SCHEMA)
+    )
+
+
+def flag_duplicates(
+    dataset: "Dataset", table_name: str, iou_threshold: float = 0.7, where: str | None = None
+) -> pl.DataFrame:
+    """Flag the duplicated annotations of a bounding box or mask table, like non-maximum suppression would.
+
+    In each frame, annotations are ranked by decreasing score, the confidence of boxes or the area of masks.
+    An annotation is a duplicate if its IoU with a better ranked annotation that is not a duplicate itself is
+    above the threshold.
+
+    Args:
+        dataset: The dataset.
+        table_name: Bounding box or mask table.
+        iou_threshold: IoU above which an annotation duplicates a better ranked one.
+        where: Optional filter on the rows.
+
+    Returns:
+        Dataframe of the ``id`` of every annotation and the ``duplicate_of`` id of the annotation it
+        duplicates, empty for kept annotations, in table order.
+    """
+    frame, pairs = _iou_pairs(dataset, table_name, where)
+    rank = np.empty(len(frame), dtype=np.int64)
+    rank[np.lexsort((np.arange(len(frame)), -frame["score"].to_numpy()))] = np.arange(len(frame))
+
+    candidates = pairs.filter(pl.col("iou") > iou_threshold).select("_row", "_row_other")
+    first, second = candidates["_row"].to_numpy(), candidates["_row_other"].to_numpy()
+    swap = rank[first] > rank[second]
+    better, worse = np.where(swap, second, first), np.where(swap, first, second)
+    # A pair is settled once its better ranked annotation is, so pairs are visited by rank of the worse one
+    order = np.lexsort((rank[better], rank[worse]))
+    duplicate_of = np.full(len(frame), -1, dtype=np.int64)
+    for kept, duplicate in zip(better[order].tolist(), worse[order].tolist()):
+        if duplicate_of[kept] < 0 and duplicate_of[duplicate] < 0:
+            duplicate_of[duplicate] = kept
+
+    ids = frame["id"]
+    return pl.DataFrame(
+        {
+            "id": ids,
+            "duplicate_of": [ids[int(row)] if row >= 0 else "" for row in duplicate_of.tolist()],
+        }
+    )
+
+
+def compute_shape_histograms(
+    dataset: "Dataset",
+    table_name: str,
+    area_bins: int | Sequence[float] = 20,
+    aspect_ratio_bins: int | Sequence[float] = 20,
+    where: str | None = None,
+) -> ShapeHistograms:
+    """Compute the histograms of the areas and aspect ratios of the annotations of a bounding box or mask table.
+
+    Args:
+        dataset: The dataset.
+        table_name: Bounding box or mask table.
+        area_bins: Number of area bins, or their edges.
+        aspect_ratio_bins: Number of aspect ratio bins, or their edges.
+        where: Optional filter on the rows.
+
+    Returns:
+        The histograms.
+    """
+    frame = load_annotation_geometry(dataset, table_name, where)
+    areas = frame["area"].to_numpy()
+    widths = (frame["x1"] - frame["x0"]).to_numpy()
+    heights = (frame["y1"] - frame["y0"]).to_numpy()
+    aspect_ratios = widths[heights > 0] / heights[heights > 0]
+
+    area_counts, area_edges = np.histogram(areas, bins=area_bins)
+    aspect_ratio_counts, aspect_ratio_edges = np.histogram(aspect_ratios, bins=aspect_ratio_bins)
+    return ShapeHistograms(
+        table_name=table_name,
+        num_rows=len(frame),
+        area_edges=area_edges.tolist(),
+        area_counts=area_counts.tolist(),
+        aspect_ratio_edges=aspect_ratio_edges.tolist(),
+        aspect_ratio_counts=aspect_ratio_counts.tolist(),
+    )
@@ -0,0 +1,121 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Iterator
+
+import shortuuid
+
+
+BLOB_URI_PREFIX = "blob:sha256:"
+
+
+def blob_uri(digest: str) -> str:
+    """Return the view ``uri`` referencing a blob of the store."""
+    return f"{BLOB_URI_PREFIX}{digest}"
+
+
+def parse_blob_uri(uri: str) -> str | None:
+    """Return the digest referenced by a view ``uri``, or ``None`` if it does not reference the blob store."""
+    if uri.startswith(BLOB_URI_PREFIX):
+        return uri[len(BLOB_URI_PREFIX) :]
+    return None
+
+
+class BlobStore:
+    """Content-addressed store of media files inside a dataset directory.
+
+    Blobs are keyed by the SHA-256 digest of their content, so identical media are stored once, and are sharded
+    in sub-directories named after the first two characters of their digest.
+
+    Attributes:
+        root: Directory of the store. It is created with the first blob.
+    """
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Directory of the store.
+        """
+        self.root = root
+
+    def path(self, digest: str) -> Path:
+        """Path of the file holding a blob."""
+        if len(digest) != 64 or not all(c in "0123456789abcdef" for c in digest):
+            raise ValueError(f"Invalid blob digest '{digest}'")
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """Store a blob if it is not stored yet, or refresh its modification time otherwise.
+
+        The modification time of a blob is the last time it was stored, which protects it from
+        :meth:`prune` until the rows that reference it are committed.
+
+        Args:
+            data: Content of the blob.
+
+        Returns:
+            Digest of the blob.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.path(digest)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(f"{digest}.{shortuuid.uuid()}.tmp")
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        return digest
+
+    def get(self, digest: str) -> bytes | None:
+        """Read a blob, or return ``None`` if it is not stored."""
+        try:
+            return self.path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def digests(self) -> Iterator[str]:
+        """Iterate over the digests of the stored blobs."""
+        if not self.root.is_dir():
+            return
+        for shard in self.root.iterdir():
+            if shard.is_dir():
+                for path in shard.iterdir():
+                    if not path.name.endswith(".tmp"):
+                        yield path.name
+
+    def prune(self, referenced: set[str], older_than: timedelta = timedelta(0)) -> int:
+        """Delete the blobs that are not referenced.
+
+        Args:
+            referenced: Digests of the blobs to keep.
+            older_than: Only delete the blobs that were last stored longer ago than this.
+
+        Returns:
+            Number of deleted blobs.
+        """
+        deleted = 0
+        threshold = time.time() - older_than.total_seconds()
+        for digest in list(self.digests()):
+            if digest in referenced:
+                continue
+            path = self.path(digest)
+            try:
+                if path.stat().st_mtime >= threshold:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+        return deleted
@@ -5,9 +5,14 @@
 # =====================================
 
 import warnings
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Literal
 
+import polars as pl
+import pyarrow as pa
+
+from pixano.datasets.queries import TableQueryBuilder
 from pixano.datasets.utils.errors import DatasetIntegrityError
 from pixano.schemas import SchemaGroup, canonical_table_name_for_slot
 
@@ -18,6 +23,9 @@ if TYPE_CHECKING:
     from pixano.datasets import Dataset
 
 
+_ID_QUERY_CHUNK_SIZE = 10_000
+
+
 class IntegrityCheck(Enum):
     """Integrity check types."""
 
@@ -94,10 +102,8 @@ def check_table_integrity(
         raise ValueError(f"Unknown table '{table_name}'.")
 
     if schemas is None:
-        validating_existing_rows = True
-        schemas = dataset.get_data(table_name, limit=dataset.open_table(table_name).count_rows())
-    else:
-        validating_existing_rows = False
+        errors = compute_integrity_report(dataset, [table_name])[table_name].to_errors()
+        return [error for error in errors if error[0] not in ignore]
 
     errors: list[tuple[IntegrityCheck, str, str, str, Any]] = []
 
@@ -115,7 +121,7 @@ def check_table_integrity(
                 errors.append((IntegrityCheck.UNIQUE_ID, table_name, "id", schema_id, schema_id))
 
         # Check against existing table IDs only when validating incoming rows.
-        if not updating and not validating_existing_rows and schemas and table_name in dataset.info.tables:
+        if not updating and schemas and table_name in dataset.info.tables:
             incoming_ids = {schema.id for schema in schemas if schema.id}
             found = dataset.find_ids_in_table(table_name, incoming_ids)
             for schema in schemas:
@@ -126,6 +132,9 @@ def check_table_integrity(
     if IntegrityCheck.FK_ID in ignore:
         return errors
 
+    # Collect FK values per target table, then resolve them with one query per table
+    fk_values_by_target: dict[str, set[str]] = {}
+    fk_lookups: list[tuple[str, str, str, list[str]]] = []
     for schema in schemas:
         for field_name, field_value in _schema_id_fields(schema):
             if field_value == "":
@@ -133,27 +142,164 @@ def check_table_integrity(
             target_tables = _resolve_fk_target_tables(dataset, table_name, field_name)
             if not target_tables:
                 continue
-
-            fk_found = False
+            fk_lookups.append((schema.id, field_name, field_value, target_tables))
             for target_table in target_tables:
-                try:
-                    if dataset.find_ids_in_table(target_table, {field_value}).get(field_value, False):
-                        fk_found = True
-                        break
-                except Exception:
-                    continue
+                fk_values_by_target.setdefault(target_table, set()).add(field_value)
 
-            if not fk_found:
-                errors.append((IntegrityCheck.FK_ID, table_name, field_name, schema.id, field_value))
+    db_found: dict[str, set[str]] = {}
+    for target_table, values in fk_values_by_target.items():
+        try:
+            result = dataset.find_ids_in_table(target_table, values)
+            db_found[target_table] = {value for value, found in result.items() if found}
+        except Exception:
+            db_found[target_table] = set()
+
+    for schema_id, field_name, field_value, target_tables in fk_lookups:
+        if not any(field_value in db_found.get(target_table, set()) for target_table in target_tables):
+            errors.append((IntegrityCheck.FK_ID, table_name, field_name, schema_id, field_value))
 
     return errors
 
 
+@dataclass
+class TableIntegrityReport:
+    """Integrity summary of one table.
+
+    Attributes:
+        table_name: Table name.
+        num_rows: Number of rows in the table.
+        missing_ids: Number of rows with an empty id.
+        duplicate_ids: Ids used by more than one row.
+        invalid_foreign_keys: Mapping of `*_id` field name to the `(row id, value)` pairs not found in the
+            target tables.
+        orphan_ids: Ids of records without any view. Reported for the record table only, they do not count
+            as errors.
+    """
+
+    table_name: str
+    num_rows: int = 0
+    missing_ids: int = 0
+    duplicate_ids: list[str] = field(default_factory=list)
+    invalid_foreign_keys: dict[str, list[tuple[str, str]]] = field(default_factory=dict)
+    orphan_ids: list[str] = field(default_factory=list)
+
+    @property
+    def invalid_foreign_key_count(self) -> int:
+        """Return the number of invalid foreign key values."""
+        return sum(len(pairs) for pairs in self.invalid_foreign_keys.values())
+
+    @property
+    def error_count(self) -> int:
+        """Return the total number of errors."""
+        return self.missing_ids + len(self.duplicate_ids) + self.invalid_foreign_key_count
+
+    @property
+    def is_valid(self) -> bool:
+        """Return True if no errors were recorded."""
+        return self.error_count == 0
+
+    def to_errors(self) -> list[tuple[IntegrityCheck, str, str, str, Any]]:
+        """Return the errors in the format of [check_table_integrity][pixano.datasets.utils.check_table_integrity]."""
+        errors: list[tuple[IntegrityCheck, str, str, str, Any]] = [
+            (IntegrityCheck.DEFINED_ID, self.table_name, "id", "", "")
+        ] * self.missing_ids
+        errors.extend(
+            (IntegrityCheck.UNIQUE_ID, self.table_name, "id", row_id, row_id) for row_id in self.duplicate_ids
+        )
+        for field_name, pairs in self.invalid_foreign_keys.items():
+            errors.extend(
+                (IntegrityCheck.FK_ID, self.table_name, field_name, row_id, value) for row_id, value in pairs
+            )
+        return errors
+
+
+def _load_id_columns(dataset: "Dataset", table_name: str) -> pl.DataFrame:
+    """Load the `id` and string `*_id` columns of a table."""
+    table = dataset.open_table(table_name)
+    columns = [
+        column.name
+        for column in table.schema
+        if column.name == "id" or (column.name.endswith("_id") and pa.types.is_string(column.type))
+    ]
+    return TableQueryBuilder(table, dataset._db_connection).select(columns).to_polars()
+
+
+def compute_integrity_report(
+    dataset: "Dataset", table_names: list[str] | None = None
+) -> dict[str, TableIntegrityReport]:
+    """Check the integrity of the rows stored in a dataset.
+
+    Only the `id` and `*_id` columns of the tables are loaded. Duplicated ids are found with a group-by, and
+    foreign keys and orphans with hash anti-joins against the id columns of the target tables, so each table
+    is read once whatever the number of rows.
+
+    Args:
+        dataset: The dataset to check.
+        table_names: Tables to report on. Defaults to all tables.
+
+    Returns:
+        Mapping of table name to its integrity report.
+    """
+    frames: dict[str, pl.DataFrame] = {}
+
+    def id_frame(table_name: str) -> pl.DataFrame:
+        if table_name not in frames:
+            frames[table_name] = _load_id_columns(dataset, table_name)
+        return frames[table_name]
+
+    def known_ids(table_name: str) -> pl.DataFrame:
+        if table_name not in dataset.info.tables:
+            return pl.DataFrame(schema={"id": pl.String})
+        return id_frame(table_name).select("id").unique()
+
+    reports: dict[str, TableIntegrityReport] = {}
+    for table_name in table_names if table_names is not None else list(dataset.info.tables):
+        if table_name not in dataset.info.tables:
+            raise ValueError(f"Unknown table '{table_name}'.")
+        frame = id_frame(table_name)
+        report = TableIntegrityReport(table_name=table_name, num_rows=len(frame))
+
+        report.missing_ids = frame.filter(pl.col("id") == "").height
+        report.duplicate_ids = (
+            frame.filter(pl.col("id") != "").group_by("id").len().filter(pl.col("len") > 1)["id"].sort().to_list()
+        )
+
+        for field_name in frame.columns:
+            if field_name == "id":
+                continue
+            target_tables = _resolve_fk_target_tables(dataset, table_name, field_name)
+            if not target_tables:
+                continue
+            references = frame.select("id", field_name).filter(pl.col(field_name) != "")
+            for target_table in target_tables:
+                if references.is_empty():
+                    break
+                references = references.join(
+                    known_ids(target_table).rename({"id": field_name}), on=field_name, how="anti"
+                )
+            if not references.is_empty():
+                report.invalid_foreign_keys[field_name] = list(references.iter_rows())
+
+        if table_name == SchemaGroup.RECORD.value:
+            view_tables = sorted(dataset.info.groups.get(SchemaGroup.VIEW, set()))
+            referenced = [id_frame(view_table).select(pl.col("record_id").alias("id")) for view_table in view_tables]
+            orphans = frame.select("id")
+            if referenced:
+                orphans = orphans.join(pl.concat(referenced).unique(), on="id", how="anti")
+            report.orphan_ids = orphans["id"].sort().to_list()
+
+        reports[table_name] = report
+    return reports
+
+
 def check_dataset_integrity(dataset: "Dataset") -> list[tuple[IntegrityCheck, str, str, str, Any]]:
-    """Check integrity for all dataset tables."""
+    """Check integrity for all dataset tables.
+
+    See [compute_integrity_report][pixano.datasets.utils.integrity.compute_integrity_report] for per-table counts.
+    """
     check_errors: list[tuple[IntegrityCheck, str, str, str, Any]] = []
-    for table_name in dataset.info.tables.keys():
-        check_errors.extend(check_table_integrity(table_name, dataset))
+    for report in compute_integrity_report(dataset).values():
+        check_errors.extend(report.to_errors())
     return check_errors
 
 
@@ -166,14 +312,14 @@ def handle_integrity_errors(
         return
 
     message = "Integrity check errors:\n"
-    for check_type, table_name, field_name, schema_id, field in check_errors:
+    for check_type, table_name, field_name, schema_id, value in check_errors:
         if check_type == IntegrityCheck.DEFINED_ID:
             message += f"- Missing id in table '{table_name}'.\n"
         elif check_type == IntegrityCheck.UNIQUE_ID:
             message += f"- Duplicate id '{schema_id}' in table '{table_name}'.\n"
         elif check_type == IntegrityCheck.FK_ID:
             message += (
-                f"- Invalid foreign key '{field_name}'='{field}' in table '{table_name}' for row '{schema_id}'.\n"
+                f"- Invalid foreign key '{field_name}'='{value}' in table '{table_name}' for row '{schema_id}'.\n"
             )
 
     if raise_or_warn == "raise":
@@ -255,3 +401,76 @@ def validate_batch(
             errors.append((IntegrityCheck.FK_ID, table_name, field_name, schema_id, field_value))
 
     handle_integrity_errors(errors, raise_or_warn=raise_or_warn)
+
+
+def _find_existing_ids(dataset: "Dataset", table_name: str, values: pl.Series) -> pl.Series:
+    """Return the values that are ids of `table_name`, querying the table by chunks."""
+    found: list[str] = []
+    for start in range(0, len(values), _ID_QUERY_CHUNK_SIZE):
+        chunk = set(values.slice(start, _ID_QUERY_CHUNK_SIZE).to_list())
+        result = dataset.find_ids_in_table(table_name, chunk)
+        found.extend(value for value, is_found in result.items() if is_found)
+    return pl.Series(values.name, found, dtype=pl.String)
+
+
+def validate_arrow_batch(
+    table_name: str,
+    batch: pa.Table,
+    dataset: "Dataset",
+    raise_or_warn: Literal["raise", "warn", "none"] = "raise",
+    pending_ids: dict[str, pl.Series] | None = None,
+) -> None:
+    """Validate an Arrow batch before insertion.
+
+    Arrow counterpart of [validate_batch][pixano.datasets.utils.integrity.validate_batch]: only the `id` and `*_id`
+    columns are read, and checks are computed with vectorized filters and anti-joins instead of per-row lookups.
+    Ids already stored in `table_name` are reported as duplicates.
+
+    Args:
+        table_name: The table the batch will be inserted into.
+        batch: The rows to validate.
+        dataset: The dataset (used for bulk FK lookups against already-inserted data).
+        raise_or_warn: How to handle errors: "raise", "warn", or "none".
+        pending_ids: Mapping of table_name -> ids that are inserted in the same call, so sibling tables can
+            resolve each other's FKs.
+    """
+    id_columns = [name for name in batch.column_names if name == "id" or name.endswith("_id")]
+    frame = pl.from_arrow(batch.select(id_columns))
+    if not isinstance(frame, pl.DataFrame) or "id" not in frame.columns:
+        raise ValueError(f"Batch for table '{table_name}' has no 'id' column.")
+
+    errors: list[tuple[IntegrityCheck, str, str, str, Any]] = []
+
+    # DEFINED_ID + UNIQUE_ID checks
+    missing_ids = frame.filter(pl.col("id").fill_null("") == "")
+    errors.extend((IntegrityCheck.DEFINED_ID, table_name, "id", "", "") for _ in range(len(missing_ids)))
+    duplicate_ids = frame.filter((pl.col("id").fill_null("") != "") & ~pl.col("id").is_first_distinct())["id"]
+    errors.extend((IntegrityCheck.UNIQUE_ID, table_name, "id", row_id, row_id) for row_id in duplicate_ids)
+    incoming_ids = frame.filter(pl.col("id").fill_null("") != "")["id"].unique()
+    stored_ids = _find_existing_ids(dataset, table_name, incoming_ids)
+    errors.extend((IntegrityCheck.UNIQUE_ID, table_name, "id", row_id, row_id) for row_id in stored_ids)
+
+    # FK_ID checks: anti-join each FK column against pending ids, then against the FK target tables
+    for field_name in frame.columns:
+        if field_name == "id" or frame.schema[field_name] != pl.String:
+            continue
+        target_tables = _resolve_fk_target_tables(dataset, table_name, field_name)
+        if not target_tables:
+            continue
+
+        references = frame.select("id", field_name).filter(pl.col(field_name).fill_null("") != "")
+        for target_table in target_tables:
+            target_ids = (pending_ids or {}).get(target_table)
+            if target_ids is not None and not references.is_empty():
+                references = references.join(target_ids.alias(field_name).to_frame(), on=field_name, how="anti")
+        for target_table in target_tables:
+            if references.is_empty():
+                break
+            found = _find_existing_ids(dataset, target_table, references[field_name].unique())
+            references = references.join(found.to_frame(), on=field_name, how="anti")
+
+        errors.extend(
+            (IntegrityCheck.FK_ID, table_name, field_name, row_id, value) for row_id, value in references.iter_rows()
+        )
+
+    handle_integrity_errors(errors, raise_or_warn=raise_or_warn)
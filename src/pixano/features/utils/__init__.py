@@ -22,16 +22,19 @@ from .image import (
     rle_to_urle,
     urle_to_rle,
 )
+from .rle import decode_rle_counts, encode_rle_counts, rles_area, rles_bbox, rles_iou
 
 
 __all__ = [
     "binary_to_url",
     "create_instance_of_schema",
     "create_instance_of_pixano_type",
+    "decode_rle_counts",
     "denormalize_coords",
     "depth_array_to_gray",
     "depth_file_to_binary",
     "encode_rle",
+    "encode_rle_counts",
     "generate_text_image_base64",
     "image_to_binary",
     "mask_area",
@@ -39,6 +42,9 @@ __all__ = [
     "mask_to_rle",
     "normalize_coords",
     "polygons_to_rle",
+    "rles_area",
+    "rles_bbox",
+    "rles_iou",
     "rle_to_urle",
     "rle_to_mask",
     "rle_to_polygons",
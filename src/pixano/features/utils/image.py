@@ -7,13 +7,14 @@
 import base64
 import io
 from io import BytesIO
-from itertools import groupby
 
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 from pycocotools import mask as mask_api
 
+from .rle import decode_rle_counts, encode_rle_counts, rles_bbox
+
 
 def image_to_binary(image: Image.Image, im_format: str = "PNG") -> bytes:
     """Encode an image from Pillow to binary.
@@ -127,6 +128,57 @@ def mask_to_rle(mask: Image.Image | np.ndarray) -> dict:
     return mask_api.encode(mask_array)
 
 
+def label_image_to_rles(labels: Image.Image | np.ndarray, background: int = 0) -> dict[int, dict]:
+    """Encode every label of a label image to RLE in a single pass.
+
+    The runs of the column-major label image are computed once and grouped by label, so the cost does not
+    depend on the number of labels.
+
+    Args:
+        labels: Label image as Pillow or NumPy array, each pixel holding an object id. Multi-channel images
+            (e.g. label masks saved as RGB) are reduced to their first channel.
+        background: Label of the background, which is not encoded.
+
+    Returns:
+        Mapping of label to its mask as RLE, sorted by label.
+    """
+    label_array = np.asarray(labels)
+    if label_array.ndim == 3:
+        label_array = label_array[:, :, 0]
+    if label_array.ndim != 2:
+        raise ValueError("Label image must be a 2D or a multi-channel array")
+    height, width = label_array.shape
+    flat = label_array.ravel(order="F")
+    if flat.size == 0:
+        return {}
+
+    boundaries = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [flat.size]))
+    run_labels = flat[starts]
+    foreground = run_labels != background
+    starts, ends, run_labels = starts[foreground], ends[foreground], run_labels[foreground]
+
+    order = np.argsort(run_labels, kind="stable")
+    starts, ends, run_labels = starts[order], ends[order], run_labels[order]
+    unique_labels, group_starts = np.unique(run_labels, return_index=True)
+    group_ends = np.append(group_starts[1:], len(run_labels))
+
+    rles: dict[int, dict] = {}
+    for label, group_start, group_end in zip(unique_labels.tolist(), group_starts, group_ends):
+        label_starts = starts[group_start:group_end]
+        label_ends = ends[group_start:group_end]
+        # Uncompressed counts alternate background and foreground run lengths, starting with background
+        counts = np.empty(2 * len(label_starts) + 1, dtype=np.int64)
+        counts[0:-1:2] = label_starts - np.concatenate(([0], label_ends[:-1]))
+        counts[1::2] = label_ends - label_starts
+        counts[-1] = flat.size - label_ends[-1]
+        if counts[-1] == 0:
+            counts = counts[:-1]
+        rles[label] = {"size": [height, width], "counts": encode_rle_counts(counts)}
+    return rles
+
+
 def rle_to_mask(rle: dict[str, list[int] | bytes]) -> np.ndarray:
     """Decode mask from RLE to NumPy array.
 
@@ -157,34 +209,37 @@ def polygons_to_rle(polygons: list[list], height: int, width: int) -> dict:
 def rle_to_polygons(rle: dict[str, list[int] | bytes]) -> list[list]:
     """Encode mask from RLE to polygons.
 
+    Contours are only traced in the bounding box of the mask.
+
     Args:
         rle: Mask as RLE.
 
     Returns:
-        Mask as polygons.
+        Mask as polygons, with normalized point coordinates.
     """
     if "size" not in rle:
         raise ValueError("RLE must have a size")
     h, w = rle["size"]
-    polygons, _ = mask_to_polygons(rle_to_mask(rle))
+    x, y, box_w, box_h = (int(v) for v in rles_bbox([rle])[0])
+    if box_w == 0 or box_h == 0:
+        return []
+    contours, _ = _mask_contours(rle_to_mask(rle)[y : y + box_h, x : x + box_w])
 
-    # Normalize point coordinates
-    for p in polygons:
-        p[::2] = [x / w for x in p[::2]]
-        p[1::2] = [y / h for y in p[1::2]]
+    # Shift point coordinates to the full mask and normalize them
+    offset = np.array([x + 0.5, y + 0.5])
+    scale = np.array([w, h], dtype=np.float64)
+    return [((contour.reshape(-1, 2) + offset) / scale).ravel().tolist() for contour in contours]
 
-    return polygons
 
-
-def mask_to_polygons(mask: np.ndarray) -> tuple[list[list], bool]:
-    """Encode mask from NumPy array to polygons.
+def _mask_contours(mask: np.ndarray) -> tuple[list[np.ndarray], bool]:
+    """Trace the contours of a mask that have at least 3 points.
 
     Args:
         mask: Mask as NumPy array
 
     Returns:
         Tuple:
-            - Mask as polygons
+            - Flattened integer point coordinates of the contours
             - True if mask has holes
     """
     # Some versions of cv2 does not support incontiguous arr
@@ -205,18 +260,27 @@ def mask_to_polygons(mask: np.ndarray) -> tuple[list[list], bool]:
     # Check if mask has holes
     has_holes = (hierarchy.reshape(-1, 4)[:, 3] >= 0).sum() > 0
 
-    res = res[-2]
-    res = [x.flatten() for x in res]
+    contours = [x.flatten() for x in res[-2]]
+    return [x for x in contours if len(x) >= 6], has_holes
+
+
+def mask_to_polygons(mask: np.ndarray) -> tuple[list[list], bool]:
+    """Encode mask from NumPy array to polygons.
+
+    Args:
+        mask: Mask as NumPy array
+
+    Returns:
+        Tuple:
+            - Mask as polygons
+            - True if mask has holes
+    """
+    contours, has_holes = _mask_contours(mask)
 
     # The coordinates from OpenCV are integers in range [0, W-1 or H-1].
     # We add 0.5 to turn them into real-value coordinate space. A better solution
     # would be to first +0.5 and then dilate the returned polygon by 0.5.
-    res = [x + 0.5 for x in res if len(x) >= 6]
-
-    # Convert np.array to lists
-    res = [x.tolist() for x in res]
-
-    return res, has_holes
+    return [(x + 0.5).tolist() for x in contours], has_holes
 
 
 def urle_to_rle(urle: dict[str, list[int]]) -> dict[str, list[int] | bytes]:
@@ -235,6 +299,8 @@ def urle_to_rle(urle: dict[str, list[int]]) -> dict[str, list[int] | bytes]:
 def rle_to_urle(rle: dict[str, list[int] | bytes]) -> dict[str, list[int]]:
     """Encode mask from RLE to uncompressed RLE.
 
+    The counts are converted directly, without decoding the mask.
+
     Args:
         rle: Mask as RLE.
 
@@ -243,13 +309,11 @@ def rle_to_urle(rle: dict[str, list[int] | bytes]) -> dict[str, list[int]]:
     """
     if "counts" not in rle or rle["counts"] is None:
         raise ValueError("RLE must have counts")
-    mask = rle_to_mask(rle)
-    urle = {"counts": [], "size": list(mask.shape)}
-
-    for i, (value, elements) in enumerate(groupby(mask.ravel(order="F"))):
-        urle["counts"].append(0 if i == 0 and value == 1 else len(list(elements)))
-
-    return urle
+    counts = rle["counts"]
+    return {
+        "counts": list(counts) if isinstance(counts, list) else decode_rle_counts(counts).tolist(),
+        "size": list(rle["size"]),
+    }
 
 
 def mask_area(rle: dict[str, list[int] | bytes]) -> float:
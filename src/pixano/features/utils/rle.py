@@ -0,0 +1,128 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+from typing import Mapping, Sequence
+
+import numpy as np
+from pycocotools import mask as mask_api
+
+
+def decode_rle_counts(counts: bytes | str) -> np.ndarray:
+    """Decode COCO compressed RLE counts to uncompressed counts without decoding the mask.
+
+    Uncompressed counts alternate background and foreground run lengths of the column-major mask, starting
+    with background.
+
+    Args:
+        counts: Compressed counts.
+
+    Returns:
+        Uncompressed counts.
+    """
+    if isinstance(counts, str):
+        counts = counts.encode("utf-8")
+    chars = np.frombuffer(counts, dtype=np.uint8).astype(np.int64) - 48
+    if chars.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    # Each count is a little-endian sequence of 5-bit chunks, the 0x20 bit flagging that more chunks follow
+    last_chunks = (chars & 0x20) == 0
+    if not last_chunks[-1]:
+        raise ValueError("Invalid RLE counts: truncated count")
+    ends = np.flatnonzero(last_chunks)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    num_chunks = ends - starts + 1
+    positions = np.arange(chars.size) - np.repeat(starts, num_chunks)
+    values = np.add.reduceat((chars & 0x1F) << (5 * positions), starts)
+    negative = (chars[ends] & 0x10) != 0
+    values[negative] -= np.left_shift(1, 5 * num_chunks[negative])
+    # From the fourth count on, counts are stored as deltas to the count two positions before
+    values[1::2] = np.cumsum(values[1::2])
+    values[2::2] = np.cumsum(values[2::2])
+    return values
+
+
+def encode_rle_counts(counts: Sequence[int] | np.ndarray) -> bytes:
+    """Encode uncompressed RLE counts to COCO compressed RLE counts without decoding the mask.
+
+    Args:
+        counts: Uncompressed counts.
+
+    Returns:
+        Compressed counts.
+    """
+    values = np.asarray(counts, dtype=np.int64).copy()
+    if values.size == 0:
+        return b""
+    values[3:] -= np.asarray(counts, dtype=np.int64)[1:-2]
+
+    columns = []
+    active = np.ones(values.size, dtype=bool)
+    while active.any():
+        chunks = values & 0x1F
+        values >>= 5
+        more = active & np.where((chunks & 0x10) != 0, values != -1, values != 0)
+        columns.append(np.where(active, np.where(more, chunks | 0x20, chunks) + 48, -1))
+        active = more
+    chars = np.stack(columns, axis=1)
+    return chars[chars >= 0].astype(np.uint8).tobytes()
+
+
+def _as_coco_rles(rles: Sequence[Mapping]) -> list[dict]:
+    """Return RLEs in the layout expected by pycocotools."""
+    return [{"size": list(rle["size"]), "counts": rle["counts"]} for rle in rles]
+
+
+def rles_area(rles: Sequence[Mapping]) -> np.ndarray:
+    """Compute the areas of masks.
+
+    Args:
+        rles: Masks as RLE.
+
+    Returns:
+        Areas in pixels, of shape ``(N,)``.
+    """
+    if len(rles) == 0:
+        return np.zeros(0, dtype=np.float64)
+    return mask_api.area(_as_coco_rles(rles)).astype(np.float64)
+
+
+def rles_bbox(rles: Sequence[Mapping], normalized: bool = False) -> np.ndarray:
+    """Compute the bounding boxes of masks.
+
+    Args:
+        rles: Masks as RLE.
+        normalized: Whether to normalize the boxes by the mask sizes.
+
+    Returns:
+        xywh boxes, of shape ``(N, 4)``. Empty masks have a null box.
+    """
+    if len(rles) == 0:
+        return np.zeros((0, 4), dtype=np.float64)
+    boxes = mask_api.toBbox(_as_coco_rles(rles)).astype(np.float64)
+    if normalized:
+        sizes = np.array([rle["size"] for rle in rles], dtype=np.float64)
+        scale = np.maximum(sizes[:, [1, 0, 1, 0]], 1.0)
+        boxes /= scale
+    return boxes
+
+
+def rles_iou(rles: Sequence[Mapping], other_rles: Sequence[Mapping]) -> np.ndarray:
+    """Compute the pairwise intersection over union of two sets of masks of the same size.
+
+    Args:
+        rles: First masks as RLE.
+        other_rles: Second masks as RLE.
+
+    Returns:
+        IoU matrix, of shape ``(N, M)``.
+    """
+    if len(rles) == 0 or len(other_rles) == 0:
+        return np.zeros((len(rles), len(other_rles)), dtype=np.float64)
+    sizes = {tuple(rle["size"]) for rle in [*rles, *other_rles]}
+    if len(sizes) != 1:
+        raise ValueError(f"All masks must have the same size, got {sorted(sizes)}")
+    ious = mask_api.iou(_as_coco_rles(rles), _as_coco_rles(other_rles), [0] * len(other_rles))
+    return np.asarray(ious, dtype=np.float64).reshape(len(rles), len(other_rles))
@@ -4,7 +4,7 @@
 # License: CECILL-C
 # =====================================
 
-from typing import Any
+from typing import Any, Sequence
 
 import numpy as np
 from PIL import Image as pil_image
@@ -12,6 +12,7 @@ from pydantic import field_serializer, field_validator, model_validator
 from typing_extensions import Self
 
 from pixano.features.utils import image as image_utils
+from pixano.features.utils import rle as rle_utils
 from pixano.utils import issubclass_strict
 
 from .per_frame_annotation import PerFrameAnnotation
@@ -70,7 +71,7 @@ class CompressedRLE(PerFrameAnnotation):
         Returns:
             Mask area
         """
-        return image_utils.mask_area({"size": self.size, "counts": self.counts})
+        return image_utils.mask_area(self._rle)
 
     def to_mask(self) -> np.ndarray:
         """Convert the compressed RLE mask to a NumPy array.
@@ -78,7 +79,7 @@ class CompressedRLE(PerFrameAnnotation):
         Returns:
             The mask as a NumPy array.
         """
-        return image_utils.rle_to_mask({"size": self.size, "counts": self.counts})
+        return image_utils.rle_to_mask(self._rle)
 
     def to_urle(self) -> dict[str, list[int]]:
         """Convert compressed RLE mask to uncompressed RLE.
@@ -86,7 +87,7 @@ class CompressedRLE(PerFrameAnnotation):
         Returns:
             The mask as an uncompressed RLE.
         """
-        return image_utils.rle_to_urle(self.model_dump())
+        return image_utils.rle_to_urle(self._rle)
 
     def to_polygons(self) -> list[list]:
         """Convert the compressed RLE mask to poylgons.
@@ -94,7 +95,62 @@ class CompressedRLE(PerFrameAnnotation):
         Returns:
             The mask as polygons.
         """
-        return image_utils.rle_to_polygons(self.model_dump())
+        return image_utils.rle_to_polygons(self._rle)
+
+    @property
+    def _rle(self) -> dict[str, Any]:
+        """Return the mask as a pycocotools RLE."""
+        return {"size": self.size, "counts": self.counts}
+
+    @staticmethod
+    def batch_area(masks: Sequence["CompressedRLE"]) -> np.ndarray:
+        """Compute the areas of masks in a single call.
+
+        Args:
+            masks: The masks.
+
+        Returns:
+            Areas in pixels, of shape ``(N,)``.
+        """
+        return rle_utils.rles_area([mask._rle for mask in masks])
+
+    @staticmethod
+    def batch_bbox(masks: Sequence["CompressedRLE"], normalized: bool = False) -> np.ndarray:
+        """Compute the bounding boxes of masks in a single call.
+
+        Args:
+            masks: The masks.
+            normalized: Whether to normalize the boxes by the mask sizes.
+
+        Returns:
+            xywh boxes, of shape ``(N, 4)``.
+        """
+        return rle_utils.rles_bbox([mask._rle for mask in masks], normalized=normalized)
+
+    @staticmethod
+    def batch_iou(masks: Sequence["CompressedRLE"], other_masks: Sequence["CompressedRLE"]) -> np.ndarray:
+        """Compute the pairwise intersection over union of two sets of masks of the same size.
+
+        Args:
+            masks: The first masks.
+            other_masks: The second masks.
+
+        Returns:
+            IoU matrix, of shape ``(N, M)``.
+        """
+        return rle_utils.rles_iou([mask._rle for mask in masks], [mask._rle for mask in other_masks])
+
+    @staticmethod
+    def batch_to_urle(masks: Sequence["CompressedRLE"]) -> list[dict[str, list[int]]]:
+        """Convert compressed RLE masks to uncompressed RLEs without decoding them.
+
+        Args:
+            masks: The masks.
+
+        Returns:
+            The masks as uncompressed RLEs.
+        """
+        return [image_utils.rle_to_urle(mask._rle) for mask in masks]
 
     @staticmethod
     def from_mask(mask: pil_image.Image | np.ndarray, **kwargs: Any) -> "CompressedRLE":
@@ -110,6 +166,25 @@ class CompressedRLE(PerFrameAnnotation):
         rle = image_utils.mask_to_rle(mask)
         return CompressedRLE(size=rle["size"], counts=rle["counts"], **kwargs)
 
+    @staticmethod
+    def from_label_image(
+        labels: pil_image.Image | np.ndarray, background: int = 0, **kwargs: Any
+    ) -> dict[int, "CompressedRLE"]:
+        """Create one compressed RLE mask per label of a label image, in a single pass over the image.
+
+        Args:
+            labels: Label image, each pixel holding an object id.
+            background: Label of the background, which is not encoded.
+            kwargs: Additional arguments.
+
+        Returns:
+            Mapping of label to its compressed RLE mask, sorted by label.
+        """
+        return {
+            label: CompressedRLE(**rle, **kwargs)
+            for label, rle in image_utils.label_image_to_rles(labels, background=background).items()
+        }
+
     @staticmethod
     def from_urle(urle: dict[str, list[int]], **kwargs: Any) -> "CompressedRLE":
         """Create a compressed RLE mask from an uncompressed RLE.
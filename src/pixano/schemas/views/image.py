@@ -24,19 +24,42 @@ from .view import View
 def _generate_preview(pil_image: PILImage) -> bytes:
     """Generate a 64x64 PNG thumbnail from a PIL image.
 
+    The image is thumbnailed in place so that a freshly opened JPEG is decoded at a reduced scale
+    (``PIL.Image.Image.draft``) instead of at full resolution. Read its size and format before calling.
+
     Args:
-        pil_image: Source PIL image (not modified in-place).
+        pil_image: Source PIL image, reduced in place.
 
     Returns:
         PNG-encoded thumbnail bytes.
     """
-    thumb = pil_image.copy()
-    thumb.thumbnail((64, 64))
+    pil_image.thumbnail((64, 64))
     buf = io.BytesIO()
-    thumb.save(buf, format="PNG")
+    pil_image.save(buf, format="PNG")
     return buf.getvalue()
 
 
+def probe_image_bytes(raw_bytes: bytes) -> dict[str, int | str | bytes]:
+    """Decode image bytes into the media fields of an ``Image``.
+
+    Args:
+        raw_bytes: Image file content as raw bytes.
+
+    Returns:
+        The *width*, *height*, *format*, *preview* and *preview_format* fields.
+    """
+    pil_image = PIL.Image.open(io.BytesIO(raw_bytes))
+    width, height = pil_image.size
+    fmt = pil_image.format or ""
+    return {
+        "width": width,
+        "height": height,
+        "format": fmt,
+        "preview": _generate_preview(pil_image),
+        "preview_format": "png",
+    }
+
+
 class Image(View):
     """Image record modality.
 
@@ -156,23 +179,12 @@ class Image(View):
         if id is None:
             id = shortuuid.uuid()
 
-        pil_image = PIL.Image.open(io.BytesIO(raw_bytes))
-
-        width = pil_image.width
-        height = pil_image.height
-        fmt = pil_image.format or ""
-        preview = _generate_preview(pil_image)
-
         return cls(
             id=id,
             record_id=record_id,
             logical_name=logical_name,
             raw_bytes=raw_bytes,
-            width=width,
-            height=height,
-            format=fmt,
-            preview=preview,
-            preview_format="png",
+            **probe_image_bytes(raw_bytes),
         )
 
 
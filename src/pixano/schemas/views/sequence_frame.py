@@ -16,7 +16,7 @@ import shortuuid
 
 from pixano.utils import issubclass_strict
 
-from .image import Image, _generate_preview
+from .image import Image, _generate_preview, probe_image_bytes
 
 
 class SequenceFrame(Image):
@@ -118,25 +118,14 @@ class SequenceFrame(Image):
         if id is None:
             id = shortuuid.uuid()
 
-        pil_image = PIL.Image.open(io.BytesIO(raw_bytes))
-
-        width = pil_image.width
-        height = pil_image.height
-        fmt = pil_image.format or ""
-        preview = _generate_preview(pil_image)
-
         return cls(
             id=id,
             record_id=record_id,
             logical_name=logical_name,
             raw_bytes=raw_bytes,
-            width=width,
-            height=height,
-            format=fmt,
-            preview=preview,
-            preview_format="png",
             timestamp=timestamp,
             frame_index=frame_index,
+            **probe_image_bytes(raw_bytes),
         )
 
 
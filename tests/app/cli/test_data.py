@@ -167,7 +167,7 @@ class TestImportWithInfo:
 
             assert result.exit_code == 0, result.output
             mock_builder_instance = mock_builder_cls.return_value
-            mock_builder_instance.build.assert_called_once_with(mode="overwrite")
+            mock_builder_instance.build.assert_called_once_with(mode="overwrite", flush_memory_budget=None)
 
     @patch("importlib.import_module")
     def test_add_mode(self, mock_import_module):
@@ -200,7 +200,7 @@ class TestImportWithInfo:
 
             assert result.exit_code == 0, result.output
             mock_builder_instance = mock_builder_cls.return_value
-            mock_builder_instance.build.assert_called_once_with(mode="add")
+            mock_builder_instance.build.assert_called_once_with(mode="add", flush_memory_budget=None)
 
     @patch("importlib.import_module")
     def test_dataset_name_derived_from_info_name(self, mock_import_module):
@@ -308,3 +308,19 @@ class TestImportWithInfo:
             assert result.exit_code != 0
             plain = re.sub(r"\x1b\[[0-9;]*m", "", result.output)
             assert "--info" in plain
+
+
+class TestOptimize:
+    @patch("pixano.datasets.Dataset")
+    def test_optimize_reports_created_indexes(self, mock_dataset_cls):
+        mock_dataset_cls.return_value.optimize.return_value = {"records": ["id", "split"], "images": []}
+        with tempfile.TemporaryDirectory() as tmp:
+            result = runner.invoke(app, ["data", "optimize", tmp, "--cleanup-older-than-days", "2"])
+
+        assert result.exit_code == 0, result.output
+        mock_dataset_cls.assert_called_once_with(Path(tmp))
+        _, kwargs = mock_dataset_cls.return_value.optimize.call_args
+        assert kwargs["cleanup_older_than"].days == 2
+        assert "- records: created indexes on id, split" in result.output
+        assert "images" not in result.output
+        assert "Optimized 2 tables." in result.output
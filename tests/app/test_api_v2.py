@@ -18,6 +18,7 @@ Cross-cutting tests:
 """
 
 import tempfile
+import threading
 from functools import lru_cache
 from pathlib import Path
 
@@ -26,6 +27,7 @@ import pytest
 from fastapi.testclient import TestClient
 
 from pixano.api.main import create_app
+from pixano.api.routers import views
 from pixano.api.settings import Settings, get_settings
 from pixano.datasets.builders.dataset_builder import DatasetBuilder
 from pixano.datasets.dataset import Dataset, DatasetInfo
@@ -339,6 +341,67 @@ class TestStaticImage:
         assert resp.status_code == 200
         assert resp.json()["confidence"] == 0.95
 
+    def test_bulk_create_and_update_bboxes(self, static_image_client: TestClient):
+        bboxes = [
+            {
+                "id": f"bbox_bulk_{i}",
+                "record_id": "record_0",
+                "entity_id": "entity_0_0",
+                "view_id": "image",
+                "coords": [0.1, 0.2, 0.3, 0.4],
+                "format": "xywh",
+                "is_normalized": True,
+                "confidence": 0.5,
+            }
+            for i in range(3)
+        ]
+        resp = static_image_client.post(f"{STATIC_BASE}/bboxes/bulk", json=bboxes)
+        assert resp.status_code == 201
+        assert [item["id"] for item in resp.json()] == ["bbox_bulk_0", "bbox_bulk_1", "bbox_bulk_2"]
+
+        resp = static_image_client.put(
+            f"{STATIC_BASE}/bboxes/bulk",
+            json=[{"id": "bbox_bulk_0", "confidence": 0.9}, {"id": "bbox_bulk_2", "confidence": 0.1}],
+        )
+        assert resp.status_code == 200
+        assert [item["confidence"] for item in resp.json()] == [0.9, 0.1]
+        assert static_image_client.get(f"{STATIC_BASE}/bboxes/bbox_bulk_1").json()["confidence"] == 0.5
+
+        resp = static_image_client.put(
+            f"{STATIC_BASE}/bboxes/bulk",
+            json=[{"id": "bbox_bulk_1", "confidence": 0.2}, {"id": "bbox_bulk_1", "confidence": 0.3}],
+        )
+        assert resp.status_code == 400
+        assert "bbox_bulk_1" in resp.json()["detail"]
+        assert static_image_client.get(f"{STATIC_BASE}/bboxes/bbox_bulk_1").json()["confidence"] == 0.5
+
+    def test_bulk_create_bboxes_rejects_missing_references(self, static_image_client: TestClient):
+        bboxes = [
+            {
+                "id": "bbox_bulk_invalid_0",
+                "record_id": "record_0",
+                "entity_id": "entity_0_0",
+                "coords": [0.0, 0.0, 0.1, 0.1],
+                "format": "xywh",
+                "is_normalized": True,
+            },
+            {
+                "id": "bbox_bulk_invalid_1",
+                "record_id": "record_0",
+                "entity_id": "missing_entity",
+                "coords": [0.0, 0.0, 0.1, 0.1],
+                "format": "xywh",
+                "is_normalized": True,
+            },
+        ]
+        resp = static_image_client.post(f"{STATIC_BASE}/bboxes/bulk", json=bboxes)
+        assert resp.status_code == 400
+        assert "missing_entity" in resp.json()["detail"]
+        assert static_image_client.get(f"{STATIC_BASE}/bboxes/bbox_bulk_invalid_0").status_code == 404
+
+        resp = static_image_client.put(f"{STATIC_BASE}/bboxes/bulk", json=[{"id": "missing_bbox", "confidence": 1}])
+        assert resp.status_code == 404
+
     def test_delete_bbox(self, static_image_client: TestClient):
         # Create then delete
         static_image_client.post(
@@ -716,6 +779,39 @@ class TestVideo:
         assert resp.headers["content-type"] == "image/png"
         assert resp.content == _blob_bytes("frame_preview_0_0")
 
+    def test_stream_sframe_blob_etag(self, video_client: TestClient):
+        resp = video_client.get(f"{VIDEO_BASE}/sframes/frame_0_1/blob")
+        assert resp.status_code == 200
+        assert resp.headers["accept-ranges"] == "bytes"
+        etag = resp.headers["etag"]
+
+        resp = video_client.get(f"{VIDEO_BASE}/sframes/frame_0_1/blob", headers={"If-None-Match": etag})
+        assert resp.status_code == 304
+        assert resp.headers["etag"] == etag
+        assert resp.content == b""
+
+        resp = video_client.get(f"{VIDEO_BASE}/sframes/frame_0_1/blob", headers={"If-None-Match": '"other"'})
+        assert resp.status_code == 200
+        assert resp.content == _blob_bytes("frame_0_1")
+
+        resp = video_client.get(f"{VIDEO_BASE}/sframes/missing/blob", headers={"If-None-Match": "*"})
+        assert resp.status_code == 404
+
+    def test_stream_sframe_blob_range(self, video_client: TestClient):
+        payload = _blob_bytes("frame_0_1")
+        resp = video_client.get(f"{VIDEO_BASE}/sframes/frame_0_1/blob", headers={"Range": "bytes=2-5"})
+        assert resp.status_code == 206
+        assert resp.headers["content-range"] == f"bytes 2-5/{len(payload)}"
+        assert resp.content == payload[2:6]
+
+        resp = video_client.get(f"{VIDEO_BASE}/sframes/frame_0_1/blob", headers={"Range": "bytes=-3"})
+        assert resp.status_code == 206
+        assert resp.content == payload[-3:]
+
+        resp = video_client.get(f"{VIDEO_BASE}/sframes/frame_0_1/blob", headers={"Range": f"bytes={len(payload)}-"})
+        assert resp.status_code == 416
+        assert resp.headers["content-range"] == f"bytes */{len(payload)}"
+
     def test_stream_record_sframe_batch(self, video_client: TestClient):
         resp = video_client.get(
             f"{VIDEO_BASE}/records/record_0/sframes/batch",
@@ -732,6 +828,56 @@ class TestVideo:
         assert _blob_bytes("frame_0_2") in resp.content
         assert _blob_bytes("frame_0_0") not in resp.content
 
+    def test_stream_record_sframe_batch_prefetches_next_batch(self, video_client: TestClient, video_dataset: Dataset):
+        views._blob_cache.clear()
+        resp = video_client.get(
+            f"{VIDEO_BASE}/records/record_0/sframes/batch", params={"start_frame": 0, "batch_size": 1}
+        )
+        assert resp.status_code == 200
+        assert _blob_bytes("frame_0_0") in resp.content
+        views._prefetch_executor.submit(lambda: None).result()
+
+        version = video_dataset.open_table("sequence_frames").version
+        cached = views._blob_cache.get(views._frame_cache_key(video_dataset, "frame_0_1", version))
+        assert cached is not None
+        assert cached.data == _blob_bytes("frame_0_1")
+        assert views._blob_cache.get(views._frame_cache_key(video_dataset, "frame_0_2", version)) is None
+
+        resp = video_client.get(
+            f"{VIDEO_BASE}/records/record_0/sframes/batch",
+            params={"start_frame": 1, "batch_size": 2, "prefetch": False},
+        )
+        assert resp.status_code == 200
+        assert resp.content.index(b"X-Frame-Index: 1") < resp.content.index(b"X-Frame-Index: 2")
+        assert _blob_bytes("frame_0_1") in resp.content
+        assert _blob_bytes("frame_0_2") in resp.content
+
+    def test_stream_record_sframe_batch_sends_one_part_per_frame(self, video_dataset: Dataset):
+        views._blob_cache.clear()
+        version = video_dataset.open_table("sequence_frames").version
+        frames = [(0, "frame_0_0"), (1, "deleted_frame"), (2, "frame_0_2")]
+
+        payloads = list(views._iter_cached_frame_payloads(video_dataset, frames, version))
+
+        assert [(index, data) for index, data, _ in payloads] == [
+            (0, _blob_bytes("frame_0_0")),
+            (1, b""),
+            (2, _blob_bytes("frame_0_2")),
+        ]
+
+    def test_prefetch_is_queued_once_per_window(self, video_dataset: Dataset):
+        release = threading.Event()
+        views._prefetch_executor.submit(release.wait)
+        version = video_dataset.open_table("sequence_frames").version
+        try:
+            views._submit_prefetch(video_dataset, "record_0", None, 1, 1, version)
+            views._submit_prefetch(video_dataset, "record_0", None, 1, 1, version)
+            assert views._prefetch_executor._work_queue.qsize() == 1
+        finally:
+            release.set()
+        views._prefetch_executor.submit(lambda: None).result()
+        assert not views._pending_prefetches
+
     def test_list_entities(self, video_client: TestClient):
         resp = video_client.get(f"{VIDEO_BASE}/entities")
         assert resp.status_code == 200
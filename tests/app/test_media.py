@@ -0,0 +1,92 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+import asyncio
+import io
+
+import pytest
+
+from pixano.api.media import BlobCache, CachedBlob, etag_matches, parse_byte_range, stream_response
+
+
+class TestBlobCache:
+    def test_evicts_least_recently_used(self):
+        cache = BlobCache(max_bytes=10, max_item_bytes=10)
+        cache.put("a", CachedBlob(b"1234", "image/png"))
+        cache.put("b", CachedBlob(b"1234", "image/png"))
+        assert cache.get("a") is not None
+        cache.put("c", CachedBlob(b"1234", "image/png"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").data == b"1234"
+        assert cache.get("c").data == b"1234"
+        assert cache.size_bytes == 8
+        assert len(cache) == 2
+
+    def test_skips_large_items(self):
+        cache = BlobCache(max_bytes=100, max_item_bytes=4)
+        cache.put("a", CachedBlob(b"12345", "image/png"))
+        assert cache.get("a") is None
+        assert cache.size_bytes == 0
+
+    def test_replace_and_clear(self):
+        cache = BlobCache(max_bytes=100)
+        cache.put("a", CachedBlob(b"1234", "image/png"))
+        cache.put("a", CachedBlob(b"12", "image/png"))
+        assert cache.size_bytes == 2
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size_bytes == 0
+
+
+def test_etag_matches():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"x"', '"abc"')
+    assert not etag_matches(None, '"abc"')
+
+
+@pytest.mark.parametrize(
+    "header,expected",
+    [
+        (None, None),
+        ("bytes=0-4", (0, 4)),
+        ("bytes=5-", (5, 9)),
+        ("bytes=-3", (7, 9)),
+        ("bytes=8-100", (8, 9)),
+        ("bytes=0-1,4-5", None),
+        ("items=0-1", None),
+    ],
+)
+def test_parse_byte_range(header, expected):
+    assert parse_byte_range(header, 10) == expected
+
+
+@pytest.mark.parametrize("header", ["bytes=10-", "bytes=5-2", "bytes=-0", "bytes=a-b"])
+def test_parse_byte_range_unsatisfiable(header):
+    with pytest.raises(ValueError):
+        parse_byte_range(header, 10)
+
+
+@pytest.mark.parametrize(
+    "header,status,body",
+    [(None, 200, b"0123456789"), ("bytes=2-6", 206, b"23456"), ("bytes=-3", 206, b"789"), ("bytes=10-", 416, b"")],
+)
+def test_stream_response(header, status, body):
+    stream = io.BytesIO(b"0123456789")
+    response = stream_response(stream, 10, "application/pdf", '"etag"', range_header=header, chunk_size=2)
+
+    async def collect() -> bytes:
+        if status == 416:
+            return b""
+        return b"".join([chunk async for chunk in response.body_iterator])
+
+    assert response.status_code == status
+    assert asyncio.run(collect()) == body
+    assert stream.closed
+    if status == 206:
+        assert response.headers["content-length"] == str(len(body))
@@ -184,3 +184,21 @@ def test_data_import_preserves_message_question_type(tmp_path: Path):
     assert rows[0]["question_type"] == "OPEN"
     assert rows[1]["type"] == "ANSWER"
     assert rows[1]["question_type"] == ""
+
+
+def test_data_check_reports_integrity(dataset_multi_view_tracking_and_image_copy):
+    dataset = dataset_multi_view_tracking_and_image_copy
+
+    result = runner.invoke(app, ["data", "check", str(dataset.path)])
+    assert result.exit_code == 0
+    assert "- bboxes: 10 rows, 0 missing ids, 0 duplicate ids, 0 invalid foreign keys" in result.output
+    assert "Integrity check passed." in result.output
+
+    bbox = dataset.get_data("bboxes", limit=1)[0].model_copy(deep=True)
+    bbox.id = "corrupt_bbox"
+    bbox.entity_id = "missing_entity"
+    dataset.open_table("bboxes").add([bbox])
+
+    result = runner.invoke(app, ["data", "check", str(dataset.path)])
+    assert result.exit_code == 1
+    assert "1 invalid foreign keys (entity_id=1)" in result.output
@@ -165,6 +165,42 @@ class TestDatasetBuilder:
 
         assert dataset.num_rows == 5 if mode == "overwrite" else 9
 
+    @pytest.mark.parametrize("flush_every_n_samples", [1, 3])
+    def test_build_pipelined(self, dataset_builder_image_bboxes_keypoint, flush_every_n_samples):
+        dataset = dataset_builder_image_bboxes_keypoint.build(
+            flush_every_n_samples=flush_every_n_samples, pipelined=True, num_workers=1, max_pending_flushes=1
+        )
+        assert dataset.num_rows == 5
+        assert dataset.open_table("bboxes").count_rows() == dataset.open_table("entities").count_rows()
+        assert dataset_builder_image_bboxes_keypoint._executor is None
+
+    @pytest.mark.parametrize("pipelined", [False, True])
+    def test_build_flush_memory_budget(self, dataset_builder_image_bboxes_keypoint, pipelined):
+        dataset = dataset_builder_image_bboxes_keypoint.build(flush_memory_budget=1, pipelined=pipelined)
+        stats = dataset_builder_image_bboxes_keypoint.flush_stats
+
+        assert dataset.num_rows == 5
+        assert [stat.index for stat in stats] == list(range(len(stats)))
+        assert sum(stat.num_rows.get("records", 0) for stat in stats) == 5
+        assert all(stat.reason == "memory" for stat in stats[:-1])
+        assert all(stat.total_nbytes > 0 and stat.write_seconds > 0 for stat in stats)
+
+        dataset_builder_image_bboxes_keypoint.build(mode="overwrite")
+        assert [stat.reason for stat in dataset_builder_image_bboxes_keypoint.flush_stats] == ["final"]
+
+    def test_build_pipelined_writer_error(self, dataset_builder_image_bboxes_keypoint):
+        dataset_builder_image_bboxes_keypoint._validate_batch = MagicMock(side_effect=RuntimeError("invalid batch"))
+        with pytest.raises(RuntimeError, match="invalid batch"):
+            dataset_builder_image_bboxes_keypoint.build(flush_every_n_samples=1, pipelined=True)
+        assert dataset_builder_image_bboxes_keypoint._validate_batch.call_count == 1
+
+        with pytest.raises(ValueError, match="max_pending_flushes should be greater than 0 but got 0"):
+            dataset_builder_image_bboxes_keypoint.build(pipelined=True, max_pending_flushes=0)
+        with pytest.raises(ValueError, match="worker_type should be 'process' or 'thread' but got fiber"):
+            dataset_builder_image_bboxes_keypoint.build(num_workers=2, worker_type="fiber")
+        with pytest.raises(ValueError, match="does not support mode 'sync'"):
+            dataset_builder_image_bboxes_keypoint.build(mode="sync")
+
     def test_build_error(self, dataset_builder_image_bboxes_keypoint):
         class WrongIdBuilder(DatasetBuilder):
             def generate_data(self):
@@ -188,7 +224,9 @@ class TestDatasetBuilder:
                 ),
             ).build()
 
-        with pytest.raises(ValueError, match="mode should be 'add', 'create' or 'overwrite' but got wrong_mode"):
+        with pytest.raises(
+            ValueError, match="mode should be 'add', 'create', 'overwrite' or 'sync' but got wrong_mode"
+        ):
             dataset_builder_image_bboxes_keypoint.build(mode="wrong_mode")
 
         with pytest.raises(
@@ -199,5 +237,8 @@ class TestDatasetBuilder:
         with pytest.raises(ValueError, match="flush_every_n_samples should be greater than 0 but got -1"):
             dataset_builder_image_bboxes_keypoint.build(flush_every_n_samples=-1)
 
+        with pytest.raises(ValueError, match="flush_memory_budget should be greater than 0 but got 0"):
+            dataset_builder_image_bboxes_keypoint.build(flush_memory_budget=0)
+
         with pytest.raises(ValueError, match="compact_every_n_transactions should be greater than 0 but got -1"):
             dataset_builder_image_bboxes_keypoint.build(compact_every_n_transactions=-1)
@@ -4,9 +4,14 @@
 # License: CECILL-C
 # =====================================
 
+import json
+import shutil
 import tempfile
 from pathlib import Path
+from unittest.mock import patch
 
+import numpy as np
+import PIL.Image
 import pytest
 
 from pixano.datasets import Dataset
@@ -17,9 +22,12 @@ from pixano.datasets.builders.folders import (
     VideoFolderBuilder,
     VQAFolderBuilder,
 )
+from pixano.datasets.builders.folders.folder_base_builder import extract_video_frames
+from pixano.datasets.builders.folders.metadata import FolderMetadataService
 from pixano.datasets.dataset_info import DatasetInfo
 from pixano.datasets.workspaces import WorkspaceType
 from pixano.features import BBox, Entity, Image, Message, Record, SequenceFrame, Video
+from pixano.schemas.annotations.compressed_rle import CompressedRLE
 from pixano.schemas.annotations.keypoints import KeyPoints
 from tests.assets.sample_data.metadata import SAMPLE_DATA_PATHS
 
@@ -139,6 +147,270 @@ class TestFolderBaseBuilder:
 
             assert dataset.open_table("entities").count_rows() == 1
 
+    def test_generate_data_stops_at_first_invalid_metadata_row(self, entity_category):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            split_dir = source_dir / "train"
+            split_dir.mkdir(parents=True, exist_ok=True)
+            (split_dir / "item_0.jpg").write_bytes(SAMPLE_DATA_PATHS["image_jpg"].read_bytes())
+            (split_dir / "metadata.jsonl").write_text(
+                '{"image":"item_0.jpg"}\n\n{"image":"missing.jpg"}\n', encoding="utf-8"
+            )
+
+            builder = ImageFolderBuilder(
+                source_dir=source_dir,
+                library_dir=Path(tmp_dir) / "library",
+                info=DatasetInfo(
+                    name="invalid_row",
+                    description="",
+                    record=Record,
+                    entity=entity_category,
+                    views={"image": Image},
+                ),
+            )
+            items = []
+            with pytest.raises(ValueError, match=r"train:3 \(missing_view_media\)"):
+                for item in builder.generate_data():
+                    items.append(item)
+
+            assert "records" in items[0]
+
+    def test_build_reads_metadata_once_and_rolls_back_invalid_rows(self, entity_category):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            split_dir = source_dir / "train"
+            split_dir.mkdir(parents=True, exist_ok=True)
+            (split_dir / "item_0.jpg").write_bytes(SAMPLE_DATA_PATHS["image_jpg"].read_bytes())
+            (split_dir / "metadata.jsonl").write_text('{"image":"item_0.jpg"}\n', encoding="utf-8")
+
+            builder = ImageFolderBuilder(
+                source_dir=source_dir,
+                library_dir=Path(tmp_dir) / "library",
+                info=DatasetInfo(
+                    name="invalid_row", description="", record=Record, entity=entity_category, views={"image": Image}
+                ),
+            )
+            iter_metadata_rows = FolderMetadataService.iter_metadata_rows
+            with patch.object(
+                FolderMetadataService, "iter_metadata_rows", autospec=True, side_effect=iter_metadata_rows
+            ) as reads:
+                assert builder.build().num_rows == 1
+            assert reads.call_count == 1
+
+            # An invalid row stops the build and leaves the library as it was
+            (split_dir / "metadata.jsonl").write_text(
+                '{"image":"item_0.jpg"}\n{"image":"missing.jpg"}\n', encoding="utf-8"
+            )
+            with pytest.raises(ValueError, match=r"train:2 \(missing_view_media\)"):
+                builder.build(mode="overwrite", flush_every_n_samples=1)
+            assert Dataset(builder.target_dir).num_rows == 1
+            assert [path.name for path in builder.target_dir.parent.iterdir()] == [builder.target_dir.name]
+
+            shutil.rmtree(builder.target_dir)
+            with pytest.raises(ValueError, match=r"train:2 \(missing_view_media\)"):
+                builder.build(mode="create", flush_every_n_samples=1)
+            assert not builder.target_dir.exists()
+
+            (split_dir / "metadata.jsonl").write_text(
+                '{"image":"item_0.jpg"}\n{"image":"item_0.jpg"}\n', encoding="utf-8"
+            )
+            builder.build(mode="create")
+            assert builder.build(mode="overwrite").num_rows == 2
+            assert [path.name for path in builder.target_dir.parent.iterdir()] == [builder.target_dir.name]
+
+    def test_build_resumes_from_checkpoint(self, entity_category):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            split_dir = source_dir / "train"
+            split_dir.mkdir(parents=True, exist_ok=True)
+            rows = []
+            for i in range(3):
+                (split_dir / f"item_{i}.jpg").write_bytes(SAMPLE_DATA_PATHS["image_jpg"].read_bytes())
+                rows.append(f'{{"image":"item_{i}.jpg","entities":[{{"category":"person"}}]}}')
+            (split_dir / "metadata.jsonl").write_text("\n".join(rows) + "\n", encoding="utf-8")
+            checkpoint_file = Path(tmp_dir) / "import.checkpoint.json"
+
+            builder = ImageFolderBuilder(
+                source_dir=source_dir,
+                library_dir=Path(tmp_dir) / "library",
+                info=DatasetInfo(
+                    name="resumable",
+                    description="",
+                    record=Record,
+                    entity=entity_category,
+                    views={"image": Image},
+                ),
+                checkpoint_file=checkpoint_file,
+            )
+            validate_batch = builder._validate_batch
+            calls = []
+
+            def fail_on_second_batch(batch, dataset):
+                calls.append(batch)
+                if len(calls) == 2:
+                    raise RuntimeError("interrupted")
+                validate_batch(batch, dataset)
+
+            builder._validate_batch = fail_on_second_batch
+            with pytest.raises(RuntimeError, match="interrupted"):
+                builder.build(mode="create", check_integrity="raise", flush_every_n_samples=1)
+            # The first batch holds part of the first row, whose record is checkpointed as partial.
+            assert set(calls[0]) == {"records"}
+            assert json.loads(checkpoint_file.read_text()) == {
+                "completed_splits": [],
+                "split": None,
+                "position": 0,
+                "partial_record_id": calls[0]["records"][0].id,
+            }
+
+            builder._validate_batch = validate_batch
+            dataset = builder.build(mode="add", check_integrity="raise", flush_every_n_samples=1)
+
+            assert dataset.num_rows == 3
+            assert dataset.open_table("images").count_rows() == 3
+            assert dataset.open_table("entities").count_rows() == 3
+            checkpoint = json.loads(checkpoint_file.read_text())
+            assert (checkpoint["split"], checkpoint["position"]) == ("train", 3)
+
+    def test_build_sync_only_imports_changes(self, entity_category):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            split_dir = source_dir / "train"
+            split_dir.mkdir(parents=True, exist_ok=True)
+            jpg_bytes = SAMPLE_DATA_PATHS["image_jpg"].read_bytes()
+
+            def write_rows(indices):
+                rows = [f'{{"image":"item_{i}.jpg","entities":[{{"category":"person"}}]}}' for i in indices]
+                (split_dir / "metadata.jsonl").write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+            def sync(target_name="synced", mode="sync"):
+                builder = ImageFolderBuilder(
+                    source_dir=source_dir,
+                    library_dir=Path(tmp_dir) / "library",
+                    info=DatasetInfo(
+                        name="synced", description="", record=Record, entity=entity_category, views={"image": Image}
+                    ),
+                    target_name=target_name,
+                )
+                return builder.build(mode=mode, check_integrity="raise", flush_every_n_samples=2)
+
+            def widths_by_record(dataset):
+                return {image.record_id: image.width for image in dataset.get_data("images", limit=100)}
+
+            for i in range(3):
+                (split_dir / f"item_{i}.jpg").write_bytes(jpg_bytes)
+            write_rows([0, 1, 2])
+
+            first = widths_by_record(sync())
+            manifest = json.loads((Path(tmp_dir) / "library" / "synced" / "sync_manifest.json").read_text())
+            assert sorted(entry["record_id"] for entry in manifest["items"].values()) == sorted(first)
+
+            assert widths_by_record(sync()) == first
+
+            # item_1 changes, item_2 is removed and item_3 is added.
+            (split_dir / "item_1.jpg").write_bytes(SAMPLE_DATA_PATHS["image_png"].read_bytes())
+            (split_dir / "item_3.jpg").write_bytes(jpg_bytes)
+            write_rows([0, 1, 3])
+            dataset = sync()
+            synced = widths_by_record(dataset)
+
+            assert dataset.num_rows == 3
+            assert dataset.open_table("entities").count_rows() == 3
+            assert sorted(synced.values()) == [586, 586, 640]
+            assert len(set(synced) & set(first)) == 1
+
+            sync(target_name="created", mode="create")
+            with pytest.raises(ValueError, match="no sync manifest"):
+                sync(target_name="created")
+
+    def test_build_sync_keeps_edited_rows_with_explicit_ids(self, entity_category):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            split_dir = source_dir / "train"
+            split_dir.mkdir(parents=True, exist_ok=True)
+            (split_dir / "item_0.jpg").write_bytes(SAMPLE_DATA_PATHS["image_jpg"].read_bytes())
+            (split_dir / "item_1.png").write_bytes(SAMPLE_DATA_PATHS["image_png"].read_bytes())
+
+            def write_rows(rec_1_image):
+                rows = [
+                    '{"id":"rec_0","image":"item_0.jpg","entities":[{"category":"person"}]}',
+                    f'{{"id":"rec_1","image":"{rec_1_image}","entities":[{{"category":"person"}}]}}',
+                ]
+                (split_dir / "metadata.jsonl").write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+            def sync():
+                builder = ImageFolderBuilder(
+                    source_dir=source_dir,
+                    library_dir=Path(tmp_dir) / "library",
+                    info=DatasetInfo(
+                        name="synced", description="", record=Record, entity=entity_category, views={"image": Image}
+                    ),
+                )
+                return builder.build(mode="sync", check_integrity="raise", flush_every_n_samples=1)
+
+            write_rows("item_0.jpg")
+            sync()
+            write_rows("item_1.png")
+            dataset = sync()
+
+            assert dataset.num_rows == 2
+            assert dataset.open_table("entities").count_rows() == 2
+            widths = {image.record_id: image.width for image in dataset.get_data("images", limit=10)}
+            assert widths == {"rec_0": 586, "rec_1": 640}
+
+            # Manifests keyed by row content are migrated without losing the record.
+            manifest_file = Path(tmp_dir) / "library" / "test_dataset" / "sync_manifest.json"
+            manifest = json.loads(manifest_file.read_text())
+            manifest["items"] = {f"{key}-legacy": item for key, item in manifest["items"].items()}
+            manifest_file.write_text(json.dumps(manifest))
+            write_rows("item_0.jpg")
+            dataset = sync()
+
+            assert dataset.num_rows == 2
+            assert dataset.open_table("entities").count_rows() == 2
+            widths = {image.record_id: image.width for image in dataset.get_data("images", limit=10)}
+            assert widths == {"rec_0": 586, "rec_1": 586}
+
+    def test_build_sync_deletes_rows_partly_written_by_an_interrupted_sync(self, entity_category):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            split_dir = source_dir / "train"
+            split_dir.mkdir(parents=True, exist_ok=True)
+            rows = []
+            for i in range(2):
+                (split_dir / f"item_{i}.jpg").write_bytes(SAMPLE_DATA_PATHS["image_jpg"].read_bytes())
+                rows.append(f'{{"image":"item_{i}.jpg","entities":[{{"category":"person"}}]}}')
+            (split_dir / "metadata.jsonl").write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+            builder = ImageFolderBuilder(
+                source_dir=source_dir,
+                library_dir=Path(tmp_dir) / "library",
+                info=DatasetInfo(
+                    name="synced", description="", record=Record, entity=entity_category, views={"image": Image}
+                ),
+            )
+            validate_batch = builder._validate_batch
+            calls = []
+
+            def fail_on_second_batch(batch, dataset):
+                calls.append(batch)
+                if len(calls) == 2:
+                    raise RuntimeError("interrupted")
+                validate_batch(batch, dataset)
+
+            builder._validate_batch = fail_on_second_batch
+            with pytest.raises(RuntimeError, match="interrupted"):
+                builder.build(mode="sync", check_integrity="raise", flush_every_n_samples=1)
+            manifest = json.loads((Path(tmp_dir) / "library" / "test_dataset" / "sync_manifest.json").read_text())
+            assert manifest == {"items": {}, "partial_record_id": calls[0]["records"][0].id}
+
+            builder._validate_batch = validate_batch
+            dataset = builder.build(mode="sync", check_integrity="raise", flush_every_n_samples=1)
+
+            assert dataset.num_rows == 2
+            assert dataset.open_table("images").count_rows() == 2
+            assert dataset.open_table("entities").count_rows() == 2
+
     def test_generate_data_maps_image_to_sequence_frame_alias(self, entity_category):
         with tempfile.TemporaryDirectory() as tmp_dir:
             source_dir = Path(tmp_dir) / "test_dataset"
@@ -162,6 +434,82 @@ class TestFolderBaseBuilder:
 
             assert dataset.open_table("sequence_frames").count_rows() == 1
 
+    @pytest.mark.parametrize("with_metadata", [True, False])
+    def test_build_extracts_video_frames(self, entity_category, with_metadata):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            split_dir = source_dir / "train"
+            split_dir.mkdir(parents=True, exist_ok=True)
+            (split_dir / "clip.mp4").write_bytes(SAMPLE_DATA_PATHS["video_mp4"].read_bytes())
+            if with_metadata:
+                (split_dir / "metadata.jsonl").write_text('{"image":"clip.mp4"}\n', encoding="utf-8")
+
+            builder = VideoFolderBuilder(
+                source_dir=source_dir,
+                library_dir=Path(tmp_dir) / "library",
+                info=DatasetInfo(
+                    name="video_frames",
+                    description="",
+                    record=Record,
+                    entity=entity_category,
+                    views={"image": SequenceFrame},
+                ),
+                frame_stride=50,
+                frame_size=(64, 48),
+                use_image_name_as_id=True,
+            )
+            builder.VIDEO_FRAME_CHUNK_SIZE = 2
+            dataset = builder.build(mode="create", check_integrity="none")
+
+            frames = sorted(dataset.get_data("sequence_frames", limit=10), key=lambda frame: frame.frame_index)
+            assert [frame.frame_index for frame in frames] == [0, 1, 2, 3, 4]
+            assert [frame.id for frame in frames] == [f"clip_{i}" for i in range(5)]
+            assert all((frame.width, frame.height) == (64, 48) for frame in frames)
+            assert frames[1].timestamp == pytest.approx(50 / 29.97 * 1000, rel=1e-3)
+            assert len({frame.record_id for frame in frames}) == 1
+
+    def test_build_matches_annotations_to_source_frames_with_stride(self, entity_category):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            source_dir = Path(tmp_dir) / "test_dataset"
+            mask_dir = source_dir / "train" / "masks"
+            mask_dir.mkdir(parents=True, exist_ok=True)
+            (source_dir / "train" / "clip.mp4").write_bytes(SAMPLE_DATA_PATHS["video_mp4"].read_bytes())
+            (source_dir / "train" / "metadata.jsonl").write_text(
+                '{"image":"clip.mp4","masks":"masks/*.png"}\n', encoding="utf-8"
+            )
+            # Annotation files name source frames: 000010 is skipped by the stride.
+            for source_frame, height in [(0, 1), (10, 2), (50, 3), (100, 4)]:
+                label = np.zeros((48, 64), dtype=np.uint8)
+                label[:height, :] = 1
+                PIL.Image.fromarray(label).save(mask_dir / f"{source_frame:06d}.png")
+
+            builder = VideoFolderBuilder(
+                source_dir=source_dir,
+                library_dir=Path(tmp_dir) / "library",
+                info=DatasetInfo(
+                    name="video_frames",
+                    description="",
+                    record=Record,
+                    entity=entity_category,
+                    mask=CompressedRLE,
+                    views={"image": SequenceFrame},
+                ),
+                frame_stride=50,
+                frame_size=(64, 48),
+            )
+            dataset = builder.build(mode="create", check_integrity="raise")
+
+            frame_indices = {frame.id: frame.frame_index for frame in dataset.get_data("sequence_frames", limit=10)}
+            areas = {frame_indices[mask.view_id]: int(mask.area) for mask in dataset.get_data("masks", limit=10)}
+            assert areas == {0: 64, 1: 3 * 64, 2: 4 * 64}
+
+    def test_extract_video_frames(self):
+        frames = list(extract_video_frames(SAMPLE_DATA_PATHS["video_mp4"], "JPEG", 85, stride=100, num_threads=2))
+        assert [index for index, _, _ in frames] == [0, 1, 2]
+        assert frames[0][2][:2] == b"\xff\xd8"
+        with pytest.raises(ValueError, match="stride should be greater than 0"):
+            list(extract_video_frames(SAMPLE_DATA_PATHS["video_mp4"], "JPEG", 85, stride=0))
+
     def test_builder_allows_image_and_sframe_different_logical_names(self):
         """Image and SequenceFrame go to separate canonical tables, so they can coexist."""
 
@@ -218,6 +566,59 @@ class TestFolderBaseBuilder:
             assert dataset.open_table("images").count_rows() == 1
             assert dataset.open_table("sequence_frames").count_rows() == 1
 
+    @pytest.mark.parametrize(
+        "pipelined,num_workers,worker_type", [(True, 1, "process"), (True, 2, "thread"), (False, 2, "thread")]
+    )
+    def test_build_pipelined_matches_serial_build(
+        self, image_folder_builder: ImageFolderBuilder, pipelined: bool, num_workers: int, worker_type: str
+    ):
+        serial = image_folder_builder.build(mode="create", check_integrity="raise", flush_every_n_samples=4)
+        pipelined_dir = Path(tempfile.mkdtemp()) / "pipelined"
+        image_folder_builder.target_dir = pipelined_dir
+        image_folder_builder.info.id = ""
+        pipelined = image_folder_builder.build(
+            mode="create",
+            check_integrity="raise",
+            flush_every_n_samples=4,
+            pipelined=pipelined,
+            num_workers=num_workers,
+            worker_type=worker_type,
+        )
+
+        def images_by_metadata(dataset: Dataset) -> dict[str, dict]:
+            metadata = {record.id: record.metadata for record in dataset.get_records(limit=100)}
+            return {
+                metadata[image.record_id]: image.model_dump(
+                    include={"width", "height", "format", "preview", "raw_bytes"}
+                )
+                for image in dataset.get_data("images", limit=100)
+            }
+
+        assert pipelined.num_rows == serial.num_rows
+        assert pipelined.open_table("bboxes").count_rows() == serial.open_table("bboxes").count_rows()
+        assert images_by_metadata(pipelined) == images_by_metadata(serial)
+
+    def test_build_content_addressed_media(self, image_folder_builder: ImageFolderBuilder):
+        builder = ImageFolderBuilder(
+            source_dir=image_folder_builder.source_dir,
+            library_dir=tempfile.mkdtemp(),
+            info=image_folder_builder.info,
+            media_storage="content_addressed",
+        )
+        dataset = builder.build(mode="create", check_integrity="raise")
+
+        images = dataset.get_data("images", limit=100, exclude_blobs=True)
+        assert len(images) == 15
+        assert all(image.raw_bytes == b"" and image.uri.startswith("blob:sha256:") for image in images)
+        assert len(list(dataset.blob_store.digests())) == 2
+        blob, _ = dataset.get_view_binary("images", images[0].id)
+        assert blob in {SAMPLE_DATA_PATHS["image_jpg"].read_bytes(), SAMPLE_DATA_PATHS["image_png"].read_bytes()}
+
+        with pytest.raises(ValueError, match="media_storage should be 'embedded' or 'content_addressed'"):
+            ImageFolderBuilder(
+                source_dir=builder.source_dir, library_dir=tempfile.mkdtemp(), info=builder.info, media_storage="s3"
+            )
+
     def test_image_video_init(self, image_folder_builder, video_folder_builder, entity_category):
         assert isinstance(image_folder_builder, ImageFolderBuilder)
         assert isinstance(video_folder_builder, VideoFolderBuilder)
@@ -8,6 +8,9 @@ import json
 import tempfile
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 from pixano.datasets.dataset import Dataset
 from pixano.datasets.exporters import COCODatasetExporter
 from pixano.datasets.exporters.coco_dataset_exporter import coco_image
@@ -70,3 +73,43 @@ class TestCOCODatasetExporter:
 
             save_json = json.load((export_dir / "split_file_1.json").open())
             assert save_json == export_data
+
+    def test_export_streams_files(self, dataset_multi_view_tracking_and_image: Dataset):
+        ds = dataset_multi_view_tracking_and_image
+        exported: dict[int | None, dict[str, list]] = {}
+        for num_workers in [None, 2]:
+            export_dir = Path(tempfile.mkdtemp()) / "export"
+            COCODatasetExporter(ds, export_dir, num_workers=num_workers).export(items_per_file=1, batch_size=1)
+
+            assert not list(export_dir.glob("*.tmp"))
+            files = sorted(export_dir.glob("*.json"))
+            assert len(files) == ds.num_rows
+            contents = [json.loads(file.read_text()) for file in files]
+            assert all(
+                list(content.keys()) == ["info", "licenses", "images", "annotations", "categories"]
+                for content in contents
+            )
+            exported[num_workers] = {
+                key: [item for content in contents for item in content[key]] for key in ["images", "annotations"]
+            }
+
+        annotations = exported[None]["annotations"]
+        assert exported[2] == exported[None]
+        assert annotations
+        assert len({annotation["id"] for annotation in annotations}) == len(annotations)
+        image_ids = {image["id"] for image in exported[None]["images"]}
+        assert {annotation["image_id"] for annotation in annotations} <= image_ids
+
+    def test_mask_geometries(self, dataset_image_bboxes_keypoint: Dataset):
+        masks = []
+        for i in range(4):
+            mask = np.zeros((10, 10), dtype=np.uint8)
+            mask[i : i + 4, 2 : 2 + 2 * i] = 1
+            masks.append(CompressedRLE.from_mask(mask, id=f"mask_{i}"))
+        exporter = COCODatasetExporter(dataset_image_bboxes_keypoint, "/", num_workers=2)
+        try:
+            assert exporter._mask_geometries(masks) == [(mask.to_polygons(), mask.area) for mask in masks]
+        finally:
+            exporter._executor.shutdown()
+        with pytest.raises(ValueError, match="num_workers should be greater than 0"):
+            COCODatasetExporter(dataset_image_bboxes_keypoint, "/", num_workers=0)
@@ -121,3 +121,21 @@ class TestDatasetExporter:
         exporter = DumbDatasetExporter(export_dir=export_dir, dataset=dataset_image_bboxes_keypoint, overwrite=False)
         with pytest.raises(FileExistsError):
             exporter.export(file_name="test_1", items_per_file=-1, batch_size=4)
+
+    def test_get_records_data(self, dataset_image_bboxes_keypoint: Dataset):
+        exporter = DumbDatasetExporter(export_dir=tempfile.mkdtemp(), dataset=dataset_image_bboxes_keypoint)
+        record_ids = dataset_image_bboxes_keypoint.get_all_ids()[::-1]
+
+        records_data = exporter._get_records_data(record_ids)
+        assert list(records_data.keys()) == record_ids
+        for record_id, record_data in records_data.items():
+            assert record_data["records"].id == record_id
+            assert set(record_data.keys()) == set(dataset_image_bboxes_keypoint.info.tables.keys())
+            for table_name, rows in record_data.items():
+                if table_name == "records" or rows is None:
+                    continue
+                assert all(row.record_id == record_id for row in rows)
+                expected = dataset_image_bboxes_keypoint.get_data(table_name, where=f"record_id = '{record_id}'")
+                assert [row.id for row in rows] == [row.id for row in expected]
+
+        assert exporter._get_records_data([]) == {}
@@ -4,10 +4,21 @@
 # License: CECILL-C
 # =====================================
 
+import hashlib
+import os
+from datetime import timedelta
 from pathlib import Path
+from unittest.mock import patch
 
+import pyarrow as pa
+import pytest
+from lancedb.pydantic import Vector
+
+import pixano.datasets.dataset as dataset_module
 from pixano.datasets.dataset import Dataset
 from pixano.datasets.dataset_info import DatasetInfo
+from pixano.datasets.utils.errors import DatasetAccessError, DatasetIntegrityError
+from pixano.features import ViewEmbedding
 from pixano.schemas import PDF, Entity, Image, Record, SequenceFrame, Text
 
 
@@ -21,6 +32,10 @@ class CustomImage(Image):
     is_group: bool = False
 
 
+class ViewEmbedding4(ViewEmbedding):
+    vector: Vector(4)  # type: ignore
+
+
 def build_dataset_info(
     *,
     entity_schema: type[Entity] = Entity,
@@ -269,3 +284,321 @@ def test_add_records_batch_persists_multiple_view_types(tmp_path: Path):
     assert dataset.open_table("texts").count_rows() == 1
     assert dataset.open_table("sequence_frames").count_rows() == 2
     assert dataset.num_rows == 2
+
+
+def test_get_data_projection_skips_blob_columns(tmp_path: Path):
+    dataset = create_dataset(tmp_path / "projection")
+    record = Record(id="record-1", split="train")
+    image = Image(
+        id="image-1",
+        record_id=record.id,
+        logical_name="front_camera",
+        raw_bytes=b"image-bytes",
+        preview=b"preview-bytes",
+        preview_format="png",
+        width=640,
+        height=480,
+        format="jpg",
+    )
+    dataset.add_records({"records": record, "images": image})
+
+    full = dataset.get_data("images", ids=image.id)
+    assert full.raw_bytes == b"image-bytes"
+    stream, _ = dataset.open_view_binary("images", image.id)
+    assert stream.read() == b"image-bytes"
+    assert full.preview == b"preview-bytes"
+
+    metadata_only = dataset.get_data("images", ids=image.id, exclude_blobs=True)
+    assert metadata_only.raw_bytes == b""
+    assert metadata_only.preview == b""
+    assert (metadata_only.width, metadata_only.height, metadata_only.preview_format) == (640, 480, "png")
+
+    listed = dataset.get_data("images", record_ids=[record.id], exclude_blobs=True)
+    assert [row.raw_bytes for row in listed] == [b""]
+
+    projected = dataset.get_data("images", limit=10, columns=["record_id", "width"])
+    assert len(projected) == 1
+    assert projected[0].id == image.id
+    assert projected[0].width == 640
+    assert projected[0].height == 0
+    assert projected[0].raw_bytes == b""
+
+
+def test_content_addressed_storage_deduplicates_view_media(tmp_path: Path):
+    info = build_dataset_info(extra_views={"frame": SequenceFrame})
+    info.storage_mode = "content_addressed"
+    dataset = Dataset.create(tmp_path / "content_addressed", info)
+    records = [Record(id=f"record-{i}", split="train") for i in range(2)]
+    images = [
+        Image(id=f"image-{i}", record_id=record.id, logical_name="image", raw_bytes=b"same-bytes", format="jpeg")
+        for i, record in enumerate(records)
+    ]
+    frames = [
+        SequenceFrame(
+            id=f"frame-{i}",
+            record_id=records[0].id,
+            logical_name="frame",
+            raw_bytes=f"frame-{i}".encode(),
+            timestamp=i / 10,
+            frame_index=i,
+        )
+        for i in range(2)
+    ]
+    dataset.add_records({"records": records, "images": images, "sequence_frames": frames})
+
+    # The given rows are left untouched
+    assert all(view.raw_bytes and view.uri == "" for view in images + frames)
+    digests = {hashlib.sha256(view.raw_bytes).hexdigest() for view in images + frames}
+    assert sorted(dataset.blob_store.digests()) == sorted(digests)
+    assert len(digests) == 3
+    stored = dataset.get_data("images", ids="image-0", exclude_blobs=True)
+    assert stored.raw_bytes == b"" and stored.uri.startswith("blob:sha256:")
+
+    assert dataset.get_data("images", ids="image-1").raw_bytes == b"same-bytes"
+    assert dataset.get_view_binary("images", "image-0") == (b"same-bytes", "jpeg")
+    assert dataset.get_temporal_view_batch("sequence_frames", records[0].id) == [
+        (0, b"frame-0", ""),
+        (1, b"frame-1", ""),
+    ]
+
+    stream, fmt = dataset.open_view_binary("images", "image-0")
+    with stream:
+        stream.seek(5)
+        assert (stream.read(), fmt) == (b"bytes", "jpeg")
+    assert dataset.open_view_binary("images", "missing") is None
+
+    dataset.delete_data("sequence_frames", ["frame-1"])
+    # Unreferenced blobs are kept during the grace period, as they may belong to rows not committed yet
+    assert dataset.prune_blob_store() == 0
+    assert dataset.prune_blob_store(older_than=timedelta(0)) == 1
+    # Storing a blob again restarts its grace period
+    pending = dataset.blob_store.path(dataset.blob_store.put(b"pending"))
+    os.utime(pending, (0, 0))
+    dataset.blob_store.put(b"pending")
+    assert dataset.prune_blob_store() == 0
+    os.utime(pending, (0, 0))
+    assert dataset.prune_blob_store() == 1
+    assert dataset.get_view_binary("images", "image-1") == (b"same-bytes", "jpeg")
+
+
+def test_iter_temporal_view_payloads_follows_frame_order(tmp_path: Path):
+    dataset = create_dataset(tmp_path / "temporal", extra_views={"frame": SequenceFrame})
+    dataset._TEMPORAL_READ_BATCH_SIZE = 2
+    record = Record(id="record-1", split="train")
+    # Timestamps decrease with the frame index, so frames are stored in reverse order
+    frames = [
+        SequenceFrame(
+            id=f"frame-{i}",
+            record_id=record.id,
+            logical_name="frame",
+            raw_bytes=f"frame-{i}".encode(),
+            timestamp=-i,
+            frame_index=i,
+        )
+        for i in range(5)
+    ]
+    dataset.add_records({"records": record, "sequence_frames": frames})
+
+    listed = dataset.get_temporal_view_frames("sequence_frames", record.id, start_frame=1, batch_size=3)
+    assert listed == [(1, "frame-1"), (2, "frame-2"), (3, "frame-3")]
+    streamed = list(dataset.iter_temporal_view_payloads("sequence_frames", listed))
+    assert [(index, data) for index, _, data, _ in streamed] == [(i, f"frame-{i}".encode()) for i in (1, 2, 3)]
+    # Frames deleted after they were listed are skipped
+    dataset.delete_data("sequence_frames", ["frame-2"])
+    streamed = list(dataset.iter_temporal_view_payloads("sequence_frames", listed))
+    assert [(index, data) for index, _, data, _ in streamed] == [(i, f"frame-{i}".encode()) for i in (1, 3)]
+    assert dataset.get_temporal_view_batch("sequence_frames", record.id, "frame", 4, 10) == [(4, b"frame-4", "")]
+    with pytest.raises(DatasetAccessError, match="not a temporal view table"):
+        dataset.get_temporal_view_frames("images", record.id)
+
+
+def test_scalar_indexes_are_maintained(tmp_path: Path):
+    dataset = create_dataset(tmp_path / "scalar-indexes")
+    images = dataset.open_table("images")
+    # Indexes are created with the first rows of a table
+    assert images.list_indices() == []
+
+    dataset._INDEX_REFRESH_ROWS = 4
+    records = [Record(id=f"record-{i}", split="train") for i in range(2)]
+    dataset.add_records({"records": records})
+    assert dataset.open_table("records").index_stats("split_idx").num_unindexed_rows == 0
+    dataset.add_data("records", [Record(id="record-2", split="test")])
+    assert dataset.open_table("records").index_stats("split_idx").num_unindexed_rows == 1
+    dataset.add_data("records", [Record(id="record-3", split="test")])
+    # Rows are folded into the indexes in the background
+    dataset_module._index_refresh_executor.submit(lambda: None).result()
+    assert dataset.open_table("records").index_stats("split_idx").num_unindexed_rows == 0
+
+    dataset.add_data("images", [Image(id="image-0", record_id="record-0", logical_name="image")])
+    assert {(index.columns[0], index.index_type) for index in images.list_indices()} == {
+        ("id", "BTree"),
+        ("record_id", "BTree"),
+        ("logical_name", "Bitmap"),
+    }
+    images.drop_index("record_id_idx")
+    assert dataset.optimize(["images"]) == {"images": ["record_id"]}
+    stats = images.index_stats("record_id_idx")
+    assert (stats.num_indexed_rows, stats.num_unindexed_rows) == (1, 0)
+    with pytest.raises(DatasetAccessError, match="not found in dataset"):
+        dataset.optimize(["unknown"])
+
+
+def test_open_table_caches_handles(tmp_path: Path):
+    dataset = create_dataset(tmp_path / "table-cache")
+    stats = dataset.table_cache_stats
+
+    table = dataset.open_table("images")
+    misses = stats.misses
+    assert dataset.open_table("images") is table
+    assert stats.misses == misses
+    assert stats.hits >= 1
+
+    # Writes from another Dataset instance are visible through the cached handle
+    Dataset(dataset.path).add_records({"records": Record(id="record-1", split="train")})
+    assert dataset.open_table("records").count_rows() == 1
+
+    # Without version directory modification times, other writes are read once the cache is invalidated
+    with patch.object(Dataset, "_table_versions_mtime", return_value=None):
+        Dataset(dataset.path).add_records({"records": Record(id="record-2", split="train")})
+        assert dataset.open_table("records").count_rows() == 1
+        dataset.invalidate_table_cache(["records"])
+        assert dataset.open_table("records").count_rows() == 2
+
+    misses = stats.misses
+    invalidations = stats.invalidations
+    dataset.invalidate_table_cache(["images"])
+    assert stats.invalidations == invalidations + 1
+    assert dataset.open_table("images") is not table
+    assert stats.misses == misses + 1
+
+
+def test_semantic_search_ranks_distinct_records(tmp_path: Path):
+    dataset = create_dataset(tmp_path / "semantic-search")
+    records = [Record(id=f"record-{i}", split="train") for i in range(300)]
+    dataset.add_records({"records": records})
+    embeddings = [
+        ViewEmbedding4(id=f"emb-{i}-{j}", record_id=record.id, vector=[float(i) + j / 10, 0.0, 0.0, 0.0])
+        for i, record in enumerate(records)
+        for j in range(3)
+    ]
+    embeddings.append(ViewEmbedding4(id="emb-diagonal", record_id="record-299", vector=[10.0, 10.0, 0.0, 0.0]))
+    dataset.info.tables["image_embedding"] = ViewEmbedding4
+    dataset.create_table("image_embedding", ViewEmbedding4, data=embeddings)
+    table = dataset.open_table("image_embedding")
+    # Text queries are embedded by the table embedding function, map them to vectors instead
+    queries = {"ten": [10.0, 0.0, 0.0, 0.0], "diagonal": [1.0, 1.0, 0.0, 0.0]}
+    search = table.search
+
+    with patch.object(table, "search", side_effect=lambda query: search(queries[query])):
+        records_page, distances, ranked_ids = dataset.semantic_search("ten", "image_embedding", limit=2, skip=1)
+        assert [record.id for record in records_page] == ["record-9", "record-11"]
+        assert distances == pytest.approx([0.64, 1.0])
+        assert ranked_ids[:5] == ["record-10", "record-9", "record-11", "record-8", "record-12"]
+        assert len(ranked_ids) < len(records)
+
+        assert dataset.semantic_search("diagonal", "image_embedding", limit=1)[2][0] == "record-1"
+        assert dataset.semantic_search("diagonal", "image_embedding", limit=1, metric="cosine")[2][0] == "record-299"
+
+        dataset.create_embedding_index("image_embedding", index_type="IVF_FLAT", metric="cosine", num_partitions=2)
+        assert [index.columns for index in table.list_indices() if index.index_type == "IvfFlat"] == [["vector"]]
+        assert Dataset(dataset.path).info.embedding_metrics == {"image_embedding": "cosine"}
+        assert dataset.semantic_search("diagonal", "image_embedding", limit=1, nprobes=2)[2][0] == "record-299"
+
+    with pytest.raises(DatasetAccessError, match="is not a view embedding table"):
+        dataset.create_embedding_index("images")
+
+
+def test_add_arrow_records_inserts_without_models(tmp_path: Path):
+    dataset = create_dataset(tmp_path / "arrow-insert", extra_views={"camera": SequenceFrame})
+    records = pa.table({"id": ["record-0", "record-1"], "split": ["train", "val"]})
+    frames = pa.table(
+        {
+            "id": ["frame-1", "frame-0"],
+            "record_id": ["record-0", "record-0"],
+            "logical_name": ["camera", "camera"],
+            "timestamp": [40.0, 0.0],
+            "frame_index": [1, 0],
+        }
+    )
+    entities = pa.RecordBatch.from_pydict({"id": ["entity-0"], "record_id": ["record-1"]})
+
+    dataset.add_arrow_records({"entities": entities, "sequence_frames": frames, "records": records})
+
+    assert dataset.num_rows == 2
+    stored_records = dataset.get_data("records", ids=["record-0", "record-1"])
+    assert {record.id: record.split for record in stored_records} == {"record-0": "train", "record-1": "val"}
+    assert all(record.status == "new" and record.created_at == record.updated_at for record in stored_records)
+    stored_frames = dataset.open_table("sequence_frames").to_arrow()
+    assert stored_frames.column("id").to_pylist()[-2:] == ["frame-0", "frame-1"]
+    assert dataset.get_data("entities", ids="entity-0").record_id == "record-1"
+
+
+def test_add_arrow_checks_integrity(tmp_path: Path):
+    dataset = create_dataset(tmp_path / "arrow-integrity")
+    dataset.add_arrow("records", pa.table({"id": ["record-0"]}))
+
+    with pytest.raises(DatasetIntegrityError, match="Invalid foreign key 'record_id'='missing'"):
+        dataset.add_arrow("entities", pa.table({"id": ["entity-0", "entity-1"], "record_id": ["record-0", "missing"]}))
+    with pytest.raises(DatasetIntegrityError, match="Duplicate id 'entity-0'"):
+        dataset.add_arrow("entities", pa.table({"id": ["entity-0", "entity-0"], "record_id": ["record-0"] * 2}))
+    assert dataset.open_table("entities").count_rows() == 0
+    with pytest.raises(DatasetIntegrityError, match="Duplicate id 'record-0'"):
+        dataset.add_arrow("records", pa.table({"id": ["record-1", "record-0"]}))
+    assert dataset.open_table("records").count_rows() == 1
+
+    with pytest.warns(UserWarning, match="Missing id in table 'entities'"):
+        dataset.add_arrow("entities", pa.table({"id": [""], "record_id": ["record-0"]}), check_integrity="warn")
+    assert dataset.open_table("entities").count_rows() == 1
+
+    with pytest.raises(DatasetAccessError, match="Unknown columns"):
+        dataset.add_arrow("records", pa.table({"id": ["record-1"], "unknown": [1]}))
+
+
+def test_cascade_delete_records_reports_per_table_counts(dataset_multi_view_tracking_and_image_copy):
+    dataset = dataset_multi_view_tracking_and_image_copy
+    dataset._DELETE_CHUNK_SIZE = 1
+    # An annotation that only references a deleted entity is deleted with it
+    bbox = dataset.get_data("bboxes", where="record_id = '1'", limit=1)[0].model_copy(deep=True)
+    bbox.id = "bbox_without_record"
+    bbox.record_id = ""
+    dataset.open_table("bboxes").add([bbox])
+    # Descendants of a deleted entity are deleted with it, with the annotations that reference them
+    parent_id = bbox.entity_id
+    for i in range(2):
+        child = dataset.get_data("entities", ids=parent_id).model_copy(deep=True)
+        child.id, child.record_id, child.parent_id = f"child_{i}", "", parent_id
+        dataset.open_table("entities").add([child])
+        parent_id = child.id
+    bbox.id, bbox.entity_id = "bbox_of_child", parent_id
+    dataset.open_table("bboxes").add([bbox])
+
+    records_version = dataset.open_table("records").version
+    counts = dataset.cascade_delete_records(["1", "2"])
+
+    # One deletion per chunk of ids
+    assert dataset.open_table("records").version == records_version + 2
+    assert counts == {
+        "records": 2,
+        "entities": 7,
+        "bboxes": 10,
+        "masks": 2,
+        "keypoints": 9,
+        "tracklets": 3,
+        "sequence_frames": 3,
+        "images": 2,
+    }
+    assert dataset.num_rows == 3
+    assert dataset.get_data("bboxes", ids="bbox_without_record") is None
+    assert dataset.open_table("entities").count_rows("id IN ('child_0', 'child_1')") == 0
+    assert dataset.open_table("bboxes").count_rows("record_id IN ('1', '2')") == 0
+
+    assert dataset.delete_records(["0", "missing"]) == ["missing"]
+    assert dataset.num_rows == 2
+    assert dataset.open_table("images").count_rows("record_id = '0'") == 0
+
+    # Counts stay exact when another write is committed between the deletions of a table
+    records = dataset.open_table("records")
+    with patch.object(Dataset, "_table_versions_mtime", return_value=None):
+        Dataset(dataset.path).open_table("records").delete("id = 'missing'")
+        assert dataset.cascade_delete_records(["3"])["records"] == 1
+    assert records.count_rows() == 1
@@ -50,6 +50,8 @@ class TestDatasetInfo:
             "message",
             "text_span",
             "views",
+            "scalar_indexes",
+            "embedding_metrics",
             "tables",
         }
 
@@ -112,7 +114,9 @@ class TestDatasetInfo:
             "base": "Image",
             "fields": {}
         }
-    }
+    },
+    "scalar_indexes": {},
+    "embedding_metrics": {}
 }"""
         )
 
@@ -279,3 +283,54 @@ class TestDatasetInfo:
     def test_rejects_tables_mapping(self):
         with pytest.raises(ValueError, match="no longer accepts a 'tables' mapping"):
             DatasetInfo(tables={"records": Record})
+
+    def test_scalar_index_columns(self):
+        info = DatasetInfo(
+            record=Record,
+            bbox=BBox,
+            views={"image": Image},
+            scalar_indexes={"bboxes": {"tracklet_id": None, "is_normalized": "BITMAP"}},
+        )
+        assert info.scalar_index_columns("records") == {"id": "BTREE", "split": "BITMAP"}
+        assert info.scalar_index_columns("images") == {
+            "id": "BTREE",
+            "record_id": "BTREE",
+            "logical_name": "BITMAP",
+        }
+        assert info.scalar_index_columns("bboxes") == {
+            "id": "BTREE",
+            "record_id": "BTREE",
+            "entity_id": "BTREE",
+            "view_id": "BTREE",
+            "frame_index": "BTREE",
+            "is_normalized": "BITMAP",
+        }
+        assert info.scalar_index_columns("unknown") == {}
+
+        with pytest.raises(ValueError, match="unknown table 'entities'"):
+            DatasetInfo(record=Record, scalar_indexes={"entities": {"id": "BTREE"}})
+        with pytest.raises(ValueError, match=r"unknown columns \['missing'\]"):
+            DatasetInfo(record=Record, scalar_indexes={"records": {"missing": "BTREE"}})
+
+    def test_from_json_reuses_schema_classes(self, tmp_path: Path):
+        class CachedRecord(Record):
+            metadata: str = ""
+
+        class OtherCachedRecord(Record):
+            metadata: str = "other"
+
+        DatasetInfo(id="first", record=CachedRecord, views={"image": Image}).to_json(tmp_path / "first.json")
+        DatasetInfo(id="second", record=CachedRecord, views={"image": Image}).to_json(tmp_path / "second.json")
+        DatasetInfo(id="third", record=OtherCachedRecord, views={"image": Image}).to_json(tmp_path / "third.json")
+
+        first = DatasetInfo.from_json(tmp_path / "first.json")
+        second = DatasetInfo.from_json(tmp_path / "second.json")
+        third = DatasetInfo.from_json(tmp_path / "third.json")
+
+        assert first.record is not CachedRecord
+        assert first.record is second.record
+        assert first.record is DatasetInfo.from_json(tmp_path / "first.json").record
+        assert isinstance(first.record(id="record"), second.record)
+        assert third.record is not first.record
+        assert third.record.model_fields["metadata"].default == "other"
+        assert first.views["image"] is Image
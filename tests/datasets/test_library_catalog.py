@@ -0,0 +1,123 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+import json
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from pixano.datasets.dataset import Dataset
+from pixano.datasets.library_catalog import LibraryCatalog
+from pixano.schemas import Record
+from tests.datasets.test_dataset import build_dataset_info
+
+
+def create_dataset(library_dir: Path, name: str, id: str) -> Dataset:
+    info = build_dataset_info()
+    info.id = id
+    info.name = name
+    return Dataset.create(library_dir / name, info)
+
+
+def test_refresh_writes_catalog(tmp_path: Path):
+    create_dataset(tmp_path, "first", "id-1")
+    assert not (tmp_path / LibraryCatalog._CATALOG_FILE).exists()
+
+    LibraryCatalog(tmp_path).refresh()
+
+    content = json.loads((tmp_path / LibraryCatalog._CATALOG_FILE).read_text(encoding="utf-8"))
+    entry = content["entries"]["first"]
+    assert entry["id"] == "id-1"
+    assert entry["name"] == "first"
+    assert entry["workspace"] == "undefined"
+    assert entry["info"]["id"] == "id-1"
+    assert "preview" not in entry and "preview" not in entry["info"]
+    assert entry["num_rows"]["records"] == 0
+    assert set(entry["num_rows"]) == set(entry["versions"]) == {"records", "entities", "images"}
+    assert not (tmp_path / LibraryCatalog._PREVIEWS_FILE).exists()
+
+
+def test_refresh_tracks_library_changes(tmp_path: Path):
+    dataset = create_dataset(tmp_path, "first", "id-1")
+    create_dataset(tmp_path, "second", "id-2")
+    (tmp_path / "not_a_dataset").mkdir()
+
+    entries = LibraryCatalog(tmp_path).refresh()
+    assert [(entry.id, entry.path, entry.num_records) for entry in entries] == [
+        ("id-1", "first", 0),
+        ("id-2", "second", 0),
+    ]
+
+    version = entries[0].versions["records"]
+    dataset.add_records({"records": [Record(id="record-1"), Record(id="record-2")]})
+    shutil.rmtree(tmp_path / "second")
+
+    entries = LibraryCatalog(tmp_path).refresh()
+    assert [(entry.id, entry.num_records) for entry in entries] == [("id-1", 2)]
+    assert entries[0].versions["records"] > version
+
+
+def test_refresh_reuses_unchanged_entries(tmp_path: Path):
+    create_dataset(tmp_path, "first", "id-1")
+    catalog = LibraryCatalog(tmp_path)
+    catalog.refresh()
+
+    with patch.object(LibraryCatalog, "_compute_entry") as compute_entry:
+        entries = LibraryCatalog(tmp_path).refresh()
+    compute_entry.assert_not_called()
+    assert [entry.id for entry in entries] == ["id-1"]
+
+
+def test_refresh_uses_table_versions_without_mtimes(tmp_path: Path):
+    dataset = create_dataset(tmp_path, "first", "id-1")
+    with patch("pixano.datasets.library_catalog._mtime", return_value=None):
+        assert LibraryCatalog(tmp_path).refresh()[0].num_records == 0
+        dataset.add_records({"records": Record(id="record-1")})
+        assert LibraryCatalog(tmp_path).refresh()[0].num_records == 1
+
+
+def test_entry_to_dataset_info(tmp_path: Path):
+    dataset = create_dataset(tmp_path, "first", "id-1")
+
+    info = LibraryCatalog(tmp_path).refresh()[0].to_dataset_info()
+
+    assert info.id == "id-1"
+    assert info.record is dataset.info.record
+    assert info.views == dataset.info.views
+
+
+def test_previews(tmp_path: Path):
+    create_dataset(tmp_path, "first", "id-1")
+    catalog = LibraryCatalog(tmp_path)
+    entries = catalog.refresh()
+
+    with patch("pixano.datasets.library_catalog.DatasetInfo.load_preview", return_value="preview") as load_preview:
+        assert catalog.previews(entries) == {"first": "preview"}
+        assert catalog.previews(entries) == {"first": "preview"}
+    load_preview.assert_called_once()
+    assert "first" in json.loads((tmp_path / LibraryCatalog._PREVIEWS_FILE).read_text(encoding="utf-8"))
+
+
+def test_find(tmp_path: Path):
+    create_dataset(tmp_path, "first", "id-1")
+    create_dataset(tmp_path, "second", "id-2")
+
+    assert LibraryCatalog(tmp_path).find("id-2").path == "second"
+    with patch.object(LibraryCatalog, "save") as save:
+        assert LibraryCatalog(tmp_path).find("id-1").path == "first"
+    save.assert_not_called()
+    assert Dataset.find("id-1", tmp_path).path == tmp_path / "first"
+    with pytest.raises(FileNotFoundError, match="No dataset found with ID unknown"):
+        Dataset.find("unknown", tmp_path)
+
+
+def test_invalid_catalog_is_rebuilt(tmp_path: Path):
+    create_dataset(tmp_path, "first", "id-1")
+    (tmp_path / LibraryCatalog._CATALOG_FILE).write_text("{", encoding="utf-8")
+
+    assert [entry.id for entry in LibraryCatalog(tmp_path).refresh()] == ["id-1"]
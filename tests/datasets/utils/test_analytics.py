@@ -0,0 +1,121 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from pixano.datasets import Dataset, DatasetInfo
+from pixano.datasets.utils import analytics
+from pixano.datasets.utils.analytics import (
+    compute_pairwise_iou,
+    compute_shape_histograms,
+    flag_duplicates,
+    load_annotation_geometry,
+)
+from pixano.schemas import BBox, CompressedRLE, Image, Record
+
+
+def _bbox(id: str, view_id: str, coords: list[float], confidence: float, format: str = "xywh") -> BBox:
+    return BBox(
+        id=id,
+        record_id="record",
+        view_id=view_id,
+        coords=coords,
+        format=format,
+        is_normalized=False,
+        confidence=confidence,
+    )
+
+
+def _mask(id: str, rows: slice, cols: slice) -> CompressedRLE:
+    mask = np.zeros((10, 10), dtype=np.uint8)
+    mask[rows, cols] = 1
+    return CompressedRLE.from_mask(mask, id=id, record_id="record", view_id="image-0")
+
+
+@pytest.fixture
+def analytics_dataset(tmp_path: Path) -> Dataset:
+    info = DatasetInfo(record=Record, views={"image": Image}, bbox=BBox, mask=CompressedRLE)
+    dataset = Dataset.create(tmp_path / "analytics", info)
+    images = [Image(id=f"image-{i}", record_id="record", logical_name="image") for i in range(2)]
+    dataset.add_records({"records": Record(id="record"), "images": images})
+    bboxes = [
+        _bbox("a", "image-0", [0, 0, 10, 10], 0.9),
+        _bbox("b", "image-0", [1, 1, 11, 11], 0.8, format="xyxy"),
+        _bbox("c", "image-0", [2, 2, 10, 10], 0.95),
+        _bbox("d", "image-0", [50, 50, 10, 20], 0.5),
+        _bbox("e", "image-1", [0, 0, 10, 10], 0.5),
+    ]
+    masks = [
+        _mask("m0", slice(0, 5), slice(0, 5)),
+        _mask("m1", slice(0, 5), slice(1, 6)),
+        _mask("m2", slice(5, 10), slice(5, 10)),
+    ]
+    dataset.add_records({"bboxes": bboxes, "masks": masks}, check_integrity="none")
+    return dataset
+
+
+def test_load_annotation_geometry(analytics_dataset: Dataset):
+    boxes = load_annotation_geometry(analytics_dataset, "bboxes", where="view_id = 'image-0'")
+    assert boxes["id"].to_list() == ["a", "b", "c", "d"]
+    assert boxes.select("x0", "y0", "x1", "y1").row(1) == (1.0, 1.0, 11.0, 11.0)
+    assert boxes["area"].to_list() == [100.0, 100.0, 100.0, 200.0]
+
+    masks = load_annotation_geometry(analytics_dataset, "masks")
+    assert masks.select("x0", "y0", "x1", "y1", "area").row(1) == (1.0, 0.0, 6.0, 5.0, 25.0)
+
+    with pytest.raises(ValueError, match="should be a bounding box or mask table"):
+        load_annotation_geometry(analytics_dataset, "images")
+    with pytest.raises(ValueError, match="Unknown table"):
+        load_annotation_geometry(analytics_dataset, "unknown")
+
+
+def test_compute_pairwise_iou(analytics_dataset: Dataset, monkeypatch: pytest.MonkeyPatch):
+    pairs = compute_pairwise_iou(analytics_dataset, "bboxes")
+    assert pairs.select("view_id", "id", "other_id").rows() == [
+        ("image-0", "a", "b"),
+        ("image-0", "a", "c"),
+        ("image-0", "b", "c"),
+    ]
+    assert pairs["iou"].to_list() == pytest.approx([81 / 119, 64 / 136, 81 / 119])
+
+    # Chunking does not split frames
+    monkeypatch.setattr(analytics, "_PAIR_CHUNK_ROWS", 1)
+    assert compute_pairwise_iou(analytics_dataset, "bboxes", min_iou=0.5)["other_id"].to_list() == ["b", "c"]
+
+    masks = compute_pairwise_iou(analytics_dataset, "masks")
+    assert masks.select("id", "other_id").rows() == [("m0", "m1")]
+    assert masks["iou"].to_list() == pytest.approx([20 / 30])
+
+
+def test_flag_duplicates(analytics_dataset: Dataset):
+    duplicates = flag_duplicates(analytics_dataset, "bboxes", iou_threshold=0.6)
+    assert duplicates.rows() == [("a", ""), ("b", "c"), ("c", ""), ("d", ""), ("e", "")]
+    assert flag_duplicates(analytics_dataset, "bboxes", iou_threshold=0.4)["duplicate_of"].to_list() == [
+        "c",
+        "c",
+        "",
+        "",
+        "",
+    ]
+    assert flag_duplicates(analytics_dataset, "masks", iou_threshold=0.5).rows() == [
+        ("m0", ""),
+        ("m1", "m0"),
+        ("m2", ""),
+    ]
+
+
+def test_compute_shape_histograms(analytics_dataset: Dataset):
+    histograms = compute_shape_histograms(analytics_dataset, "bboxes", area_bins=[0, 150, 250], aspect_ratio_bins=2)
+    assert histograms.num_rows == 5
+    assert histograms.area_counts == [4, 1]
+    assert histograms.aspect_ratio_edges == [0.5, 0.75, 1.0]
+    assert histograms.aspect_ratio_counts == [1, 4]
+
+    histograms = compute_shape_histograms(analytics_dataset, "masks", area_bins=1)
+    assert (histograms.area_edges, histograms.area_counts) == ([24.5, 25.5], [3])
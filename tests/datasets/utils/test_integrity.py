@@ -8,6 +8,7 @@ from pixano.datasets.utils.integrity import (
     IntegrityCheck,
     check_dataset_integrity,
     check_table_integrity,
+    compute_integrity_report,
     get_integry_checks_from_schemas,
 )
 
@@ -67,3 +68,35 @@ def test_check_dataset_integrity_reports_invalid_rows(dataset_multi_view_trackin
 
     errors = check_dataset_integrity(dataset_multi_view_tracking_and_image_copy)
     assert (IntegrityCheck.FK_ID, "bboxes", "entity_id", "corrupt_bbox", "missing_entity") in errors
+
+
+def test_compute_integrity_report_counts_errors_per_table(dataset_multi_view_tracking_and_image_copy):
+    dataset = dataset_multi_view_tracking_and_image_copy
+    reports = compute_integrity_report(dataset)
+    assert set(reports) == set(dataset.info.tables)
+    assert all(report.is_valid for report in reports.values())
+    assert reports["bboxes"].num_rows == dataset.open_table("bboxes").count_rows()
+
+    bbox = dataset.get_data("bboxes", limit=1)[0].model_copy(deep=True)
+    duplicate = bbox.model_copy(deep=True)
+    bbox.entity_id = "missing_entity"
+    duplicate.record_id = "missing_record"
+    dataset.open_table("bboxes").add([bbox, duplicate])
+    dataset.open_table("records").add([dataset.info.tables["records"](id="empty_record", split="train")])
+
+    reports = compute_integrity_report(dataset, ["records", "bboxes"])
+    assert set(reports) == {"records", "bboxes"}
+    report = reports["bboxes"]
+    assert report.duplicate_ids == [bbox.id]
+    assert report.invalid_foreign_keys == {
+        "entity_id": [(bbox.id, "missing_entity")],
+        "record_id": [(bbox.id, "missing_record")],
+    }
+    assert report.error_count == 3
+    assert reports["records"].orphan_ids == ["empty_record"]
+    assert reports["records"].is_valid
+
+    assert check_table_integrity("bboxes", dataset, ignore_checks=[IntegrityCheck.UNIQUE_ID]) == [
+        (IntegrityCheck.FK_ID, "bboxes", "record_id", bbox.id, "missing_record"),
+        (IntegrityCheck.FK_ID, "bboxes", "entity_id", bbox.id, "missing_entity"),
+    ]
@@ -85,6 +85,29 @@ class TestCompressedRLE:
 
         assert area == expected_area
 
+    def test_batch_metrics(self):
+        first = np.zeros((6, 4), dtype=np.uint8)
+        first[:3, :2] = 1
+        second = np.zeros((6, 4), dtype=np.uint8)
+        second[3:, 1:] = 1
+        masks = [CompressedRLE.from_mask(first), CompressedRLE.from_mask(second)]
+
+        assert CompressedRLE.batch_area(masks).tolist() == [mask.area for mask in masks]
+        assert CompressedRLE.batch_bbox(masks).tolist() == [[0, 0, 2, 3], [1, 3, 3, 3]]
+        assert CompressedRLE.batch_iou(masks, masks).tolist() == [[1.0, 0.0], [0.0, 1.0]]
+        assert CompressedRLE.batch_to_urle(masks) == [mask.to_urle() for mask in masks]
+
+    def test_from_label_image(self):
+        labels = np.zeros((5, 5), dtype=np.uint8)
+        labels[1:3, 1:3] = 4
+        labels[4, :] = 9
+        rles = CompressedRLE.from_label_image(labels, record_id="record")
+
+        assert list(rles) == [4, 9]
+        for label, rle in rles.items():
+            assert rle.record_id == "record"
+            assert rle.to_mask().tolist() == (labels == label).astype(np.uint8).tolist()
+
     def test_encode(self):
         mask = np.ndarray((10, 10), dtype=bool).tolist()
         rle = CompressedRLE.encode(mask, 10, 10)
@@ -23,6 +23,7 @@ from pixano.features.utils.image import (
     get_image_thumbnail,
     image_to_base64,
     image_to_binary,
+    label_image_to_rles,
     mask_to_polygons,
     mask_to_rle,
     polygons_to_rle,
@@ -67,6 +68,23 @@ def test_image_to_binary():
     assert isinstance(binary, bytes)
 
 
+def test_label_image_to_rles():
+    labels = np.zeros((6, 5), dtype=np.uint8)
+    labels[1:3, 1:4] = 3
+    labels[4:, 0] = 7
+    labels[5, 4] = 7
+
+    rles = label_image_to_rles(labels)
+    assert list(rles) == [3, 7]
+    for obj_id, rle in rles.items():
+        assert rle == mask_to_rle((labels == obj_id).astype(np.uint8))
+
+    assert label_image_to_rles(np.zeros((4, 4), dtype=np.uint8)) == {}
+    assert label_image_to_rles(np.repeat(labels[:, :, None], 3, axis=2)) == rles
+    with pytest.raises(ValueError):
+        label_image_to_rles(np.zeros((2, 2, 3, 1), dtype=np.uint8))
+
+
 @pytest.mark.skip("Not implemented")
 def test_mask_to_polygons():
     pass
@@ -87,14 +105,25 @@ def test_rle_to_mask():
     pass
 
 
-@pytest.mark.skip("Not implemented")
 def test_rle_to_polygons():
-    pass
+    mask = np.zeros((20, 10), dtype=np.uint8)
+    mask[12:16, 4:8] = 1
+
+    polygons, _ = mask_to_polygons(mask)
+    expected = [[x / 10 if i % 2 == 0 else x / 20 for i, x in enumerate(polygon)] for polygon in polygons]
+    assert rle_to_polygons(mask_to_rle(mask)) == expected
+    assert rle_to_polygons(mask_to_rle(np.zeros((20, 10), dtype=np.uint8))) == []
 
 
-@pytest.mark.skip("Not implemented")
 def test_rle_to_urle():
-    pass
+    mask = np.zeros((4, 3), dtype=np.uint8)
+    mask[:2, 0] = 1
+    mask[1:, 2] = 1
+
+    urle = rle_to_urle(mask_to_rle(mask))
+    assert urle == {"counts": [0, 2, 7, 3], "size": [4, 3]}
+    assert rle_to_mask(urle_to_rle(urle)).tolist() == mask.tolist()
+    assert rle_to_urle(urle) == urle
 
 
 @pytest.mark.skip("Not implemented")
@@ -0,0 +1,57 @@
+# =====================================
+# Copyright: CEA-LIST/DIASI/SIALV/LVA
+# Author : pixano@cea.fr
+# License: CECILL-C
+# =====================================
+
+from itertools import groupby
+
+import numpy as np
+import pytest
+
+from pixano.features.utils.image import mask_to_rle
+from pixano.features.utils.rle import decode_rle_counts, encode_rle_counts, rles_area, rles_bbox, rles_iou
+
+
+def _dense_counts(mask: np.ndarray) -> list[int]:
+    flat = mask.ravel(order="F")
+    counts = [len(list(run)) for _, run in groupby(flat)]
+    return [0, *counts] if flat[0] else counts
+
+
+def test_rle_counts_round_trip():
+    rng = np.random.default_rng(0)
+    masks = [np.zeros((7, 5), dtype=np.uint8), np.ones((7, 5), dtype=np.uint8)]
+    masks += [(rng.random((h, w)) < 0.3).astype(np.uint8) for h, w in [(1, 1), (13, 9), (40, 61)]]
+    large = np.zeros((600, 500), dtype=np.uint8)
+    large[100:500, 3:497] = 1
+    masks.append(large)
+
+    for mask in masks:
+        counts = mask_to_rle(mask)["counts"]
+        assert decode_rle_counts(counts).tolist() == _dense_counts(mask)
+        assert decode_rle_counts(counts.decode()).tolist() == _dense_counts(mask)
+        assert encode_rle_counts(_dense_counts(mask)) == counts
+
+    assert decode_rle_counts(b"").tolist() == []
+    assert encode_rle_counts([]) == b""
+    with pytest.raises(ValueError, match="truncated count"):
+        decode_rle_counts(b"P")
+
+
+def test_rles_batch_metrics():
+    first = np.zeros((10, 8), dtype=np.uint8)
+    first[2:6, 1:5] = 1
+    second = np.zeros((10, 8), dtype=np.uint8)
+    second[4:8, 3:7] = 1
+    rles = [mask_to_rle(first), mask_to_rle(second), mask_to_rle(np.zeros((10, 8), dtype=np.uint8))]
+
+    assert rles_area(rles).tolist() == [16.0, 16.0, 0.0]
+    assert rles_bbox(rles).tolist() == [[1, 2, 4, 4], [3, 4, 4, 4], [0, 0, 0, 0]]
+    assert rles_bbox(rles[:1], normalized=True).tolist() == [[1 / 8, 2 / 10, 4 / 8, 4 / 10]]
+    assert rles_iou(rles[:2], rles) == pytest.approx(np.array([[1.0, 4 / 28, 0.0], [4 / 28, 1.0, 0.0]]))
+    assert rles_area([]).shape == (0,)
+    assert rles_bbox([]).shape == (0, 4)
+    assert rles_iou([], rles).shape == (0, 3)
+    with pytest.raises(ValueError, match="same size"):
+        rles_iou(rles[:1], [mask_to_rle(np.zeros((3, 3), dtype=np.uint8))])
@@ -19,7 +19,6 @@ from pixano.inference.provider import InferenceProvider
 from tests.assets.sample_data.metadata import ASSETS_DIRECTORY
 
 
-LIBRARY_DIR = ASSETS_DIRECTORY / "library"
 MEDIA_DIR = ASSETS_DIRECTORY / "sample_data"
 
 
@@ -30,7 +29,7 @@ def app_and_settings(
     simple_inference_provider: InferenceProvider,
 ) -> tuple[FastAPI, Settings]:  # args to ensure the fixture is called before the app fixture
     settings = Settings(
-        library_dir=str(LIBRARY_DIR),
+        library_dir=str(dataset_image_bboxes_keypoint.path.parent),
         media_dir=str(MEDIA_DIR),
         inference_providers={"mock-provider": simple_inference_provider},
         default_inference_provider="mock-provider",
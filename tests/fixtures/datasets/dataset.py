@@ -18,7 +18,6 @@ from pixano.features import BBox, Entity, Image, Message, Record
 from pixano.schemas.annotations.compressed_rle import CompressedRLE
 from pixano.schemas.annotations.keypoints import KeyPoints
 from pixano.schemas.annotations.tracklet import Tracklet
-from tests.assets.sample_data.metadata import ASSETS_DIRECTORY
 from tests.fixtures.datasets.builders.builder import (
     DatasetBuilderImageBboxesKeypoint,
     DatasetBuilderMultiViewTrackingAndImage,
@@ -27,11 +26,13 @@ from tests.fixtures.datasets.builders.builder import (
 from tests.fixtures.datasets.dataset_info import RecordWithCategories, RecordWithMetadata
 
 
-LIBRARY_DIR = ASSETS_DIRECTORY / "library"
+@pytest.fixture(scope="session")
+def library_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    return tmp_path_factory.mktemp("library")
 
 
 @pytest.fixture(scope="session")
-def dataset_image_bboxes_keypoint() -> Dataset:
+def dataset_image_bboxes_keypoint(library_dir: Path) -> Dataset:
     info = DatasetInfo(
         id="dataset_image_bboxes_keypoint",
         name="dataset_image_bboxes_keypoint",
@@ -44,13 +45,13 @@ def dataset_image_bboxes_keypoint() -> Dataset:
     )
     builder = DatasetBuilderImageBboxesKeypoint(
         info=info,
-        target_dir=LIBRARY_DIR / "dataset_image_bboxes_keypoint",
+        target_dir=library_dir / "dataset_image_bboxes_keypoint",
     )
     return builder.build(mode="overwrite", check_integrity="none")
 
 
 @pytest.fixture(scope="session")
-def dataset_vqa() -> Dataset:
+def dataset_vqa(library_dir: Path) -> Dataset:
     info = DatasetInfo(
         id="dataset_vqa",
         name="dataset_vqa",
@@ -62,7 +63,7 @@ def dataset_vqa() -> Dataset:
     )
     builder = DatasetBuilderVQA(
         info=info,
-        target_dir=LIBRARY_DIR / "dataset_vqa",
+        target_dir=library_dir / "dataset_vqa",
     )
     return builder.build(mode="overwrite", check_integrity="none")
 
@@ -73,6 +74,7 @@ def dataset_multi_view_tracking_and_image(
     entity_category,
     bbox_difficult,
     view_embedding_8,
+    library_dir: Path,
 ) -> Dataset:
     info = DatasetInfo(
         id="dataset_multi_view_tracking_and_image",
@@ -92,14 +94,14 @@ def dataset_multi_view_tracking_and_image(
     )
     builder = DatasetBuilderMultiViewTrackingAndImage(
         info=info,
-        target_dir=LIBRARY_DIR / "dataset_multi_view_tracking_and_image",
+        target_dir=library_dir / "dataset_multi_view_tracking_and_image",
     )
     return builder.build(mode="overwrite", check_integrity="none")
 
 
-def copy_dataset(dataset_id: str) -> Dataset:
+def copy_dataset(source: Dataset) -> Dataset:
     new_id = shortuuid.uuid()
-    source = Dataset.find(dataset_id, LIBRARY_DIR)
+    dataset_id = source.info.id
     temp_folder = Path(tempfile.mkdtemp()) / dataset_id
     shutil.copytree(source.path, temp_folder)
     dataset = Dataset(temp_folder)
@@ -110,14 +112,14 @@ def copy_dataset(dataset_id: str) -> Dataset:
 
 @pytest.fixture(scope="function")
 def dataset_image_bboxes_keypoint_copy(dataset_image_bboxes_keypoint: Dataset) -> Dataset:
-    return copy_dataset("dataset_image_bboxes_keypoint")
+    return copy_dataset(dataset_image_bboxes_keypoint)
 
 
 @pytest.fixture(scope="function")
 def dataset_multi_view_tracking_and_image_copy(dataset_multi_view_tracking_and_image: Dataset) -> Dataset:
-    return copy_dataset("dataset_multi_view_tracking_and_image")
+    return copy_dataset(dataset_multi_view_tracking_and_image)
 
 
 @pytest.fixture(scope="function")
 def dataset_vqa_copy(dataset_vqa: Dataset) -> Dataset:
-    return copy_dataset("dataset_vqa")
+    return copy_dataset(dataset_vqa)